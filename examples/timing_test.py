@@ -1,6 +1,6 @@
 import time
 
-from FuzzyMath import FuzzyNumberFactory
+from FuzzyMath import FuzzyNumberFactory, FuzzyNumberFloatFactory, LazyFuzzyNumber
 
 time_start = time.time()
 fns = []
@@ -19,3 +19,31 @@ for fn in fns:
 
 print(time.time() - time_start)
 print(result)
+
+time_start = time.time()
+
+result_lazy = LazyFuzzyNumber(FuzzyNumberFactory.crisp_number(0))
+
+for fn in fns:
+    result_lazy = result_lazy + fn
+
+print(time.time() - time_start)
+print(result_lazy.evaluate())
+
+time_start = time.time()
+fns_float = []
+
+for i in range(1_000_000):
+    fns_float.append(FuzzyNumberFloatFactory.triangular(i - 1, i, i + 1, 10))
+
+print(time.time() - time_start)
+
+time_start = time.time()
+
+result_float = FuzzyNumberFloatFactory.crisp_number(0)
+
+for fn_float in fns_float:
+    result_float = result_float + fn_float
+
+print(time.time() - time_start)
+print(result_float)
@@ -4,14 +4,24 @@ Python package `FuzzyMath` is a small lightweight library for Python (version >=
 Interval and Fuzzy Arithmetic.
 """
 
-from .class_factories import FuzzyNumberFactory, IntervalFactory
+from .class_alpha_grid import AlphaGrid
+from .class_binary_codec import BinaryRecordReader, BinaryRecordWriter, PayloadType, RecordType
+from .class_factories import FuzzyNumberFactory, FuzzyNumberFloatFactory, IntervalFactory
 from .class_fuzzy_number import AlphaCutSide, FuzzyNumber
+from .class_fuzzy_number_array import FuzzyNumberArray
+from .class_fuzzy_number_float import FuzzyNumberFloat
 from .class_interval import Interval
+from .class_interval_array import IntervalArray
+from .class_lazy_fuzzy_number import LazyFuzzyNumber
 from .class_membership_operations import FuzzyAnd, FuzzyOr, PossibilisticAnd, PossibilisticOr
 from .class_memberships import FuzzyMembership, PossibilisticMembership
-from .class_precision import FuzzyMathPrecision, FuzzyMathPrecisionContext
+from .class_piecewise_linear import PiecewiseLinear
+from .class_precision import FuzzyMathPrecision, FuzzyMathPrecisionContext, PrecisionSettings
 from .fuzzynumber_comparisons import (
+    Comparison,
+    compare,
     exceedance,
+    exceedance_matrix,
     necessity_exceedance,
     necessity_strict_exceedance,
     necessity_strict_undervaluation,
@@ -21,6 +31,12 @@ from .fuzzynumber_comparisons import (
     possibility_strict_undervaluation,
     possibility_undervaluation,
     strict_exceedance,
+    strict_exceedance_matrix,
     strict_undervaluation,
+    strict_undervaluation_matrix,
     undervaluation,
+    undervaluation_matrix,
 )
+from .fuzzynumber_functions import apply_function_multivariate
+from .fuzzynumber_parallel import parallel_apply_function, parallel_map, parallel_reduce
+from .fuzzynumber_reductions import fprod, fsum
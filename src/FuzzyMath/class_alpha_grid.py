@@ -0,0 +1,175 @@
+"""Class AlphaGrid"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from decimal import MAX_PREC, Context, Decimal
+from typing import Dict, Iterable, Optional, Tuple
+
+from .class_precision import FuzzyMathPrecision
+
+_EXACT_CONTEXT = Context(prec=MAX_PREC)
+
+
+class AlphaGrid(tuple):
+    """
+    Immutable sorted sequence of alpha levels (`Decimal`s) that can be shared by many fuzzy numbers. Grids created by
+    `AlphaGrid.intern()`, `AlphaGrid.uniform()` and `AlphaGrid.merge()` are interned, so fuzzy numbers on the same
+    grid share one object and the grids can be compared by identity. Compares equal to `list` or `tuple` with the same
+    values.
+
+    ...
+
+    Attributes
+    ----------
+    _interned: OrderedDict
+        Class wide registry of interned grids, bounded by `_interned_size`.
+
+    _interned_lock: threading.Lock
+        Lock guarding `_interned`, which is shared by all threads.
+
+    _uniform: Dict[Tuple[int, Optional[Decimal]], AlphaGrid]
+        Class wide registry of uniform grids by number of alpha levels and alpha precision.
+    """
+
+    __slots__ = ()
+
+    _interned: "OrderedDict[Tuple[Decimal, ...], AlphaGrid]" = OrderedDict()
+    _interned_size: int = 1024
+
+    _interned_lock = threading.Lock()
+
+    _uniform: Dict[Tuple[int, Optional[Decimal]], AlphaGrid] = {}
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, list):
+            other = tuple(other)
+        return tuple.__eq__(self, other)
+
+    def __ne__(self, other) -> bool:
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    __hash__ = tuple.__hash__
+
+    def __repr__(self) -> str:
+        return f"AlphaGrid({list(self)})"
+
+    @classmethod
+    def intern(cls, alphas: Iterable[Decimal]) -> AlphaGrid:
+        """
+        Returns shared grid for given alphas. The alphas must already be sorted, unique and valid `Decimal`s. The alphas
+        are normalized, so the grid does not depend on their representation (`Decimal("0.50")` becomes
+        `Decimal("0.5")`).
+
+        Parameters
+        ----------
+        alphas: Iterable[Decimal]
+
+        Returns
+        -------
+        AlphaGrid
+        """
+        if isinstance(alphas, AlphaGrid):
+            return alphas
+
+        key = tuple(alpha.normalize(_EXACT_CONTEXT) for alpha in alphas)
+
+        with cls._interned_lock:
+            grid = cls._interned.get(key)
+
+            if grid is None:
+                grid = cls(key)
+                cls._interned[key] = grid
+
+                if len(cls._interned) > cls._interned_size:
+                    cls._interned.popitem(last=False)
+
+        return grid
+
+    @classmethod
+    def uniform(cls, number_of_parts: int) -> AlphaGrid:
+        """
+        Returns shared grid of evenly spaced alpha values from 0 to 1, respecting current alpha precision.
+
+        Parameters
+        ----------
+        number_of_parts: int
+            Number of alpha levels.
+
+        Returns
+        -------
+        AlphaGrid
+        """
+        if not isinstance(number_of_parts, int) or number_of_parts <= 1:
+            raise ValueError(
+                "`number_of_cuts` has to be integer and higher than 1. "
+                f"It is of type `{type(number_of_parts).__name__}` and value `{number_of_parts}`."
+            )
+
+        key = (number_of_parts, FuzzyMathPrecision.current().alpha_precision)
+
+        grid = cls._uniform.get(key)
+
+        if grid is None:
+            divisor = Decimal(number_of_parts) - Decimal(1)
+
+            values = [FuzzyMathPrecision.prepare_alpha(Decimal(i) / divisor) for i in range(number_of_parts)]
+
+            if len(values) != len(set(values)):
+                raise ValueError(
+                    f"Alpha precision is too low to create {number_of_parts} unique alpha values. "
+                    "Values in `alphas` are not unique."
+                )
+
+            grid = cls.intern(values)
+            cls._uniform[key] = grid
+
+        return grid
+
+    @classmethod
+    def merge(cls, grid1: AlphaGrid, grid2: AlphaGrid) -> AlphaGrid:
+        """
+        Merges two grids into one grid with distinct alpha values. Identical grids are returned without any work,
+        otherwise the grids are merged linearly as two sorted sequences.
+
+        Parameters
+        ----------
+        grid1: AlphaGrid
+        grid2: AlphaGrid
+
+        Returns
+        -------
+        AlphaGrid
+        """
+        if grid1 is grid2 or grid1 == grid2:
+            return grid1
+
+        merged = []
+
+        i = 0
+        j = 0
+        length1 = len(grid1)
+        length2 = len(grid2)
+
+        while i < length1 and j < length2:
+            alpha1 = grid1[i]
+            alpha2 = grid2[j]
+
+            if alpha1 < alpha2:
+                merged.append(alpha1)
+                i += 1
+            elif alpha2 < alpha1:
+                merged.append(alpha2)
+                j += 1
+            else:
+                merged.append(alpha1)
+                i += 1
+                j += 1
+
+        merged.extend(grid1[i:])
+        merged.extend(grid2[j:])
+
+        return cls.intern(merged)
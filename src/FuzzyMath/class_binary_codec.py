@@ -0,0 +1,448 @@
+"""Classes for binary serialization of Intervals and FuzzyNumbers"""
+from __future__ import annotations
+
+import math
+import struct
+from decimal import Decimal, InvalidOperation
+from enum import IntEnum
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Sequence, Union
+
+from .class_alpha_grid import AlphaGrid
+from .class_fuzzy_number import FuzzyNumber
+from .class_interval import Interval
+
+MAGIC = b"FZMB"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sBBBxI")
+_LENGTH = struct.Struct("<I")
+_VALUE_LENGTH = struct.Struct("<H")
+
+
+class RecordType(IntEnum):
+    """Type of records stored in binary stream."""
+
+    INTERVAL = 0
+    FUZZY_NUMBER = 1
+
+
+class PayloadType(IntEnum):
+    """Encoding of values in records. `DECIMAL` is lossless, `FLOAT64` is compact and fast."""
+
+    DECIMAL = 0
+    FLOAT64 = 1
+
+
+class BinaryRecordWriter:
+    """
+    Streaming writer of `Interval`s or `FuzzyNumber`s into binary stream.
+
+    The stream starts with header (magic bytes, version, record type, payload type and alpha grid shared by all fuzzy
+    numbers, alphas are always stored as decimal strings). Every record is prefixed by its length in bytes. The record
+    contains minimum and maximum of every alpha cut (one alpha cut for `Interval`), either as length prefixed decimal
+    strings or as float64 values.
+
+    ...
+
+    Attributes
+    ----------
+    _stream: BinaryIO
+        Stream to write into.
+
+    _record_type: RecordType
+
+    _payload_type: PayloadType
+
+    _alphas: Optional[AlphaGrid]
+        Alpha grid of all fuzzy numbers.
+
+    _resample: bool
+        Are fuzzy numbers with different alpha levels interpolated onto `_alphas`? Only if the alphas were specified
+        explicitly, otherwise such fuzzy numbers cannot be written.
+
+    _header_written: bool
+    """
+
+    __slots__ = ("_stream", "_record_type", "_payload_type", "_alphas", "_resample", "_header_written")
+
+    def __init__(
+        self,
+        stream: BinaryIO,
+        record_type: RecordType = RecordType.FUZZY_NUMBER,
+        payload_type: PayloadType = PayloadType.DECIMAL,
+        alphas: Optional[Sequence[Union[str, int, float, Decimal]]] = None,
+    ):
+        """
+        Creates writer. Header is written with first record (or on `close()`), if `alphas` are not specified the alpha
+        levels of the first fuzzy number are used.
+
+        Parameters
+        ----------
+        stream: BinaryIO
+            Binary stream opened for writing.
+
+        record_type: RecordType
+            Type of records. Default `RecordType.FUZZY_NUMBER`.
+
+        payload_type: PayloadType
+            Encoding of values. Default `PayloadType.DECIMAL`.
+
+        alphas: Optional[Sequence[Union[str, int, float, Decimal]]]
+            Alpha levels shared by all fuzzy numbers. Fuzzy numbers with different alpha levels are interpolated onto
+            them. If not specified, all fuzzy numbers must have the same alpha levels as the first one.
+        """
+        self._stream = stream
+        self._record_type = RecordType(record_type)
+        self._payload_type = PayloadType(payload_type)
+        self._header_written = False
+
+        self._alphas: Optional[AlphaGrid] = None
+        self._resample = alphas is not None
+
+        if alphas is not None:
+            if self._record_type == RecordType.INTERVAL:
+                raise ValueError("`alphas` can only be specified for records of type `RecordType.FUZZY_NUMBER`.")
+
+            values = sorted({FuzzyNumber._validate_alpha(alpha) for alpha in alphas})  # pylint: disable=W0212
+
+            if not values or values[0] != 0 or values[-1] != 1:
+                raise ValueError("`alphas` must contain both 0 and 1 alpha value.")
+
+            self._alphas = AlphaGrid.intern(values)
+
+    def __enter__(self) -> BinaryRecordWriter:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _write_header(self) -> None:
+        alphas = self._alphas if self._alphas is not None else []
+
+        self._stream.write(_HEADER.pack(MAGIC, VERSION, self._record_type, self._payload_type, len(alphas)))
+        self._stream.write(_encode_decimals(alphas))
+
+        self._header_written = True
+
+    def write(self, value: Union[Interval, FuzzyNumber]) -> None:
+        """
+        Writes single record.
+
+        Parameters
+        ----------
+        value: Union[Interval, FuzzyNumber]
+            `Interval` or `FuzzyNumber`, according to record type of this writer.
+
+        Raises
+        -------
+        TypeError
+            If `value` does not match record type of this writer.
+        ValueError
+            If alpha levels of fuzzy number differ from the first one and `alphas` were not specified.
+        """
+        if self._record_type == RecordType.INTERVAL:
+            if not isinstance(value, Interval):
+                raise TypeError(f"Only `Interval` can be written. It is `{type(value).__name__}`.")
+
+            values = [value.min, value.max]
+
+        else:
+            if not isinstance(value, FuzzyNumber):
+                raise TypeError(f"Only `FuzzyNumber` can be written. It is `{type(value).__name__}`.")
+
+            if self._alphas is None:
+                self._alphas = value.alpha_levels
+
+            elif not self._resample and value.alpha_levels != self._alphas:
+                raise ValueError(
+                    "All fuzzy numbers must have the same alpha levels as the first one, unless `alphas` are specified. "
+                    f"Expected {list(self._alphas)}, got {list(value.alpha_levels)}."
+                )
+
+            values = []
+            for alpha_cut in value._alpha_cuts_on_grid(self._alphas):  # pylint: disable=W0212
+                values.append(alpha_cut.min)
+                values.append(alpha_cut.max)
+
+        if not self._header_written:
+            self._write_header()
+
+        if self._payload_type == PayloadType.DECIMAL:
+            body = _encode_decimals(values)
+        else:
+            body = struct.pack(f"<{len(values)}d", *values)
+
+        self._stream.write(_LENGTH.pack(len(body)))
+        self._stream.write(body)
+
+    def write_many(self, values: Iterable[Union[Interval, FuzzyNumber]]) -> None:
+        """
+        Writes all records from `values`.
+
+        Parameters
+        ----------
+        values: Iterable[Union[Interval, FuzzyNumber]]
+        """
+        for value in values:
+            self.write(value)
+
+    def close(self) -> None:
+        """
+        Writes header, if no record was written. Does not close the underlying stream.
+        """
+        if not self._header_written:
+            self._write_header()
+
+
+class BinaryRecordReader:
+    """
+    Streaming reader of binary stream created by `BinaryRecordWriter`. Iterating over the reader yields the records.
+
+    ...
+
+    Attributes
+    ----------
+    _stream: BinaryIO
+        Stream to read from.
+
+    _record_type: RecordType
+
+    _payload_type: PayloadType
+
+    _alphas: AlphaGrid
+        Alpha grid of all fuzzy numbers.
+    """
+
+    __slots__ = ("_stream", "_record_type", "_payload_type", "_alphas")
+
+    def __init__(self, stream: BinaryIO):
+        """
+        Creates reader and reads header of the stream.
+
+        Parameters
+        ----------
+        stream: BinaryIO
+            Binary stream opened for reading.
+
+        Raises
+        -------
+        ValueError
+            If the stream does not start with valid header.
+        """
+        self._stream = stream
+
+        header = stream.read(_HEADER.size)
+
+        if len(header) != _HEADER.size:
+            raise ValueError("Stream is too short to contain header.")
+
+        magic, version, record_type, payload_type, number_alphas = _HEADER.unpack(header)
+
+        if magic != MAGIC:
+            raise ValueError("Stream does not contain FuzzyMath binary records.")
+
+        if version != VERSION:
+            raise ValueError(f"Unsupported version `{version}` of FuzzyMath binary records.")
+
+        self._record_type = RecordType(record_type)
+        self._payload_type = PayloadType(payload_type)
+
+        alphas = []
+        for _ in range(number_alphas):
+            (length,) = _VALUE_LENGTH.unpack(self._read_exactly(_VALUE_LENGTH.size))
+            alphas.append(_decode_decimal(self._read_exactly(length)))
+
+        if alphas:
+            if self._record_type == RecordType.INTERVAL:
+                raise ValueError("Stream of `Interval` records must not contain alpha levels.")
+
+            _check_alphas(alphas)
+
+        self._alphas = AlphaGrid.intern(alphas)
+
+    @property
+    def record_type(self) -> RecordType:
+        """
+        Type of records in the stream.
+
+        Returns
+        -------
+        RecordType
+        """
+        return self._record_type
+
+    @property
+    def payload_type(self) -> PayloadType:
+        """
+        Encoding of values in the stream.
+
+        Returns
+        -------
+        PayloadType
+        """
+        return self._payload_type
+
+    @property
+    def alpha_levels(self) -> AlphaGrid:
+        """
+        Alpha levels of all fuzzy numbers in the stream. Empty for streams of `Interval`s.
+
+        Returns
+        -------
+        AlphaGrid
+        """
+        return self._alphas
+
+    def _read_exactly(self, size: int) -> bytes:
+        data = self._stream.read(size)
+
+        if len(data) != size:
+            raise ValueError("Unexpected end of stream.")
+
+        return data
+
+    def read(self) -> Optional[Union[Interval, FuzzyNumber]]:
+        """
+        Reads next record.
+
+        Returns
+        -------
+        Optional[Union[Interval, FuzzyNumber]]
+            Next record or `None` at the end of stream.
+
+        Raises
+        -------
+        ValueError
+            If the stream ends unexpectedly or the record does not contain valid nested alpha cuts.
+        """
+        length = self._stream.read(_LENGTH.size)
+
+        if not length:
+            return None
+
+        if len(length) != _LENGTH.size:
+            raise ValueError("Unexpected end of stream.")
+
+        body = self._read_exactly(_LENGTH.unpack(length)[0])
+
+        values: Sequence[Union[Decimal, float]]
+
+        if self._payload_type == PayloadType.DECIMAL:
+            values = _decode_decimals(body)
+        else:
+            if len(body) % 8:
+                raise ValueError(f"Record of float64 values has invalid length {len(body)}.")
+
+            values = struct.unpack(f"<{len(body) // 8}d", body)
+
+        if self._record_type == RecordType.FUZZY_NUMBER and not self._alphas:
+            raise ValueError("Stream without alpha levels cannot contain `FuzzyNumber` records.")
+
+        expected = 2 if self._record_type == RecordType.INTERVAL else 2 * len(self._alphas)
+
+        if len(values) != expected:
+            raise ValueError(f"Record contains {len(values)} values, but {expected} values are expected.")
+
+        _check_bounds(values)
+
+        if self._payload_type == PayloadType.DECIMAL:
+            intervals = [
+                Interval._from_ordered(values[i], values[i + 1])  # pylint: disable=W0212
+                for i in range(0, len(values), 2)
+            ]
+        else:
+            intervals = [Interval(values[i], values[i + 1]) for i in range(0, len(values), 2)]
+
+        if self._record_type == RecordType.INTERVAL:
+            return intervals[0]
+
+        return FuzzyNumber._from_trusted(self._alphas, intervals)  # pylint: disable=W0212
+
+    def __iter__(self) -> Iterator[Union[Interval, FuzzyNumber]]:
+        while True:
+            record = self.read()
+
+            if record is None:
+                return
+
+            yield record
+
+
+def _check_bounds(values: Sequence[Union[Decimal, float]]) -> None:
+    """
+    Validates values read from stream, which cannot be trusted. Every pair of values has to be ordered minimum and
+    maximum (or both NaN for empty interval) and consecutive pairs, alpha cuts of fuzzy number, have to be nested.
+    """
+    previous_minimum = None
+    previous_maximum = None
+
+    for i in range(0, len(values), 2):
+        minimum = values[i]
+        maximum = values[i + 1]
+
+        if math.isnan(minimum) and math.isnan(maximum):
+            previous_minimum = None
+            previous_maximum = None
+            continue
+
+        if math.isnan(minimum) or math.isnan(maximum) or minimum > maximum:
+            raise ValueError(f"Record contains invalid interval with minimum `{minimum}` and maximum `{maximum}`.")
+
+        if previous_minimum is not None and (minimum < previous_minimum or previous_maximum < maximum):
+            raise ValueError(
+                f"Record contains alpha cut [{minimum}, {maximum}] that is not nested in alpha cut on lower alpha "
+                f"level [{previous_minimum}, {previous_maximum}]."
+            )
+
+        previous_minimum = minimum
+        previous_maximum = maximum
+
+
+def _encode_decimals(values: Iterable[Decimal]) -> bytes:
+    parts = []
+
+    for value in values:
+        text = str(value).encode("ascii")
+        parts.append(_VALUE_LENGTH.pack(len(text)))
+        parts.append(text)
+
+    return b"".join(parts)
+
+
+def _decode_decimals(body: bytes) -> List[Decimal]:
+    values = []
+
+    position = 0
+    while position < len(body):
+        if position + _VALUE_LENGTH.size > len(body):
+            raise ValueError("Record is truncated, it ends inside length of value.")
+
+        (length,) = _VALUE_LENGTH.unpack_from(body, position)
+        position += _VALUE_LENGTH.size
+
+        if position + length > len(body):
+            raise ValueError(f"Record is truncated, value of length {length} exceeds the record.")
+
+        values.append(_decode_decimal(body[position : position + length]))
+        position += length
+
+    return values
+
+
+def _decode_decimal(data: bytes) -> Decimal:
+    try:
+        return Decimal(data.decode("ascii"))
+    except (UnicodeDecodeError, InvalidOperation) as e:
+        raise ValueError(f"Cannot decode value `{data!r}` as decimal number.") from e
+
+
+def _check_alphas(alphas: List[Decimal]) -> None:
+    """
+    Validates alpha levels read from stream header. They have to be finite, unique, sorted and start with 0 and end
+    with 1.
+    """
+    if not all(alpha.is_finite() for alpha in alphas) or alphas[0] != 0 or alphas[-1] != 1:
+        raise ValueError("Alpha levels in stream header must start with 0 alpha value and end with 1 alpha value.")
+
+    if any(low >= high for low, high in zip(alphas, alphas[1:])):
+        raise ValueError("Alpha levels in stream header must be unique and sorted in ascending order.")
@@ -2,11 +2,20 @@
 import re
 from abc import ABC
 from decimal import Decimal, InvalidOperation
-from typing import List, Optional, Union
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
 
+import numpy as np
+
+from .class_alpha_grid import AlphaGrid
 from .class_fuzzy_number import FuzzyNumber
+from .class_fuzzy_number_float import FuzzyNumberFloat
 from .class_interval import Interval
 
+_NUMBER = r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?|[-+]?(?:Infinity|NaN)"
+
+RE_NUMBER = re.compile(_NUMBER)
+RE_ALPHA_CUT = re.compile(r"\(([^()]*)\)")
+
 
 class FactoryBase(ABC):
     """Base class for factories"""
@@ -31,6 +40,40 @@ class FactoryBase(ABC):
             raise InvalidOperation(f"Cannot convert `{variable_name}` value ({variable}) to number.") from e
         return var
 
+    @staticmethod
+    def _parse_many(
+        lines: Iterable[str], parse, errors: Optional[List[Tuple[int, str, Exception]]]
+    ) -> Iterator[Union[Interval, FuzzyNumber]]:
+        """Parses every non empty line by `parse` function.
+
+        Args:
+            lines (Iterable[str]): lines to parse.
+            parse (Callable): function parsing single line.
+            errors (Optional[List[Tuple[int, str, Exception]]]): list to collect errors into.
+
+        Raises:
+            ValueError: if line cannot be parsed and `errors` is None.
+
+        Yields:
+            Union[Interval, FuzzyNumber]
+        """
+        for line_number, line in enumerate(lines, start=1):
+            line = line.strip()
+
+            if not line:
+                continue
+
+            try:
+                value = parse(line)
+            except (ValueError, InvalidOperation) as err:
+                if errors is None:
+                    raise ValueError(f"Cannot parse line {line_number} `{line}`: {err}") from err
+
+                errors.append((line_number, line, err))
+                continue
+
+            yield value
+
     @staticmethod
     def validate_alphas(alphas: List[Union[str, int, float, Decimal]], variable_name: str = "alphas") -> List[Decimal]:
         """Validate that all alphas are valid alpha values and converts them to Decimals.
@@ -99,16 +142,16 @@ class FuzzyNumberFactory(FactoryBase):
             )
 
         if number_of_cuts is None or number_of_cuts <= 2:
-            return FuzzyNumber(
-                alphas=[Decimal(0), Decimal(1)],
-                alpha_cuts=[
+            return FuzzyNumber._from_trusted(  # pylint: disable=W0212
+                AlphaGrid.uniform(2),
+                [
                     IntervalFactory.infimum_supremum(minimum, maximum),
                     IntervalFactory.infimum_supremum(kernel, kernel),
                 ],
             )
 
         else:
-            alphas = FuzzyNumber.get_alpha_cut_values(number_of_cuts)
+            alphas = AlphaGrid.uniform(number_of_cuts)
 
             intervals = [IntervalFactory.empty()] * len(alphas)
 
@@ -124,7 +167,7 @@ class FuzzyNumberFactory(FactoryBase):
                     intervals[i] = IntervalFactory.infimum_supremum(int_min, int_max)
                 i += 1
 
-            return FuzzyNumber(alphas=alphas, alpha_cuts=intervals)
+            return FuzzyNumber._from_trusted(alphas, intervals)  # pylint: disable=W0212
 
     @staticmethod
     def trapezoidal(
@@ -173,16 +216,16 @@ class FuzzyNumberFactory(FactoryBase):
             )
 
         if number_of_cuts is None or number_of_cuts <= 2:
-            return FuzzyNumber(
-                alphas=[Decimal(0), Decimal(1)],
-                alpha_cuts=[
+            return FuzzyNumber._from_trusted(  # pylint: disable=W0212
+                AlphaGrid.uniform(2),
+                [
                     IntervalFactory.infimum_supremum(minimum, maximum),
                     IntervalFactory.infimum_supremum(kernel_minimum, kernel_maximum),
                 ],
             )
 
         else:
-            alphas = FuzzyNumber.get_alpha_cut_values(number_of_cuts)
+            alphas = AlphaGrid.uniform(number_of_cuts)
 
             intervals = [IntervalFactory.empty()] * len(alphas)
 
@@ -198,7 +241,7 @@ class FuzzyNumberFactory(FactoryBase):
                     intervals[i] = IntervalFactory.infimum_supremum(int_min, int_max)
                 i += 1
 
-            return FuzzyNumber(alphas=alphas, alpha_cuts=intervals)
+            return FuzzyNumber._from_trusted(alphas, intervals)  # pylint: disable=W0212
 
     @staticmethod
     def crisp_number(value: Union[str, int, float, Decimal]) -> FuzzyNumber:
@@ -217,9 +260,9 @@ class FuzzyNumberFactory(FactoryBase):
 
         value = FuzzyNumberFactory.validate_variable(value, "value")
 
-        return FuzzyNumber(
-            alphas=[Decimal(0), Decimal(1)],
-            alpha_cuts=[IntervalFactory.infimum_supremum(value, value), IntervalFactory.infimum_supremum(value, value)],
+        return FuzzyNumber._from_trusted(  # pylint: disable=W0212
+            AlphaGrid.uniform(2),
+            [IntervalFactory.infimum_supremum(value, value), IntervalFactory.infimum_supremum(value, value)],
         )
 
     @staticmethod
@@ -237,10 +280,7 @@ class FuzzyNumberFactory(FactoryBase):
         FuzzyNumber
         """
 
-        re_a_cuts = re.compile(r"([0-9\.;,]+)")
-        re_numbers = re.compile(r"[0-9\.]+")
-
-        elements = re_a_cuts.findall(string)
+        elements = RE_ALPHA_CUT.findall(string)
 
         alphas: List[Decimal] = [Decimal(0)] * len(elements)
         alpha_cuts: List[Interval] = [IntervalFactory.empty()] * len(elements)
@@ -248,7 +288,7 @@ class FuzzyNumberFactory(FactoryBase):
         i: int = 0
 
         for a_cut_def in elements:
-            numbers = re_numbers.findall(a_cut_def)
+            numbers = RE_NUMBER.findall(a_cut_def)
 
             if len(numbers) != 3:
                 raise ValueError(
@@ -263,7 +303,7 @@ class FuzzyNumberFactory(FactoryBase):
             except ValueError as err:
                 raise ValueError(f"`{a_cut_def}` element of Fuzzy Number is incorrectly defined.") from err
 
-            alphas[i] = Decimal(numbers[0])
+            alphas[i] = numbers[0]
 
             try:
                 alpha_cuts[i] = IntervalFactory.infimum_supremum(numbers[1], numbers[2])
@@ -274,6 +314,155 @@ class FuzzyNumberFactory(FactoryBase):
 
         return FuzzyNumber(alphas, alpha_cuts)
 
+    @staticmethod
+    def parse_many(
+        lines: Iterable[str], errors: Optional[List[Tuple[int, str, Exception]]] = None
+    ) -> Iterator[FuzzyNumber]:
+        """
+        Lazily parses `FuzzyNumber`s from lines (e.g. opened text file), one `FuzzyNumber` per line. Empty lines are
+        skipped. The result can be passed directly into `FuzzyNumberArray.from_fuzzy_numbers()`.
+
+        Parameters
+        ----------
+        lines: Iterable[str]
+
+        errors: Optional[List[Tuple[int, str, Exception]]]
+            If provided, lines that cannot be parsed are skipped and reported into this list as tuple of line number
+            (starting from 1), line and the error. Otherwise the first such line raises `ValueError`.
+
+        Returns
+        -------
+        Iterator[FuzzyNumber]
+        """
+        return FactoryBase._parse_many(lines, FuzzyNumberFactory.parse_string, errors)  # type: ignore [return-value]
+
+
+class FuzzyNumberFloatFactory(FactoryBase):
+    """
+    Class that supports creation of float array backed fuzzy numbers (`FuzzyNumberFloat`). All the functions are
+    static.
+    """
+
+    @staticmethod
+    def alpha_cut_values(number_of_cuts: Optional[int] = None) -> np.ndarray:
+        """
+        Returns evenly spaced alpha cut values from 0 to 1.
+
+        Parameters
+        ----------
+        number_of_cuts: int
+            Number of alpha cuts. Values `None` or lower than 2 mean only alphas 0 and 1.
+
+        Returns
+        -------
+        np.ndarray
+        """
+        if number_of_cuts is None or number_of_cuts <= 2:
+            number_of_cuts = 2
+
+        return np.arange(number_of_cuts, dtype=np.float64) / (number_of_cuts - 1)
+
+    @staticmethod
+    def triangular(
+        minimum: Union[str, int, float, Decimal],
+        kernel: Union[str, int, float, Decimal],
+        maximum: Union[str, int, float, Decimal],
+        number_of_cuts: Optional[int] = None,
+    ) -> FuzzyNumberFloat:
+        """
+        Creates triangular `FuzzyNumberFloat` based on input parameters.
+
+        Parameters
+        ----------
+        minimum: Union[str, int, float, Decimal]
+            Minimal value of fuzzy number.
+
+        kernel: Union[str, int, float, Decimal]
+            Kernel (midpoint) value of fuzzy number.
+
+        maximum: Union[str, int, float, Decimal]
+            Maximal value of fuzzy number.
+
+        number_of_cuts: int
+            Number of alpha cuts.
+
+        Returns
+        -------
+        FuzzyNumberFloat
+        """
+        return FuzzyNumberFloatFactory.trapezoidal(minimum, kernel, kernel, maximum, number_of_cuts)
+
+    @staticmethod
+    def trapezoidal(
+        minimum: Union[str, int, float, Decimal],
+        kernel_minimum: Union[str, int, float, Decimal],
+        kernel_maximum: Union[str, int, float, Decimal],
+        maximum: Union[str, int, float, Decimal],
+        number_of_cuts: Optional[int] = None,
+    ) -> FuzzyNumberFloat:
+        """
+        Creates trapezoidal `FuzzyNumberFloat` based on input parameters.
+
+        Parameters
+        ----------
+        minimum: Union[str, int, float, Decimal]
+            Minimal value of fuzzy number.
+
+        kernel_minimum: Union[str, int, float, Decimal]
+            Minimum kernel value of fuzzy number.
+
+        kernel_maximum: Union[str, int, float, Decimal]
+            Maximal kernel value of fuzzy number.
+
+        maximum: Union[str, int, float, Decimal]
+            Maximal value of fuzzy number.
+
+        number_of_cuts: int
+            Number of alpha cuts.
+
+        Returns
+        -------
+        FuzzyNumberFloat
+        """
+        minimum = float(FuzzyNumberFloatFactory.validate_variable(minimum, "minimum"))
+        kernel_minimum = float(FuzzyNumberFloatFactory.validate_variable(kernel_minimum, "kernel_minimum"))
+        kernel_maximum = float(FuzzyNumberFloatFactory.validate_variable(kernel_maximum, "kernel_maximum"))
+        maximum = float(FuzzyNumberFloatFactory.validate_variable(maximum, "maximum"))
+
+        if not minimum <= kernel_minimum <= kernel_maximum <= maximum:
+            raise ValueError(
+                "The fuzzy number is invalid. The structure needs to be "
+                "`minimum` <= `kernel_minimum` <= `kernel_maximum` <= `maximum`. "
+                f"Currently it is `{minimum}` <= `{kernel_minimum}` <= `{kernel_maximum}` <= `{maximum}`"
+                ", which does not hold."
+            )
+
+        alphas = FuzzyNumberFloatFactory.alpha_cut_values(number_of_cuts)
+
+        mins = minimum + (kernel_minimum - minimum) * alphas
+        maxs = maximum - (maximum - kernel_maximum) * alphas
+
+        mins[-1] = kernel_minimum
+        maxs[-1] = kernel_maximum
+
+        return FuzzyNumberFloat._from_arrays(alphas, mins, maxs)  # pylint: disable=W0212
+
+    @staticmethod
+    def crisp_number(value: Union[str, int, float, Decimal]) -> FuzzyNumberFloat:
+        """
+        Creates crisp `FuzzyNumberFloat` based on input parameters.
+
+        Parameters
+        ----------
+        value: Union[str, int, float, Decimal]
+            Value fuzzy number.
+
+        Returns
+        -------
+        FuzzyNumberFloat
+        """
+        return FuzzyNumberFloatFactory.trapezoidal(value, value, value, value)
+
 
 class IntervalFactory:
     """
@@ -289,7 +478,7 @@ class IntervalFactory:
         -------
         Interval
         """
-        return Interval(Decimal("nan"), Decimal("nan"))
+        return Interval._from_ordered(Decimal("nan"), Decimal("nan"))  # pylint: disable=W0212
 
     @staticmethod
     def infimum_supremum(
@@ -323,7 +512,7 @@ class IntervalFactory:
                 f" `maximum`. Currently it is `{minimum}` <= `{maximum}`, which does not hold."
             )
 
-        return Interval(minimum, maximum)
+        return Interval._from_ordered(minimum, maximum)  # pylint: disable=W0212
 
     @staticmethod
     def two_values(a: Union[str, int, float, Decimal], b: Union[str, int, float, Decimal]) -> Interval:
@@ -374,7 +563,7 @@ class IntervalFactory:
         a = midpoint - (width / Decimal(2))
         b = midpoint + (width / Decimal(2))
 
-        return Interval(a, b)
+        return Interval._from_ordered(a, b)  # pylint: disable=W0212
 
     @staticmethod
     def parse_string(string: str) -> Interval:
@@ -391,9 +580,7 @@ class IntervalFactory:
         Interval
         """
 
-        re_values = re.compile(r"\d+\.?\d*")
-
-        numbers = re_values.findall(string)
+        numbers = RE_NUMBER.findall(string)
 
         if len(numbers) != 2:
             raise ValueError(
@@ -402,3 +589,24 @@ class IntervalFactory:
             )
 
         return Interval(numbers[0], numbers[1])
+
+    @staticmethod
+    def parse_many(
+        lines: Iterable[str], errors: Optional[List[Tuple[int, str, Exception]]] = None
+    ) -> Iterator[Interval]:
+        """
+        Lazily parses `Interval`s from lines (e.g. opened text file), one `Interval` per line. Empty lines are skipped.
+
+        Parameters
+        ----------
+        lines: Iterable[str]
+
+        errors: Optional[List[Tuple[int, str, Exception]]]
+            If provided, lines that cannot be parsed are skipped and reported into this list as tuple of line number
+            (starting from 1), line and the error. Otherwise the first such line raises `ValueError`.
+
+        Returns
+        -------
+        Iterator[Interval]
+        """
+        return FactoryBase._parse_many(lines, IntervalFactory.parse_string, errors)  # type: ignore [return-value]
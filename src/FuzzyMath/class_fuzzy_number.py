@@ -1,14 +1,20 @@
 """Fuzzy number class"""
 from __future__ import annotations
 
-from bisect import bisect_left
-from decimal import Decimal, InvalidOperation
+import math
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from decimal import Decimal, InvalidOperation, localcontext
 from enum import Enum, auto
 from types import BuiltinFunctionType, FunctionType
-from typing import Callable, List, Sequence, Tuple, Union
+from typing import Callable, List, Optional, Sequence, Union
 
+import numpy as np
+
+from .class_alpha_grid import AlphaGrid
 from .class_interval import Interval
 from .class_memberships import FuzzyMembership, PossibilisticMembership
+from .class_piecewise_linear import PiecewiseLinear
 from .class_precision import FuzzyMathPrecision
 
 
@@ -28,11 +34,29 @@ class FuzzyNumber:
     _alpha_cuts: List[Interval]
         List of Intervals representing alpha cuts.
 
-    _alphas: Sequence[Union[Decimal, float, str, int]]
-        List of alpha values.
+    _alphas: AlphaGrid
+        Sorted alpha values. Interned, so fuzzy numbers with same alpha levels share one grid.
+
+    _piecewise_linear: Optional[Tuple[Tuple, PiecewiseLinear]]
+        Lazily compiled piecewise linear form, together with precision and rounding of the decimal context it was
+        compiled in.
+
+    _alpha_cut_cache: Optional[OrderedDict]
+        Lazily created cache of interpolated alpha cuts, bounded by `_alpha_cut_cache_size`. The least recently used
+        alpha cuts are evicted first.
+
+    _debug_validation: bool
+        Class wide switch. If `True` fuzzy numbers created by internal operations are fully validated as well.
+
+    _alpha_cut_cache_size: int
+        Class wide maximal number of interpolated alpha cuts cached per fuzzy number.
     """
 
-    __slots__ = ("_alpha_cuts", "_alphas")
+    __slots__ = ("_alpha_cuts", "_alphas", "_piecewise_linear", "_alpha_cut_cache")
+
+    _debug_validation: bool = False
+
+    _alpha_cut_cache_size: int = 256
 
     def __init__(self, alphas: Sequence[Union[Decimal, float, str, int]], alpha_cuts: List[Interval]):
         """
@@ -46,6 +70,9 @@ class FuzzyNumber:
         alpha_cuts: List[Interval]
         """
 
+        if isinstance(alphas, AlphaGrid):
+            alphas = list(alphas)
+
         if not isinstance(alphas, List):
             raise TypeError(f"`alphas` must be a list. It is `{type(alphas).__name__}`.")
 
@@ -71,8 +98,11 @@ class FuzzyNumber:
             if not isinstance(alpha_cut, Interval):
                 raise TypeError("All elements of `alpha_cuts` must be Interval.")
 
-        self._alpha_cuts = dict(zip(alphas, alpha_cuts))
-        self._alphas = sorted(self._alpha_cuts.keys())
+        alpha_cuts_dict = dict(zip(alphas, alpha_cuts))
+        self._alphas = AlphaGrid.intern(sorted(alpha_cuts_dict.keys()))
+        self._alpha_cuts = {alpha: alpha_cuts_dict[alpha] for alpha in self._alphas}
+        self._piecewise_linear = None
+        self._alpha_cut_cache = None
 
         previous_interval: Interval = Interval(float("nan"), float("nan"))
 
@@ -92,14 +122,57 @@ class FuzzyNumber:
                 f"This does not hold for {self._alphas[0]} and {self._alphas[-1]}."
             )
 
+    @classmethod
+    def _from_trusted(cls, alphas: Union[AlphaGrid, List[Decimal]], alpha_cuts: List[Interval]) -> FuzzyNumber:
+        """
+        Trusted creator used by internal operations and factories. Skips all the validation done in `__init__`, so the
+        caller has to guarantee that `alphas` is sorted list of unique `Decimal` values from range [0, 1] that contains
+        both 0 and 1 and that `alpha_cuts` are nested `Interval`s. If debug validation is turned on (see
+        `FuzzyNumber.set_debug_validation()`), full validation is performed anyway. Lists of alphas are interned as
+        `AlphaGrid`.
+
+        Parameters
+        ----------
+        alphas: Union[AlphaGrid, List[Decimal]]
+        alpha_cuts: List[Interval]
+
+        Returns
+        -------
+        FuzzyNumber
+        """
+        if cls._debug_validation:
+            return cls(list(alphas), alpha_cuts)
+
+        fuzzy_number = cls.__new__(cls)
+        fuzzy_number._alpha_cuts = dict(zip(alphas, alpha_cuts))  # pylint: disable=W0212
+        fuzzy_number._alphas = AlphaGrid.intern(alphas)  # pylint: disable=W0212
+        fuzzy_number._piecewise_linear = None  # pylint: disable=W0212
+        fuzzy_number._alpha_cut_cache = None  # pylint: disable=W0212
+        return fuzzy_number
+
+    @staticmethod
+    def set_debug_validation() -> None:
+        """
+        Turn on full validation of fuzzy numbers created by internal operations and factories. Useful for debugging,
+        slows down the calculations significantly.
+        """
+        FuzzyNumber._debug_validation = True
+
+    @staticmethod
+    def unset_debug_validation() -> None:
+        """
+        Turn off full validation of fuzzy numbers created by internal operations and factories (default).
+        """
+        FuzzyNumber._debug_validation = False
+
     @property
-    def alpha_levels(self) -> List[Decimal]:
+    def alpha_levels(self) -> AlphaGrid:
         """
-        Alpha levels for this fuzzy number.
+        Alpha levels for this fuzzy number. Immutable and shared among fuzzy numbers with same alpha levels.
 
         Returns
         -------
-        List[Decimal]
+        AlphaGrid
         """
         return self._alphas
 
@@ -185,10 +258,12 @@ class FuzzyNumber:
 
         alpha = self._validate_alpha(alpha)
 
-        if alpha in self.alpha_levels:
-            return self._alpha_cuts.get(alpha)  # type: ignore [return-value]
-        else:
-            return self._calculate_alpha_cut(alpha)
+        alpha_cut = self._alpha_cuts.get(alpha)
+
+        if alpha_cut is None:
+            alpha_cut = self._calculate_alpha_cut(alpha)
+
+        return alpha_cut
 
     @staticmethod
     def _validate_alpha(alpha: Union[str, int, float, Decimal]) -> Decimal:
@@ -226,9 +301,36 @@ class FuzzyNumber:
 
         return alpha
 
+    @property
+    def piecewise_linear(self) -> PiecewiseLinear:
+        """
+        Compiled piecewise linear form of this fuzzy number (breakpoints and slopes of both branches), used for
+        interpolation of alpha cuts, membership and comparisons. Built lazily once, rebuilt only if precision or
+        rounding of FuzzyMath decimal context changes.
+
+        Returns
+        -------
+        PiecewiseLinear
+        """
+        context = FuzzyMathPrecision.get_decimal_context()
+        context_key = (context.prec, context.rounding)
+
+        cached = self._piecewise_linear
+
+        if cached is not None and cached[0] == context_key:
+            return cached[1]
+
+        with localcontext(context):
+            piecewise_linear = PiecewiseLinear(self._alphas, list(self._alpha_cuts.values()))
+
+        self._piecewise_linear = (context_key, piecewise_linear)
+
+        return piecewise_linear
+
     def _calculate_alpha_cut(self, alpha: Union[Decimal, float]) -> Interval:
         """
-        Calculates alpha cut for given alpha.
+        Calculates alpha cut for given alpha by linear interpolation between neighbouring alpha cuts. Calculated alpha
+        cuts are cached.
 
         Parameters
         ----------
@@ -240,33 +342,45 @@ class FuzzyNumber:
         Interval
         """
 
-        position = bisect_left(self._alphas, alpha)
+        alpha = Decimal(alpha)
 
-        x1 = self._alpha_cuts.get(self.alpha_levels[position - 1]).min  # type: ignore [union-attr]
-        y1 = self.alpha_levels[position - 1]
-        x2 = self._alpha_cuts.get(self.alpha_levels[position]).min  # type: ignore [union-attr]
-        y2 = self.alpha_levels[position]
+        context = FuzzyMathPrecision.get_decimal_context()
+        context_key = (context.prec, context.rounding)
 
-        if x1 == x2:
-            a = x1
-        else:
-            k = (y1 - y2) / (x1 - x2)
-            q = y1 - k * x1
-            a = (Decimal(alpha) - q) / k
+        key = (alpha, FuzzyMathPrecision.current().numeric_precision, context_key)
 
-        x1 = self._alpha_cuts.get(self.alpha_levels[position - 1]).max  # type: ignore [union-attr]
-        y1 = self.alpha_levels[position - 1]
-        x2 = self._alpha_cuts.get(self.alpha_levels[position]).max  # type: ignore [union-attr]
-        y2 = self.alpha_levels[position]
+        cache = self._alpha_cut_cache
 
-        if x1 == x2:
-            b = x1
+        if cache is None:
+            cache = OrderedDict()
+            self._alpha_cut_cache = cache
         else:
-            k = (y2 - y1) / (x2 - x1)
-            q = y1 - k * x1
-            b = (Decimal(alpha) - q) / k
+            alpha_cut = cache.get(key)
+
+            if alpha_cut is not None:
+                # the key may have been evicted by another thread in the meantime
+                try:
+                    cache.move_to_end(key)
+                except KeyError:
+                    pass
+                return alpha_cut
+
+        piecewise_linear = self.piecewise_linear
+
+        with localcontext(context):
+            a, b = piecewise_linear.bounds(alpha)
 
-        return Interval(min(a, b), max(a, b))
+        alpha_cut = Interval._from_ordered(min(a, b), max(a, b))  # pylint: disable=W0212
+
+        cache[key] = alpha_cut
+
+        if len(cache) > self._alpha_cut_cache_size:
+            try:
+                cache.popitem(last=False)
+            except KeyError:
+                pass
+
+        return alpha_cut
 
     def __repr__(self) -> str:
         """
@@ -346,22 +460,7 @@ class FuzzyNumber:
             List of Decimal representing alphas.
         """
 
-        if not isinstance(number_of_parts, int) or number_of_parts <= 1:
-            raise ValueError(
-                "`number_of_cuts` has to be integer and higher than 1. "
-                f"It is of type `{type(number_of_parts).__name__}` and value `{number_of_parts}`."
-            )
-
-        number_of_parts = int(number_of_parts)
-
-        values = [Decimal(0)] * number_of_parts
-
-        i = 0
-        while i <= number_of_parts - 1:
-            values[i] = FuzzyMathPrecision.prepare_alpha(Decimal(i) / (Decimal(number_of_parts) - Decimal(1)))
-            i += 1
-
-        return values
+        return list(AlphaGrid.uniform(number_of_parts))
 
     def __add__(self, other) -> FuzzyNumber:
         if not isinstance(other, (int, float, FuzzyNumber)):
@@ -497,14 +596,23 @@ class FuzzyNumber:
         return strict_undervaluation(self, fn_other)
 
     def apply_function(
-        self, function: Callable, *args, monotone: bool = False, number_elements: int = 1000, **kwargs
+        self,
+        function: Callable,
+        *args,
+        monotone: bool = False,
+        number_elements: int = 1000,
+        vectorized: bool = False,
+        tolerance: Optional[Union[float, Decimal]] = None,
+        **kwargs,
     ) -> FuzzyNumber:
         """
-        Apply mathematical function to fuzzy number.
+        Apply mathematical function to fuzzy number. The support of the fuzzy number is sampled only once (plus limits of
+        all alpha cuts), so the function is evaluated roughly `number_elements` times regardless of the number of alpha
+        cuts.
 
         Parameters
         ----------
-        function: (FunctionType, BuiltinFunctionType)
+        function: (FunctionType, BuiltinFunctionType, np.ufunc)
             Function to apply to fuzzy number.
 
         args
@@ -516,6 +624,14 @@ class FuzzyNumber:
         number_elements: int
             Number of elements to divide fuzzy number into, if the function is not monotone. Default is `1000`.
 
+        vectorized: bool
+            Does the `function` accept NumPy array of floats and return array of results? See
+            `Interval.apply_function()`. Default `False`.
+
+        tolerance: Optional[Union[float, Decimal]]
+            If provided (and the function is not monotone), the support is sampled adaptively instead of by
+            `number_elements` elements, see `Interval.apply_function()`. Default `None`.
+
         kwargs
             Named arguments to pass into `function`.
 
@@ -525,9 +641,9 @@ class FuzzyNumber:
             New `FuzzyNumber`.
         """
 
-        if not isinstance(function, (FunctionType, BuiltinFunctionType)):
+        if not isinstance(function, (FunctionType, BuiltinFunctionType, np.ufunc)):
             raise ValueError(
-                "`function` must be either `FunctionType` or `BuiltinFunctionType`. `function` currently "
+                "`function` must be either `FunctionType`, `BuiltinFunctionType` or `np.ufunc`. `function` currently "
                 f"is `{type(function)}`."
             )
 
@@ -540,47 +656,105 @@ class FuzzyNumber:
         if not isinstance(monotone, bool):
             raise ValueError(f"`monotone` must be `bool`. `monotone` is currently `{monotone}`.")
 
-        intervals: List[Interval] = []
+        alpha_cuts = list(self._alpha_cuts.values())
 
-        alpha_levels = list(self.alpha_levels)
-        alpha_levels.reverse()
+        evaluate = Interval._evaluator(function, args, kwargs, vectorized)  # pylint: disable=W0212
 
-        width = self.max - self.min
+        # single sampling of the support shared by all alpha cuts, alpha cut limits are always evaluated
+        if tolerance is not None and not monotone:
+            Interval._validate_tolerance(tolerance)  # pylint: disable=W0212
+            samples = self.get_alpha_cut(0)._adaptive_samples(evaluate, tolerance)  # pylint: disable=W0212
+        else:
+            samples = {}
 
-        i = 0
-        for alpha in alpha_levels:
-            alpha_width = self.get_alpha_cut(alpha).max - self.get_alpha_cut(alpha).min
+        elements = set()
 
-            number_elements_cut = (alpha_width / width) * number_elements
+        for alpha_cut in alpha_cuts:
+            elements.add(alpha_cut.min)
+            elements.add(alpha_cut.max)
 
-            interval = self.get_alpha_cut(alpha).apply_function(
-                function, *args, monotone=monotone, number_elements=number_elements_cut, **kwargs
-            )
+        if tolerance is None and not monotone and self.max > self.min:
+            step = (self.max - self.min) / Decimal(number_elements)
+            count = math.ceil((self.max - self.min) / step + Decimal("0.1"))
+            elements.update(self.min + step * i for i in range(count))
+
+        missing = [element for element in elements if element not in samples]
+        samples.update(zip(missing, evaluate(missing)))
+
+        sorted_elements = sorted(samples)
+        results = [samples[element] for element in sorted_elements]
+
+        # range queries from kernel outwards, every alpha cut extends the range of the previous (higher) one
+        intervals: List[Interval] = [None] * len(alpha_cuts)  # type: ignore [list-item]
+
+        low = bisect_left(sorted_elements, alpha_cuts[-1].min)
+        high = low
+        minimum = maximum = results[low]
+
+        for i in range(len(alpha_cuts) - 1, -1, -1):
+            new_low = bisect_left(sorted_elements, alpha_cuts[i].min)
+            new_high = bisect_right(sorted_elements, alpha_cuts[i].max)
+
+            for result in results[new_low:low]:
+                minimum = min(minimum, result)
+                maximum = max(maximum, result)
+
+            for result in results[high:new_high]:
+                minimum = min(minimum, result)
+                maximum = max(maximum, result)
+
+            low = new_low
+            high = new_high
+
+            intervals[i] = Interval(minimum, maximum)
+
+        return FuzzyNumber._from_trusted(self._alphas, intervals)
+
+    def _alpha_cut_on_grid(self, alpha: Decimal) -> Interval:
+        """
+        Returns alpha cut for already validated `alpha`, typically value from `AlphaGrid`.
 
-            if i != 0:
-                interval = interval.union_hull(intervals[i - 1])
+        Parameters
+        ----------
+        alpha: Decimal
+
+        Returns
+        -------
+        Interval
+        """
+        alpha_cut = self._alpha_cuts.get(alpha)
+
+        if alpha_cut is None:
+            alpha_cut = self._calculate_alpha_cut(alpha)
 
-            intervals.append(interval)
-            i += 1
+        return alpha_cut
 
-        intervals.reverse()
+    def _alpha_cuts_on_grid(self, alphas: AlphaGrid) -> List[Interval]:
+        """
+        Returns alpha cuts for all alphas of `alphas`. If `alphas` is the grid of this fuzzy number, the stored alpha
+        cuts are returned without any lookup.
+
+        Parameters
+        ----------
+        alphas: AlphaGrid
 
-        return FuzzyNumber(self.alpha_levels, intervals)
+        Returns
+        -------
+        List[Interval]
+        """
+        if alphas is self._alphas:
+            return list(self._alpha_cuts.values())
+
+        return [self._alpha_cut_on_grid(alpha) for alpha in alphas]
 
     @staticmethod
     def _iterate_alphas_one_value(x: FuzzyNumber, operation: Callable, *args) -> FuzzyNumber:
         if not callable(operation):
             raise TypeError(f"`operation` needs to be a function. It is `{type(operation).__name__}`.")
 
-        alphas, intervals = FuzzyNumber.__prepare_alphas_intervals(x.alpha_levels)
-
-        i = 0
-
-        for alpha in alphas:
-            intervals[i] = operation(x.get_alpha_cut(alpha), *args)
-            i += 1
+        intervals = [operation(alpha_cut, *args) for alpha_cut in x._alpha_cuts.values()]
 
-        return FuzzyNumber(alphas, intervals)
+        return FuzzyNumber._from_trusted(x._alphas, intervals)
 
     @staticmethod
     def _iterate_alphas_two_values(x, y, operation: Callable) -> FuzzyNumber:
@@ -591,25 +765,21 @@ class FuzzyNumber:
         fuzzy_y = isinstance(y, FuzzyNumber)
 
         if fuzzy_x and fuzzy_y:
-            alphas, intervals = FuzzyNumber.__prepare_alphas_intervals(x.alpha_levels, y.alpha_levels)
+            alphas = AlphaGrid.merge(x._alphas, y._alphas)
+            intervals = [
+                operation(cut_x, cut_y)
+                for cut_x, cut_y in zip(x._alpha_cuts_on_grid(alphas), y._alpha_cuts_on_grid(alphas))
+            ]
         elif fuzzy_x:
-            alphas, intervals = FuzzyNumber.__prepare_alphas_intervals(x.alpha_levels)
+            alphas = x._alphas
+            intervals = [operation(cut_x, y) for cut_x in x._alpha_cuts.values()]
         elif fuzzy_y:
-            alphas, intervals = FuzzyNumber.__prepare_alphas_intervals(y.alpha_levels)
+            alphas = y._alphas
+            intervals = [operation(x, cut_y) for cut_y in y._alpha_cuts.values()]
         else:
             raise RuntimeError("At least one argument has to be `FuzzyNumber`.")
 
-        i = 0
-        for alpha in alphas:
-            if fuzzy_x and fuzzy_y:
-                intervals[i] = operation(x.get_alpha_cut(alpha), y.get_alpha_cut(alpha))
-            elif fuzzy_x:
-                intervals[i] = operation(x.get_alpha_cut(alpha), y)
-            elif fuzzy_y:
-                intervals[i] = operation(x, y.get_alpha_cut(alpha))
-            i += 1
-
-        return FuzzyNumber(alphas, intervals)
+        return FuzzyNumber._from_trusted(alphas, intervals)
 
     def __get_cuts_values(
         self,
@@ -619,7 +789,7 @@ class FuzzyNumber:
     ) -> List[Decimal]:
         if alphas is None:
             alphas = self.alpha_levels
-        else:
+        elif not isinstance(alphas, AlphaGrid):
             alphas.sort()
 
         values = [Decimal(0)] * len(alphas)
@@ -704,112 +874,68 @@ class FuzzyNumber:
         -------
         List[Decimal]
         """
+        if isinstance(alpha_levels1, AlphaGrid) and isinstance(alpha_levels2, AlphaGrid):
+            return list(AlphaGrid.merge(alpha_levels1, alpha_levels2))
+
         alphas = sorted(list(set.union(set(alpha_levels1), set(alpha_levels2))))
         return alphas
 
-    @staticmethod
-    def __prepare_alphas_intervals(
-        alpha_levels1: List[Decimal],
-        alpha_levels2: List[Decimal] = None,  # type: ignore [assignment]
-    ) -> Tuple[List[Decimal], List[Interval]]:
+    def membership(
+        self, value: Union[float, int, Decimal, np.ndarray, Sequence[Union[float, int, Decimal]]]
+    ) -> Union[FuzzyMembership, np.ndarray]:
         """
-        Prepares list of alphas and list of empty `Interval`s for provided alpha levels.
+        Get membership of value to this fuzzy number. The alpha level is found by binary search on the left (minimums of
+        alpha cuts) and the right (maximums of alpha cuts) branch of the fuzzy number and linearly interpolated between
+        neighbouring alpha levels, membership is the lower of the two values.
 
         Parameters
         ----------
-        alpha_levels1: List[Decimal]
-        alpha_levels2: List[Decimal]
+        value: Union[float, int, Decimal, np.ndarray, Sequence[Union[float, int, Decimal]]]
+            Value to determine membership for. For array (or list or tuple) of values, memberships of all the values
+            are calculated at once in float64.
+
+        Raises
+        -------
+        TypeError
+            If value is not integer, float, Decimal or array of numbers.
 
         Returns
         -------
-        (List[Decimal], List[Interval])
-            List of alpha values and list of empty intervals prepared for further use.
+        Union[FuzzyMembership, np.ndarray]
+            `FuzzyMembership` for single value, array of membership degrees of the same shape for array of values.
         """
+        if isinstance(value, (np.ndarray, list, tuple)):
+            return self._memberships(value)
 
-        if alpha_levels2 is None:
-            alphas = sorted(list(set(alpha_levels1)))
-        else:
-            alphas = FuzzyNumber._prepare_alphas(alpha_levels1, alpha_levels2)
+        if not isinstance(value, (int, float, Decimal)):
+            raise TypeError(
+                f"Cannot get membership of `{type(value).__name__}` in FuzzyNumber. Only implemented for "
+                "`float`, `int`, `Decimal` and arrays of numbers."
+            )
 
-        intervals = [Interval(float("nan"), float("nan"))] * len(alphas)
+        piecewise_linear = self.piecewise_linear
 
-        return alphas, intervals
+        with localcontext(FuzzyMathPrecision.get_decimal_context()):
+            return FuzzyMembership(piecewise_linear.membership(Decimal(value)))
 
-    def membership(self, value: Union[float, int, Decimal]) -> FuzzyMembership:
+    def _memberships(self, values: Union[np.ndarray, Sequence[Union[float, int, Decimal]]]) -> np.ndarray:
         """
-        Get membership of value to this fuzzy number.
+        Memberships of array of values, calculated in float64 by `np.searchsorted` on both branches. Membership of NaN
+        is NaN.
 
         Parameters
         ----------
-        value: Union[float, int, Decimal]
-            Value to determine membership for.
-
-        Args:
-            value (Union[float, int, Decimal]): Value to determine membership for.
-
-        Raises
-        -------
-        TypeError
-            If value is not integer, float or Decimal.
+        values: Union[np.ndarray, Sequence[Union[float, int, Decimal]]]
 
         Returns
         -------
-        FuzzyMembership
+        np.ndarray
         """
-        if not isinstance(value, (int, float, Decimal)):
+        try:
+            values = np.asarray(values, dtype=np.float64)
+        except (TypeError, ValueError) as e:
             raise TypeError(
-                f"Cannot get membership of `{type(value).__name__}` in FuzzyNumber. Only implemented for "
-                "`float`, `int`."
-            )
+                "Cannot get membership of array in FuzzyNumber, only arrays of numbers are supported."
+            ) from e
 
-        if value not in self:
-            return FuzzyMembership(0)
-
-        elif self.kernel_min <= value <= self.kernel_max:
-            return FuzzyMembership(1)
-
-        else:
-            last_alpha_containing = int(0)
-
-            for i in range(len(self)):
-                if value in self.alpha_cuts[i]:
-                    last_alpha_containing = i
-                else:
-                    break
-
-            y1 = self._alphas[last_alpha_containing]
-            y2 = self._alphas[last_alpha_containing + 1]
-
-            if (
-                self.alpha_cuts[last_alpha_containing].min <= value
-                and value <= self.alpha_cuts[last_alpha_containing + 1].min
-            ):
-                x1 = self.alpha_cuts[last_alpha_containing].min
-                x2 = self.alpha_cuts[last_alpha_containing + 1].min
-
-            else:
-                x1 = self.alpha_cuts[last_alpha_containing].max
-                x2 = self.alpha_cuts[last_alpha_containing + 1].max
-
-            k = (y2 - y1) / (x2 - x1)
-            q = y1 - (k * x1)
-
-            return FuzzyMembership((k * Decimal(value)) + q)
-            y1 = self._alphas[last_alpha_containing]
-            y2 = self._alphas[last_alpha_containing + 1]
-
-            if (
-                self.alpha_cuts[last_alpha_containing].min <= value
-                and value <= self.alpha_cuts[last_alpha_containing + 1].min
-            ):
-                x1 = self.alpha_cuts[last_alpha_containing].min
-                x2 = self.alpha_cuts[last_alpha_containing + 1].min
-
-            else:
-                x1 = self.alpha_cuts[last_alpha_containing].max
-                x2 = self.alpha_cuts[last_alpha_containing + 1].max
-
-            k = (y2 - y1) / (x2 - x1)
-            q = y1 - (k * x1)
-
-            return FuzzyMembership((k * Decimal(value)) + q)
+        return self.piecewise_linear.memberships(values)
@@ -0,0 +1,572 @@
+"""Columnar container of many fuzzy numbers"""
+from __future__ import annotations
+
+import os
+import struct
+from decimal import Decimal
+from typing import Iterable, Iterator, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .class_alpha_grid import AlphaGrid
+from .class_fuzzy_number import FuzzyNumber
+from .class_fuzzy_number_float import FuzzyNumberFloat
+from .class_interval_array import IntervalArray
+from .class_precision import FuzzyMathPrecision
+
+MAGIC = b"FZMA"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sBxxxQQ")
+
+
+class FuzzyNumberArray:
+    """
+    Container of N fuzzy numbers that share one alpha grid of K alpha levels. The alpha cuts are stored as single
+    float64 block of shape (N, K, 2), where the last axis holds minimum and maximum of the alpha cut. All the arithmetic
+    is element-wise and broadcasts against scalars, single fuzzy numbers and other `FuzzyNumberArray`s. Results are
+    rounded outwards if outward rounding is enabled by `FuzzyMathPrecision.set_outward_rounding()`.
+    ...
+    Attributes
+    ----------
+    _alphas: np.ndarray
+        Shared alpha values of shape (K,), sorted from 0 to 1.
+
+    _values: np.ndarray
+        Alpha cuts of all fuzzy numbers, shape (N, K, 2).
+    """
+
+    __slots__ = ("_alphas", "_values")
+
+    # make NumPy defer binary operators with arrays of scalars to this class
+    __array_ufunc__ = None
+
+    def __init__(self, alphas: Sequence[Union[float, int, Decimal]], values: Union[np.ndarray, Sequence]):
+        """
+        Basic creator for the class. Generally it is more useful to use `FuzzyNumberArray.from_fuzzy_numbers()`.
+
+        Parameters
+        ----------
+        alphas: Sequence[Union[float, int, Decimal]]
+            Shared alpha values, sorted from 0 to 1.
+
+        values: Union[np.ndarray, Sequence]
+            Alpha cuts of shape (N, K, 2).
+
+        Raises
+        -------
+        ValueError
+            If `alphas` or `values` do not describe valid fuzzy numbers.
+        """
+
+        alphas_array = np.array(alphas, dtype=np.float64)
+        values_array = np.array(values, dtype=np.float64)
+
+        if alphas_array.ndim != 1:
+            raise ValueError("`alphas` must be one dimensional.")
+
+        if values_array.ndim != 3 or values_array.shape[1:] != (alphas_array.size, 2):
+            raise ValueError(
+                f"`values` must be of shape (N, {alphas_array.size}, 2). Currently the shape is {values_array.shape}."
+            )
+
+        self._validate_alphas(alphas_array)
+
+        mins = values_array[..., 0]
+        maxs = values_array[..., 1]
+
+        if np.any(np.isnan(values_array)):
+            raise ValueError("`values` must not contain NaN.")
+
+        if np.any(mins > maxs):
+            raise ValueError("Minimum of each alpha cut has to be lower or equal to its maximum.")
+
+        if np.any(np.diff(mins, axis=1) < 0) or np.any(np.diff(maxs, axis=1) > 0):
+            raise ValueError("Interval on lower alpha level has to contain the higher level alpha cuts.")
+
+        alphas_array.flags.writeable = False
+
+        self._alphas = alphas_array
+        self._values = values_array
+
+    @staticmethod
+    def _validate_alphas(alphas: np.ndarray) -> None:
+        """
+        Checks that one dimensional `alphas` are unique, sorted, start with 0 and end with 1.
+        """
+        if alphas.size < 2 or alphas[0] != 0 or alphas[-1] != 1:
+            raise ValueError("`alphas` must start with 0 alpha value and end with 1 alpha value.")
+
+        if not np.all(np.diff(alphas) > 0):
+            raise ValueError("Values in `alphas` must be unique and sorted in ascending order.")
+
+    @classmethod
+    def _from_arrays(cls, alphas: np.ndarray, values: np.ndarray) -> FuzzyNumberArray:
+        """
+        Creates the object from arrays that are known to be valid (results of internal operations) without any
+        validation.
+
+        Parameters
+        ----------
+        alphas: np.ndarray
+        values: np.ndarray
+
+        Returns
+        -------
+        FuzzyNumberArray
+        """
+        fuzzy_numbers = cls.__new__(cls)
+        fuzzy_numbers._alphas = alphas  # pylint: disable=W0212
+        fuzzy_numbers._values = values  # pylint: disable=W0212
+        return fuzzy_numbers
+
+    @classmethod
+    def from_fuzzy_numbers(
+        cls,
+        fuzzy_numbers: Iterable[Union[FuzzyNumber, FuzzyNumberFloat]],
+        alphas: Optional[Sequence[Union[float, int, Decimal]]] = None,
+    ) -> FuzzyNumberArray:
+        """
+        Creates `FuzzyNumberArray` from fuzzy numbers. Alpha cuts missing on the shared grid are linearly interpolated.
+
+        Parameters
+        ----------
+        fuzzy_numbers: Iterable[Union[FuzzyNumber, FuzzyNumberFloat]]
+            Fuzzy numbers to store.
+
+        alphas: Optional[Sequence[Union[float, int, Decimal]]]
+            Shared alpha grid. If `None` (default) union of alpha levels of all `fuzzy_numbers` is used.
+
+        Returns
+        -------
+        FuzzyNumberArray
+        """
+
+        float_numbers = [cls._as_float(fuzzy_number) for fuzzy_number in fuzzy_numbers]
+
+        if alphas is None:
+            if not float_numbers:
+                raise ValueError("Cannot determine alpha levels from empty `fuzzy_numbers`, provide `alphas`.")
+
+            grid = float_numbers[0].alpha_levels
+            for float_number in float_numbers[1:]:
+                if float_number.alpha_levels is not grid and not np.array_equal(float_number.alpha_levels, grid):
+                    grid = np.union1d(grid, float_number.alpha_levels)
+        else:
+            grid = np.array(alphas, dtype=np.float64)
+
+        values = np.empty((len(float_numbers), grid.size, 2), dtype=np.float64)
+
+        for i, float_number in enumerate(float_numbers):
+            alpha_cuts = float_number._interpolate(grid, False)  # pylint: disable=W0212
+            values[i, :, 0] = alpha_cuts.mins
+            values[i, :, 1] = alpha_cuts.maxs
+
+        return cls(grid, values)
+
+    def save(self, path: Union[str, os.PathLike]) -> None:
+        """
+        Saves the array into binary file, that can be opened by `FuzzyNumberArray.open_memmap()`. The file consists of
+        header (magic bytes, version, N and K) followed by K alpha values and the block of alpha cuts, both as
+        little-endian float64.
+
+        Parameters
+        ----------
+        path: Union[str, os.PathLike]
+        """
+        with open(path, "wb") as file:
+            file.write(_HEADER.pack(MAGIC, VERSION, len(self), self._alphas.size))
+            file.write(np.ascontiguousarray(self._alphas, dtype="<f8").tobytes())
+            np.ascontiguousarray(self._values, dtype="<f8").tofile(file)
+
+    @classmethod
+    def open_memmap(cls, path: Union[str, os.PathLike], mode: str = "r") -> FuzzyNumberArray:
+        """
+        Opens file created by `FuzzyNumberArray.save()` or `FuzzyNumberArray.create_memmap()` as memory-mapped array.
+        Nothing is loaded into memory until accessed, slices of the result are views into the file and indexing by
+        integer converts only the single fuzzy number. The alpha levels are validated, the values are not.
+
+        Parameters
+        ----------
+        path: Union[str, os.PathLike]
+
+        mode: str
+            Mode of `np.memmap`, either `r` (default) or `r+` to allow changes of the values.
+
+        Returns
+        -------
+        FuzzyNumberArray
+
+        Raises
+        -------
+        ValueError
+            If the file does not contain fuzzy number array or its alpha levels are not valid.
+        """
+        if mode not in ("r", "r+"):
+            raise ValueError(f"`mode` must be either `r` or `r+`. It is `{mode}`.")
+
+        with open(path, "rb") as file:
+            header = file.read(_HEADER.size)
+
+            if len(header) != _HEADER.size:
+                raise ValueError("File is too short to contain header.")
+
+            magic, version, size, number_alphas = _HEADER.unpack(header)
+
+            if magic != MAGIC:
+                raise ValueError("File does not contain FuzzyMath fuzzy number array.")
+
+            if version != VERSION:
+                raise ValueError(f"Unsupported version `{version}` of FuzzyMath fuzzy number array.")
+
+            alphas_bytes = file.read(8 * number_alphas)
+
+            if len(alphas_bytes) != 8 * number_alphas:
+                raise ValueError("File is too short to contain alpha levels.")
+
+        alphas = np.frombuffer(alphas_bytes, dtype="<f8").astype(np.float64)
+
+        cls._validate_alphas(alphas)
+
+        alphas.flags.writeable = False
+
+        if size == 0:
+            return cls._from_arrays(alphas, np.empty((0, number_alphas, 2), dtype=np.float64))
+
+        values = np.memmap(
+            path, dtype="<f8", mode=mode, offset=_HEADER.size + 8 * number_alphas, shape=(size, number_alphas, 2)
+        )
+
+        return cls._from_arrays(alphas, values)
+
+    @classmethod
+    def create_memmap(
+        cls, path: Union[str, os.PathLike], alphas: Sequence[Union[float, int, Decimal]], size: int
+    ) -> FuzzyNumberArray:
+        """
+        Creates file for `size` fuzzy numbers and opens it as writable memory-mapped array. Allows creation of datasets
+        larger than memory, by filling the `values` block in parts. The values are initialized to 0.
+
+        Parameters
+        ----------
+        path: Union[str, os.PathLike]
+
+        alphas: Sequence[Union[float, int, Decimal]]
+            Shared alpha values, sorted from 0 to 1.
+
+        size: int
+            Number of fuzzy numbers.
+
+        Returns
+        -------
+        FuzzyNumberArray
+        """
+        empty = cls(alphas, np.zeros((0, len(alphas), 2)))
+
+        if not isinstance(size, int) or size < 1:
+            raise ValueError(f"`size` must be positive integer. It is `{size}`.")
+
+        with open(path, "wb") as file:
+            file.write(_HEADER.pack(MAGIC, VERSION, size, empty.alpha_levels.size))
+            file.write(np.ascontiguousarray(empty.alpha_levels, dtype="<f8").tobytes())
+            file.truncate(_HEADER.size + 8 * empty.alpha_levels.size + 16 * empty.alpha_levels.size * size)
+
+        return cls.open_memmap(path, mode="r+")
+
+    @staticmethod
+    def _as_float(fuzzy_number: Union[FuzzyNumber, FuzzyNumberFloat]) -> FuzzyNumberFloat:
+        if isinstance(fuzzy_number, FuzzyNumberFloat):
+            return fuzzy_number
+        elif isinstance(fuzzy_number, FuzzyNumber):
+            return FuzzyNumberFloat.from_fuzzy_number(fuzzy_number)
+        else:
+            raise TypeError(
+                "Only `FuzzyNumber` and `FuzzyNumberFloat` can be stored in `FuzzyNumberArray`. "
+                f"Got `{type(fuzzy_number).__name__}`."
+            )
+
+    @property
+    def alpha_levels(self) -> np.ndarray:
+        """
+        Shared alpha levels of all fuzzy numbers.
+
+        Returns
+        -------
+        np.ndarray
+        """
+        return self._alphas
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        Alpha cuts of all fuzzy numbers as array of shape (N, K, 2).
+
+        Returns
+        -------
+        np.ndarray
+        """
+        return self._values
+
+    @property
+    def mins(self) -> np.ndarray:
+        """
+        Minimal values of alpha cuts, shape (N, K).
+
+        Returns
+        -------
+        np.ndarray
+        """
+        return self._values[..., 0]
+
+    @property
+    def maxs(self) -> np.ndarray:
+        """
+        Maximal values of alpha cuts, shape (N, K).
+
+        Returns
+        -------
+        np.ndarray
+        """
+        return self._values[..., 1]
+
+    @property
+    def shape(self) -> Tuple[int, int, int]:
+        """
+        Shape of underlying block (N, K, 2).
+
+        Returns
+        -------
+        Tuple[int, int, int]
+        """
+        return self._values.shape  # type: ignore [return-value]
+
+    def __len__(self) -> int:
+        return int(self._values.shape[0])
+
+    def __repr__(self) -> str:
+        return f"FuzzyNumberArray of {len(self)} fuzzy numbers with {self._alphas.size} alpha levels."
+
+    def get_float(self, index: int) -> FuzzyNumberFloat:
+        """
+        Extracts single fuzzy number as `FuzzyNumberFloat`. The result is read-only view, it shares memory with this
+        array (no values are copied).
+
+        Parameters
+        ----------
+        index: int
+
+        Returns
+        -------
+        FuzzyNumberFloat
+        """
+        values = self._values[index]
+        return FuzzyNumberFloat._from_arrays(self._alphas, values[:, 0], values[:, 1])  # pylint: disable=W0212
+
+    def __getitem__(self, index) -> Union[FuzzyNumber, FuzzyNumberArray]:
+        if isinstance(index, (int, np.integer)):
+            return self._to_fuzzy_number(index, FuzzyNumberFloat._decimal_alphas(self._alphas))  # pylint: disable=W0212
+
+        values = self._values[index]
+
+        if values.ndim != 3:
+            raise IndexError("`FuzzyNumberArray` can only be indexed by integer, slice, mask or array of indices.")
+
+        return FuzzyNumberArray._from_arrays(self._alphas, values)
+
+    def _to_fuzzy_number(self, index: int, alphas: AlphaGrid) -> FuzzyNumber:
+        """
+        Converts single fuzzy number into `FuzzyNumber` on `alphas`, the shared alpha grid converted to `Decimal`.
+        """
+        return FuzzyNumber._from_trusted(
+            alphas, self.get_float(index).alpha_cuts.to_intervals()
+        )  # pylint: disable=W0212
+
+    def __iter__(self) -> Iterator[FuzzyNumber]:
+        alphas = FuzzyNumberFloat._decimal_alphas(self._alphas)  # pylint: disable=W0212
+
+        for i in range(len(self)):
+            yield self._to_fuzzy_number(i, alphas)
+
+    def to_fuzzy_numbers(self) -> list:
+        """
+        Converts all stored fuzzy numbers into list of `FuzzyNumber`.
+
+        Returns
+        -------
+        List[FuzzyNumber]
+        """
+        return list(self)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, FuzzyNumberArray):
+            return np.array_equal(self._alphas, other._alphas) and np.array_equal(self._values, other._values)
+        else:
+            return NotImplemented
+
+    __hash__ = None  # type: ignore [assignment]
+
+    @staticmethod
+    def _interpolate(alphas_from: np.ndarray, values: np.ndarray, alphas_to: np.ndarray) -> np.ndarray:
+        """
+        Linearly interpolates block of alpha cuts of shape (..., K, 2) onto different alpha levels. If outward rounding
+        is enabled in `FuzzyMathPrecision`, the interpolated alpha cuts are rounded outwards.
+        """
+        position = np.clip(np.searchsorted(alphas_from, alphas_to, side="right"), 1, alphas_from.size - 1)
+
+        lower = alphas_from[position - 1]
+        weight = ((alphas_to - lower) / (alphas_from[position] - lower))[:, np.newaxis]
+
+        result = values[..., position - 1, :] * (1 - weight) + values[..., position, :] * weight
+
+        if FuzzyMathPrecision.current().outward_rounding:
+            lower_values = values[..., position - 1, :]
+            upper_values = values[..., position, :]
+            result[..., 0] = IntervalArray._enclosing_interpolation(  # pylint: disable=W0212
+                result[..., 0], lower_values[..., 0], upper_values[..., 0], True
+            )
+            result[..., 1] = IntervalArray._enclosing_interpolation(  # pylint: disable=W0212
+                result[..., 1], lower_values[..., 1], upper_values[..., 1], False
+            )
+
+        return result
+
+    @property
+    def alpha_cuts(self) -> IntervalArray:
+        """
+        Alpha cuts of all fuzzy numbers as `IntervalArray` of shape (N, K).
+
+        Returns
+        -------
+        IntervalArray
+        """
+        return IntervalArray._from_arrays(self.mins, self.maxs)  # pylint: disable=W0212
+
+    def _operands(self, other) -> Tuple[np.ndarray, IntervalArray, Union[IntervalArray, np.ndarray, float]]:
+        """
+        Prepares this array and `other` operand for broadcasting element-wise operation on common alpha grid.
+
+        Returns
+        -------
+        (np.ndarray, IntervalArray, Union[IntervalArray, np.ndarray, float])
+            Alphas, alpha cuts of this array and alpha cuts of `other` (or scalar values of `other`).
+        """
+        if isinstance(other, (int, float)):
+            return self._alphas, self.alpha_cuts, float(other)
+
+        if isinstance(other, np.ndarray):
+            if other.ndim != 1 or other.shape[0] not in (1, len(self)):
+                raise ValueError(f"Array of scalars must be of shape ({len(self)},). It is {other.shape}.")
+            return self._alphas, self.alpha_cuts, other.astype(np.float64)[:, np.newaxis]
+
+        if isinstance(other, FuzzyNumber):
+            other = FuzzyNumberFloat.from_fuzzy_number(other)
+
+        if isinstance(other, FuzzyNumberFloat):
+            other_alphas = other.alpha_levels
+            other_values = np.stack((other.mins, other.maxs), axis=-1)[np.newaxis, ...]
+        else:
+            if len(other) not in (1, len(self)) and len(self) != 1:
+                raise ValueError(f"Cannot broadcast arrays of {len(self)} and {len(other)} fuzzy numbers.")
+            other_alphas = other.alpha_levels
+            other_values = other.values
+
+        self_alphas = self._alphas
+        self_values = self._values
+
+        if self_alphas is not other_alphas and not np.array_equal(self_alphas, other_alphas):
+            alphas = np.union1d(self_alphas, other_alphas)
+            self_values = self._interpolate(self_alphas, self_values, alphas)
+            other_values = self._interpolate(other_alphas, other_values, alphas)
+        else:
+            alphas = self_alphas
+
+        return (
+            alphas,
+            IntervalArray._from_arrays(self_values[..., 0], self_values[..., 1]),  # pylint: disable=W0212
+            IntervalArray._from_arrays(other_values[..., 0], other_values[..., 1]),  # pylint: disable=W0212
+        )
+
+    @staticmethod
+    def _is_operand(other) -> bool:
+        return isinstance(other, (int, float, np.ndarray, FuzzyNumber, FuzzyNumberFloat, FuzzyNumberArray))
+
+    @staticmethod
+    def _combine(alphas: np.ndarray, alpha_cuts: IntervalArray) -> FuzzyNumberArray:
+        return FuzzyNumberArray._from_arrays(alphas, np.stack((alpha_cuts.mins, alpha_cuts.maxs), axis=-1))
+
+    @staticmethod
+    def _check_divisor(divisor: Union[IntervalArray, np.ndarray, float]) -> None:
+        if isinstance(divisor, IntervalArray):
+            zero_mask = divisor.contains_zero()
+        else:
+            zero_mask = np.equal(divisor, 0)
+
+        if np.any(zero_mask):
+            raise ArithmeticError("Cannot divide by fuzzy number that contains 0.")
+
+    def __add__(self, other) -> FuzzyNumberArray:
+        if not self._is_operand(other):
+            return NotImplemented
+
+        alphas, x, y = self._operands(other)
+        return self._combine(alphas, x + y)
+
+    def __radd__(self, other) -> FuzzyNumberArray:
+        if not self._is_operand(other):
+            return NotImplemented
+        return self + other
+
+    def __sub__(self, other) -> FuzzyNumberArray:
+        if not self._is_operand(other):
+            return NotImplemented
+
+        alphas, x, y = self._operands(other)
+        return self._combine(alphas, x - y)
+
+    def __rsub__(self, other) -> FuzzyNumberArray:
+        if not self._is_operand(other):
+            return NotImplemented
+
+        alphas, x, y = self._operands(other)
+        return self._combine(alphas, y - x)
+
+    def __mul__(self, other) -> FuzzyNumberArray:
+        if not self._is_operand(other):
+            return NotImplemented
+
+        alphas, x, y = self._operands(other)
+        return self._combine(alphas, x * y)
+
+    def __rmul__(self, other) -> FuzzyNumberArray:
+        if not self._is_operand(other):
+            return NotImplemented
+        return self * other
+
+    def __truediv__(self, other) -> FuzzyNumberArray:
+        if not self._is_operand(other):
+            return NotImplemented
+
+        alphas, x, y = self._operands(other)
+
+        self._check_divisor(y)
+
+        return self._combine(alphas, x / y)
+
+    def __rtruediv__(self, other) -> FuzzyNumberArray:
+        if not self._is_operand(other):
+            return NotImplemented
+
+        alphas, x, y = self._operands(other)
+
+        self._check_divisor(x)
+
+        return self._combine(alphas, y / x)
+
+    def __pow__(self, power) -> FuzzyNumberArray:
+        if not isinstance(power, int):
+            return NotImplemented
+
+        return self._combine(self._alphas, self.alpha_cuts**power)
+
+    def __neg__(self) -> FuzzyNumberArray:
+        return self._combine(self._alphas, -self.alpha_cuts)
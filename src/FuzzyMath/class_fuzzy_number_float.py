@@ -0,0 +1,481 @@
+"""Fuzzy number class backed by float arrays"""
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Sequence, Tuple, Union
+
+import numpy as np
+
+from .class_alpha_grid import AlphaGrid
+from .class_fuzzy_number import FuzzyNumber
+from .class_interval_array import IntervalArray
+from .class_precision import FuzzyMathPrecision
+
+
+class FuzzyNumberFloat:
+    """
+    Fuzzy number representation stored as three contiguous float64 NumPy arrays. Opt-in alternative to `FuzzyNumber`
+    that trades the exactness of `Decimal` for vectorized arithmetic over all alpha cuts at once. With outward rounding
+    the alpha cuts of results are rounded outwards (see `IntervalArray`), so they always contain the exact results.
+    ...
+    Attributes
+    ----------
+    _alphas: np.ndarray
+        Sorted alpha values, starting with 0 and ending with 1.
+
+    _mins: np.ndarray
+        Minimal values of alpha cuts, aligned with `_alphas`.
+
+    _maxs: np.ndarray
+        Maximal values of alpha cuts, aligned with `_alphas`.
+
+    _outward_rounding: bool
+        Are results of operations with this fuzzy number rounded outwards? Propagates to the results.
+    """
+
+    __slots__ = ("_alphas", "_mins", "_maxs", "_outward_rounding")
+
+    def __init__(
+        self,
+        alphas: Sequence[Union[float, int, Decimal]],
+        mins: Sequence[Union[float, int, Decimal]],
+        maxs: Sequence[Union[float, int, Decimal]],
+        outward_rounding: bool = False,
+    ):
+        """
+        Basic creator for the class. Generally it is more useful to use functions `FuzzyNumberFloatFactory.triangular()`,
+        `FuzzyNumberFloatFactory.trapezoidal()`, `FuzzyNumberFloatFactory.crisp_number()` or
+        `FuzzyNumberFloat.from_fuzzy_number()` instead of this function.
+
+        Parameters
+        ----------
+        alphas: Sequence[Union[float, int, Decimal]]
+            Alpha values, sorted from 0 to 1.
+
+        mins: Sequence[Union[float, int, Decimal]]
+            Minimal values of alpha cuts.
+
+        maxs: Sequence[Union[float, int, Decimal]]
+            Maximal values of alpha cuts.
+
+        outward_rounding: bool
+            Round results of operations outwards. Default `False`.
+
+        Raises
+        -------
+        ValueError
+            If the arrays do not describe a valid fuzzy number.
+        """
+
+        alphas_array = np.array(alphas, dtype=np.float64)
+        mins_array = np.array(mins, dtype=np.float64)
+        maxs_array = np.array(maxs, dtype=np.float64)
+
+        if alphas_array.ndim != 1 or mins_array.shape != alphas_array.shape or maxs_array.shape != alphas_array.shape:
+            raise ValueError(
+                "`alphas`, `mins` and `maxs` must be one dimensional and of same length. "
+                f"Currently the shapes are {alphas_array.shape}, {mins_array.shape} and {maxs_array.shape}."
+            )
+
+        if alphas_array.size < 2 or alphas_array[0] != 0 or alphas_array[-1] != 1:
+            raise ValueError("`alphas` must start with 0 alpha value and end with 1 alpha value.")
+
+        if not np.all(np.diff(alphas_array) > 0):
+            raise ValueError("Values in `alphas` must be unique and sorted in ascending order.")
+
+        if np.any(np.isnan(mins_array)) or np.any(np.isnan(maxs_array)):
+            raise ValueError("Values in `mins` and `maxs` must not be NaN.")
+
+        if np.any(mins_array > maxs_array):
+            raise ValueError("Each value in `mins` has to be lower or equal to respective value in `maxs`.")
+
+        if np.any(np.diff(mins_array) < 0) or np.any(np.diff(maxs_array) > 0):
+            raise ValueError("Interval on lower alpha level has to contain the higher level alpha cuts.")
+
+        self._set_arrays(alphas_array, mins_array, maxs_array, outward_rounding)
+
+    def _set_arrays(
+        self, alphas: np.ndarray, mins: np.ndarray, maxs: np.ndarray, outward_rounding: bool = False
+    ) -> None:
+        alphas.flags.writeable = False
+        mins.flags.writeable = False
+        maxs.flags.writeable = False
+
+        self._alphas = alphas
+        self._mins = mins
+        self._maxs = maxs
+        self._outward_rounding = outward_rounding
+
+    @classmethod
+    def _from_arrays(
+        cls, alphas: np.ndarray, mins: np.ndarray, maxs: np.ndarray, outward_rounding: bool = False
+    ) -> FuzzyNumberFloat:
+        """
+        Creates the object from arrays that are known to be valid (results of internal operations) without any
+        validation.
+
+        Parameters
+        ----------
+        alphas: np.ndarray
+        mins: np.ndarray
+        maxs: np.ndarray
+        outward_rounding: bool
+
+        Returns
+        -------
+        FuzzyNumberFloat
+        """
+        fuzzy_number = cls.__new__(cls)
+        fuzzy_number._set_arrays(alphas, mins, maxs, outward_rounding)  # pylint: disable=W0212
+        return fuzzy_number
+
+    @classmethod
+    def from_fuzzy_number(cls, fuzzy_number: FuzzyNumber, outward_rounding: bool = False) -> FuzzyNumberFloat:
+        """
+        Converts `FuzzyNumber` into `FuzzyNumberFloat`.
+
+        Parameters
+        ----------
+        fuzzy_number: FuzzyNumber
+
+        outward_rounding: bool
+            Round results of operations outwards. With outward rounding (or if enabled in `FuzzyMathPrecision`) the
+            bounds of alpha cuts that cannot be represented as float are rounded outwards as well. Default `False`.
+
+        Returns
+        -------
+        FuzzyNumberFloat
+        """
+        if not isinstance(fuzzy_number, FuzzyNumber):
+            raise TypeError(f"`fuzzy_number` must be `FuzzyNumber`. It is `{type(fuzzy_number).__name__}`.")
+
+        alphas = np.array(fuzzy_number.alpha_levels, dtype=np.float64)
+
+        if outward_rounding or FuzzyMathPrecision.current().outward_rounding:
+            alpha_cuts = IntervalArray.from_intervals(fuzzy_number.alpha_cuts, outward_rounding)
+            return cls._from_interval_array(alphas, alpha_cuts)
+
+        return cls._from_arrays(
+            alphas,
+            np.array(fuzzy_number.get_alpha_cuts_mins(), dtype=np.float64),
+            np.array(fuzzy_number.get_alpha_cuts_maxs(), dtype=np.float64),
+        )
+
+    def to_fuzzy_number(self) -> FuzzyNumber:
+        """
+        Converts this object into `FuzzyNumber`. Alphas and values are converted to `Decimal` using the shortest
+        representation of the floats, so `FuzzyNumber` converted to `FuzzyNumberFloat` and back is equal to the original
+        one. With outward rounding the values are converted exactly as they are stored in floats and any rounding to
+        `Decimal` precision is done outwards.
+
+        Returns
+        -------
+        FuzzyNumber
+        """
+        return FuzzyNumber._from_trusted(  # pylint: disable=W0212
+            self._decimal_alphas(self._alphas),
+            self.alpha_cuts.to_intervals(),
+        )
+
+    @staticmethod
+    def _decimal_alphas(alphas: np.ndarray) -> AlphaGrid:
+        """
+        Converts valid float alphas into shared grid of `Decimal` alphas, using the shortest representation of the
+        floats and current alpha precision.
+        """
+        values = [FuzzyMathPrecision.prepare_alpha(Decimal(repr(alpha))) for alpha in alphas.tolist()]
+
+        if any(low >= high for low, high in zip(values, values[1:])):
+            raise ValueError(
+                "Alpha precision is too low to represent alpha levels as unique `Decimal` values. "
+                f"Alpha levels are {alphas.tolist()}."
+            )
+
+        return AlphaGrid.intern(values)
+
+    @property
+    def outward_rounding(self) -> bool:
+        """
+        Are results of operations with this fuzzy number rounded outwards?
+
+        Returns
+        -------
+        bool
+        """
+        return self._outward_rounding
+
+    @property
+    def alpha_levels(self) -> np.ndarray:
+        """
+        Alpha levels for this fuzzy number.
+
+        Returns
+        -------
+        np.ndarray
+        """
+        return self._alphas
+
+    @property
+    def mins(self) -> np.ndarray:
+        """
+        Minimal values of alpha cuts, ordered by alpha levels.
+
+        Returns
+        -------
+        np.ndarray
+        """
+        return self._mins
+
+    @property
+    def maxs(self) -> np.ndarray:
+        """
+        Maximal values of alpha cuts, ordered by alpha levels.
+
+        Returns
+        -------
+        np.ndarray
+        """
+        return self._maxs
+
+    @property
+    def min(self) -> float:
+        """
+        Minimal value of this fuzzy number.
+
+        Returns
+        -------
+        float
+        """
+        return float(self._mins[0])
+
+    @property
+    def max(self) -> float:
+        """
+        Maximal value of this fuzzy number.
+
+        Returns
+        -------
+        float
+        """
+        return float(self._maxs[0])
+
+    @property
+    def kernel_min(self) -> float:
+        """
+        Minimal kernel value of this fuzzy number.
+
+        Returns
+        -------
+        float
+        """
+        return float(self._mins[-1])
+
+    @property
+    def kernel_max(self) -> float:
+        """
+        Maximal kernel value of this fuzzy number.
+
+        Returns
+        -------
+        float
+        """
+        return float(self._maxs[-1])
+
+    def get_alpha_cut(self, alpha: Union[str, int, float, Decimal]) -> Tuple[float, float]:
+        """
+        Extracts alpha cut specified by `alpha` variable, linear interpolation is used for alphas that are not stored.
+
+        Parameters
+        ----------
+        alpha: Union[str, int, float, Decimal]
+            Value of alpha to extract alpha cut for. Must be from range [0, 1].
+
+        Returns
+        -------
+        Tuple[float, float]
+            Minimum and maximum of the alpha cut.
+        """
+        alpha = float(FuzzyNumber._validate_alpha(alpha))  # pylint: disable=W0212
+
+        alpha_cuts = self._interpolate(np.array([alpha]), self._outward_rounding)
+
+        return float(alpha_cuts._mins[0]), float(alpha_cuts._maxs[0])  # pylint: disable=W0212
+
+    def __repr__(self) -> str:
+        """
+        Complete representation of fuzzy number, same format as `FuzzyNumber`.
+
+        Returns
+        -------
+        str
+        """
+        return "".join(
+            f"({alpha};{a},{b})" for alpha, a, b in zip(self._alphas.tolist(), self._mins.tolist(), self._maxs.tolist())
+        )
+
+    def __str__(self) -> str:
+        """
+        Simplified representation of fuzzy number.
+
+        Returns
+        -------
+        str
+        """
+        return (
+            f"Fuzzy number (float) with support ({self.min},{self.max}), kernel ({self.kernel_min}, {self.kernel_max}) "
+            f"and {len(self) - 2} more alpha-cuts."
+        )
+
+    def __len__(self) -> int:
+        return int(self._alphas.size)
+
+    def __contains__(self, item) -> bool:
+        if isinstance(item, (int, float, Decimal)):
+            return self.min <= item <= self.max
+        elif isinstance(item, FuzzyNumberFloat):
+            return self.min <= item.min and item.max <= self.max
+        else:
+            raise TypeError(
+                f"Cannot test if object of type `{type(item).__name__}` is in FuzzyNumberFloat. Only implemented for "
+                "`float`, `int`, `Decimal` and `FuzzyNumberFloat`."
+            )
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, FuzzyNumberFloat):
+            return (
+                np.array_equal(self._alphas, other._alphas)
+                and np.array_equal(self._mins, other._mins)
+                and np.array_equal(self._maxs, other._maxs)
+            )
+        else:
+            return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self._alphas.tobytes(), self._mins.tobytes(), self._maxs.tobytes()))
+
+    @property
+    def alpha_cuts(self) -> IntervalArray:
+        """
+        Alpha cuts of this fuzzy number as `IntervalArray`, ordered by alpha levels.
+
+        Returns
+        -------
+        IntervalArray
+        """
+        return IntervalArray._from_arrays(self._mins, self._maxs, self._outward_rounding)  # pylint: disable=W0212
+
+    @classmethod
+    def _from_interval_array(cls, alphas: np.ndarray, alpha_cuts: IntervalArray) -> FuzzyNumberFloat:
+        return cls._from_arrays(alphas, alpha_cuts.mins, alpha_cuts.maxs, alpha_cuts.outward_rounding)
+
+    def _operands(self, other) -> Tuple[np.ndarray, IntervalArray, Union[IntervalArray, float]]:
+        """
+        Prepares this fuzzy number and `other` operand on common alpha levels, missing alpha cuts are linearly
+        interpolated (and rounded outwards, if outward rounding is used).
+
+        Returns
+        -------
+        (np.ndarray, IntervalArray, Union[IntervalArray, float])
+            Alphas, alpha cuts of this fuzzy number and alpha cuts of `other` (or scalar `other` itself).
+        """
+        if not isinstance(other, FuzzyNumberFloat):
+            return self._alphas, self.alpha_cuts, float(other)
+
+        if self._alphas is other._alphas or np.array_equal(self._alphas, other._alphas):
+            return self._alphas, self.alpha_cuts, other.alpha_cuts
+
+        alphas = np.union1d(self._alphas, other._alphas)
+
+        return (
+            alphas,
+            self._interpolate(alphas, self._outward_rounding or other._outward_rounding),
+            other._interpolate(alphas, self._outward_rounding or other._outward_rounding),
+        )
+
+    def _interpolate(self, alphas: np.ndarray, outward_rounding: bool) -> IntervalArray:
+        """
+        Linearly interpolates alpha cuts onto `alphas`.
+        """
+        mins = np.interp(alphas, self._alphas, self._mins)
+        maxs = np.interp(alphas, self._alphas, self._maxs)
+
+        if outward_rounding or FuzzyMathPrecision.current().outward_rounding:
+            lower = np.searchsorted(self._alphas, alphas, side="right") - 1
+            upper = np.minimum(lower + 1, self._alphas.size - 1)
+            mins = IntervalArray._enclosing_interpolation(  # pylint: disable=W0212
+                mins, self._mins[lower], self._mins[upper], True
+            )
+            maxs = IntervalArray._enclosing_interpolation(  # pylint: disable=W0212
+                maxs, self._maxs[lower], self._maxs[upper], False
+            )
+
+        return IntervalArray._from_arrays(mins, maxs, outward_rounding)  # pylint: disable=W0212
+
+    def __add__(self, other) -> FuzzyNumberFloat:
+        if not isinstance(other, (int, float, FuzzyNumberFloat)):
+            return NotImplemented
+
+        alphas, x, y = self._operands(other)
+        return FuzzyNumberFloat._from_interval_array(alphas, x + y)
+
+    def __radd__(self, other) -> FuzzyNumberFloat:
+        if not isinstance(other, (int, float)):
+            return NotImplemented
+        return self + other
+
+    def __sub__(self, other) -> FuzzyNumberFloat:
+        if not isinstance(other, (int, float, FuzzyNumberFloat)):
+            return NotImplemented
+
+        alphas, x, y = self._operands(other)
+        return FuzzyNumberFloat._from_interval_array(alphas, x - y)
+
+    def __rsub__(self, other) -> FuzzyNumberFloat:
+        if not isinstance(other, (int, float)):
+            return NotImplemented
+
+        return FuzzyNumberFloat._from_interval_array(self._alphas, float(other) - self.alpha_cuts)
+
+    def __mul__(self, other) -> FuzzyNumberFloat:
+        if not isinstance(other, (int, float, FuzzyNumberFloat)):
+            return NotImplemented
+
+        alphas, x, y = self._operands(other)
+        return FuzzyNumberFloat._from_interval_array(alphas, x * y)
+
+    def __rmul__(self, other) -> FuzzyNumberFloat:
+        if not isinstance(other, (int, float)):
+            return NotImplemented
+        return self * other
+
+    def __truediv__(self, other) -> FuzzyNumberFloat:
+        if not isinstance(other, (int, float, FuzzyNumberFloat)):
+            return NotImplemented
+
+        if isinstance(other, FuzzyNumberFloat):
+            if 0 in other:
+                raise ArithmeticError("Cannot divide by FuzzyNumberFloat that contains 0.")
+
+        elif other == 0:
+            raise ArithmeticError("Cannot divide by 0.")
+
+        alphas, x, y = self._operands(other)
+        return FuzzyNumberFloat._from_interval_array(alphas, x / y)
+
+    def __rtruediv__(self, other) -> FuzzyNumberFloat:
+        if not isinstance(other, (int, float)):
+            return NotImplemented
+
+        if 0 in self:
+            raise ArithmeticError("Cannot divide by FuzzyNumberFloat that contains 0.")
+
+        return FuzzyNumberFloat._from_interval_array(self._alphas, float(other) / self.alpha_cuts)
+
+    def __pow__(self, power) -> FuzzyNumberFloat:
+        if not isinstance(power, int):
+            return NotImplemented
+
+        return FuzzyNumberFloat._from_interval_array(self._alphas, self.alpha_cuts**power)
+
+    def __neg__(self) -> FuzzyNumberFloat:
+        return FuzzyNumberFloat._from_interval_array(self._alphas, -self.alpha_cuts)
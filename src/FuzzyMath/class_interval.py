@@ -2,10 +2,10 @@
 from __future__ import annotations
 
 import math
-from decimal import Decimal, InvalidOperation
+from decimal import Decimal, InvalidOperation, getcontext
 from inspect import BoundArguments, signature
 from types import BuiltinFunctionType, FunctionType
-from typing import Callable, Union
+from typing import Callable, Dict, Optional, Union
 
 import numpy as np
 
@@ -28,10 +28,20 @@ class Interval:
 
     _degenerate: bool
         Is the interval degenerate? Degenerate interval have _min == _max.
+
+    _adaptive_segments: int
+        Class wide number of segments of coarse sampling used by adaptive `apply_function()`.
+
+    _adaptive_iterations: int
+        Class wide maximal number of golden-section iterations per extremum used by adaptive `apply_function()`.
     """
 
     __slots__ = ("_min", "_max", "_degenerate")
 
+    _adaptive_segments: int = 32
+
+    _adaptive_iterations: int = 100
+
     def __init__(self, a: Union[str, int, float, Decimal], b: Union[str, int, float, Decimal]):
         """
         Default constructor of interval. But generally it is more useful to use functions
@@ -44,13 +54,15 @@ class Interval:
         b: Union[str, int, float, Decimal]
         """
 
+        context = FuzzyMathPrecision.get_decimal_context()
+
         try:
-            a = FuzzyMathPrecision.prepare_number(Decimal(a)).normalize()
+            a = FuzzyMathPrecision.prepare_number(Decimal(a)).normalize(context)
         except InvalidOperation as e:
             raise InvalidOperation(f"Cannot convert value `{a}` to number.") from e
 
         try:
-            b = FuzzyMathPrecision.prepare_number(Decimal(b)).normalize()
+            b = FuzzyMathPrecision.prepare_number(Decimal(b)).normalize(context)
         except InvalidOperation as e:
             raise InvalidOperation(f"Cannot convert value `{b}` to number.") from e
 
@@ -66,6 +78,38 @@ class Interval:
         if self._min == self._max:
             self._degenerate = True
 
+    @classmethod
+    def _from_ordered(cls, minimum: Decimal, maximum: Decimal) -> Interval:
+        """
+        Fast creator for internal use. Skips conversion to `Decimal`, NaN check and ordering of values, so the caller has
+        to guarantee that both values are `Decimal`s and that `minimum <= maximum` (or both are NaN). Numeric precision
+        and normalization (in FuzzyMath decimal context) are applied the same way as in `__init__`.
+
+        Parameters
+        ----------
+        minimum: Decimal
+        maximum: Decimal
+
+        Returns
+        -------
+        Interval
+        """
+        settings = FuzzyMathPrecision.current()
+
+        if settings.numeric_precision is not None:
+            minimum = minimum.quantize(settings.numeric_precision)
+            maximum = maximum.quantize(settings.numeric_precision)
+
+        context = settings.decimal_context
+        if context is None:
+            context = getcontext()
+
+        interval = cls.__new__(cls)
+        interval._min = minimum.normalize(context)  # pylint: disable=W0212
+        interval._max = maximum.normalize(context)  # pylint: disable=W0212
+        interval._degenerate = interval._min == interval._max  # pylint: disable=W0212
+        return interval
+
     def __repr__(self):
         """
         Representation of Interval.
@@ -118,7 +162,7 @@ class Interval:
         -------
         Decimal
         """
-        return self._max - self._min
+        return FuzzyMathPrecision.get_decimal_context().subtract(self._max, self._min)
 
     @property
     def mid_point(self) -> Decimal:
@@ -132,7 +176,8 @@ class Interval:
         if self.degenerate:
             return self._min
         else:
-            return (self._min + self.max) / 2
+            context = FuzzyMathPrecision.get_decimal_context()
+            return context.divide(context.add(self._min, self._max), 2)
 
     @property
     def is_empty(self) -> bool:
@@ -194,7 +239,7 @@ class Interval:
             If this and other `Interval`s do not intersect.
         """
         if self.intersects(other):
-            return Interval(max(self.min, other.min), min(self.max, other.max))
+            return Interval._from_ordered(max(self.min, other.min), min(self.max, other.max))
         else:
             raise ArithmeticError(f"Intervals `{self}` and `{other}` do not intersect, cannot construct intersection.")
 
@@ -216,7 +261,7 @@ class Interval:
             If this and other `Interval`s do not intersect.
         """
         if self.intersects(other):
-            return Interval(min(self.min, other.min), max(self.max, other.max))
+            return Interval._from_ordered(min(self.min, other.min), max(self.max, other.max))
         else:
             raise ArithmeticError(f"Intervals `{self}` and `{other}` do not intersect, cannot construct valid union.")
 
@@ -232,7 +277,7 @@ class Interval:
         -------
         Interval
         """
-        return Interval(min(self.min, other.min), max(self.max, other.max))
+        return Interval._from_ordered(min(self.min, other.min), max(self.max, other.max))
 
     def is_negative(self) -> bool:
         """
@@ -285,14 +330,21 @@ class Interval:
         return 0 <= self.mid_point
 
     def apply_function(
-        self, function: Callable, *args, monotone: bool = False, number_elements: Union[float, Decimal] = 1000, **kwargs
+        self,
+        function: Callable,
+        *args,
+        monotone: bool = False,
+        number_elements: Union[float, Decimal] = 1000,
+        vectorized: bool = False,
+        tolerance: Optional[Union[float, Decimal]] = None,
+        **kwargs,
     ) -> Interval:
         """
         Apply mathematical function to interval.
 
         Parameters
         ----------
-        function: (FunctionType, BuiltinFunctionType)
+        function: (FunctionType, BuiltinFunctionType, np.ufunc)
             Function to apply to fuzzy number.
 
         args
@@ -304,6 +356,16 @@ class Interval:
         number_elements: int
             Number of elements to divide fuzzy number into, if the function is not monotone. Default is `1000`.
 
+        vectorized: bool
+            Does the `function` accept NumPy array of floats and return array of results? If `True`, the function is
+            called only once with all the elements as float array. NumPy ufuncs are always treated as vectorized.
+            Default `False`.
+
+        tolerance: Optional[Union[float, Decimal]]
+            If provided (and the function is not monotone), adaptive sampling is used instead of `number_elements`
+            elements. Coarse sampling detects monotone segments of the function and every local extremum is located by
+            golden-section search, until the bounds of the result change by less than `tolerance`. Default `None`.
+
         kwargs
             Named arguments to pass into `function`.
 
@@ -313,9 +375,23 @@ class Interval:
             New `Interval`.
         """
 
-        if not isinstance(function, (FunctionType, BuiltinFunctionType)):
+        if not isinstance(function, (FunctionType, BuiltinFunctionType, np.ufunc)):
             raise TypeError(f"`function` needs to be a function. It is `{type(function).__name__}`.")
 
+        if tolerance is not None and not monotone:
+            Interval._validate_tolerance(tolerance)
+
+            evaluate = Interval._evaluator(function, args, kwargs, vectorized)
+
+            results = list(self._adaptive_samples(evaluate, tolerance).values())
+
+            return Interval(min(results), max(results))
+
+        if vectorized or isinstance(function, np.ufunc):
+            results = np.asarray(function(self._sample_floats(monotone, number_elements), *args, **kwargs))
+
+            return Interval(float(results.min()), float(results.max()))
+
         if self.degenerate:
             elements = [self.min]
         elif monotone:
@@ -325,23 +401,189 @@ class Interval:
 
             elements = np.arange(self.min, self.max + (Decimal(0.1) * step), step=step).tolist()
 
-        function_signature = signature(function)
+        results = Interval._evaluate(function, elements, args, kwargs, vectorized=False)
 
-        results = [0] * len(elements)
+        return Interval(min(results), max(results))
 
-        for i, element in enumerate(elements):
-            bound_params: BoundArguments = function_signature.bind(element, *args, **kwargs)
-            bound_params.apply_defaults()
+    @staticmethod
+    def _evaluator(function: Callable, args: tuple, kwargs: dict, vectorized: bool) -> Callable[[list], list]:
+        """
+        Prepares function that evaluates `function` for list of elements. Arguments are bound to the function signature
+        only once. Vectorized functions (and NumPy ufuncs) are called only once per list with elements as float array.
 
-            results[i] = function(*bound_params.args, **bound_params.kwargs)
+        Parameters
+        ----------
+        function: Callable
 
-        return Interval(min(results), max(results))
+        args: tuple
+            Positional arguments for the `function`, after the element.
+
+        kwargs: dict
+            Named arguments for the `function`.
+
+        vectorized: bool
+
+        Returns
+        -------
+        Callable[[list], list]
+            Function that returns results in the same order as elements.
+        """
+        if vectorized or isinstance(function, np.ufunc):
+
+            def evaluate_vectorized(elements: list) -> list:
+                values = np.array([float(element) for element in elements], dtype=np.float64)
+                return np.asarray(function(values, *args, **kwargs), dtype=np.float64).tolist()
+
+            return evaluate_vectorized
+
+        # bind the arguments only once, the first argument is replaced by the elements
+        bound_params: BoundArguments = signature(function).bind(Decimal(0), *args, **kwargs)
+        bound_params.apply_defaults()
+
+        other_args = bound_params.args[1:]
+        other_kwargs = bound_params.kwargs
+
+        def evaluate(elements: list) -> list:
+            return [function(element, *other_args, **other_kwargs) for element in elements]
+
+        return evaluate
+
+    @staticmethod
+    def _evaluate(function: Callable, elements: list, args: tuple, kwargs: dict, vectorized: bool) -> list:
+        """
+        Evaluates `function` for all `elements`, see `Interval._evaluator()`.
+
+        Returns
+        -------
+        list
+            Results in the same order as `elements`.
+        """
+        return Interval._evaluator(function, args, kwargs, vectorized)(elements)
+
+    @staticmethod
+    def _validate_tolerance(tolerance: Union[float, Decimal]) -> None:
+        if not isinstance(tolerance, (int, float, Decimal)) or not tolerance > 0:
+            raise ValueError(f"`tolerance` must be positive number. It is `{tolerance}`.")
+
+    def _adaptive_samples(self, evaluate: Callable[[list], list], tolerance: Union[float, Decimal]) -> Dict:
+        """
+        Adaptive sampling of the interval. The interval is sampled by `_adaptive_segments` segments, every sample that
+        is local extremum (direction of the function changes around it) is refined by golden-section search between
+        its neighbours.
+
+        Parameters
+        ----------
+        evaluate: Callable[[list], list]
+            Function prepared by `Interval._evaluator()`.
+
+        tolerance: Union[float, Decimal]
+            Maximal change of the located extremum at which the search stops.
+
+        Returns
+        -------
+        Dict
+            All evaluated elements and their results.
+        """
+        if self.degenerate:
+            return dict(zip([self._min], evaluate([self._min])))
+
+        step = (self._max - self._min) / Decimal(self._adaptive_segments)
+
+        elements = [self._min + step * i for i in range(self._adaptive_segments)] + [self._max]
+        results = evaluate(elements)
+
+        samples = dict(zip(elements, results))
+
+        for i in range(1, len(elements) - 1):
+            if results[i - 1] == results[i] == results[i + 1]:
+                continue
+
+            for sign in (1, -1):
+                if sign * results[i] >= sign * results[i - 1] and sign * results[i] >= sign * results[i + 1]:
+                    Interval._golden_section(
+                        evaluate,
+                        elements[i - 1],
+                        elements[i + 1],
+                        results[i - 1],
+                        results[i + 1],
+                        sign,
+                        tolerance,
+                        samples,
+                    )
+
+        return samples
+
+    @staticmethod
+    def _golden_section(
+        evaluate: Callable[[list], list],
+        a: Decimal,
+        b: Decimal,
+        result_a,
+        result_b,
+        sign: int,
+        tolerance: Union[float, Decimal],
+        samples: Dict,
+    ) -> None:
+        """
+        Golden-section search of maximum (`sign` 1) or minimum (`sign` -1) bracketed by `a` and `b`. Evaluated elements
+        are stored into `samples`. Stops when results within the bracket differ by less than `tolerance`.
+        """
+        ratio = (Decimal(5).sqrt() - 1) / 2
+
+        c = b - ratio * (b - a)
+        d = a + ratio * (b - a)
+        result_c, result_d = evaluate([c, d])
+        samples[c] = result_c
+        samples[d] = result_d
+
+        for _ in range(Interval._adaptive_iterations):
+            best = max(sign * result_c, sign * result_d)
+
+            if best - min(sign * result_a, sign * result_b) <= tolerance:
+                break
+
+            if sign * result_c > sign * result_d:
+                b, result_b = d, result_d
+                d, result_d = c, result_c
+                c = b - ratio * (b - a)
+                (result_c,) = evaluate([c])
+                samples[c] = result_c
+            else:
+                a, result_a = c, result_c
+                c, result_c = d, result_d
+                d = a + ratio * (b - a)
+                (result_d,) = evaluate([d])
+                samples[d] = result_d
+
+    def _sample_floats(self, monotone: bool, number_elements: Union[float, Decimal]) -> np.ndarray:
+        """
+        Elements of the interval used by `apply_function()` as float array. Same elements as in the non vectorized
+        variant, only as floats.
+
+        Returns
+        -------
+        np.ndarray
+        """
+        if self.degenerate:
+            return np.array([float(self._min)])
+
+        if monotone:
+            return np.array([float(self._min), float(self._max)])
+
+        step = (self._max - self._min) / Decimal(number_elements)
+
+        count = math.ceil((self._max - self._min) / step + Decimal("0.1"))
+
+        return float(self._min) + float(step) * np.arange(count, dtype=np.float64)
 
     def __add__(self, other) -> Interval:
+        context = FuzzyMathPrecision.get_decimal_context()
+
         if isinstance(other, (float, int, Decimal)):
-            return Interval(self.min + Decimal(other), self.max + Decimal(other))
+            value = Decimal(other)
+            return Interval._from_ordered(context.add(self._min, value), context.add(self._max, value))
         elif isinstance(other, Interval):
-            return Interval(self.min + other.min, self.max + other.max)
+            return Interval._from_ordered(context.add(self._min, other._min), context.add(self._max, other._max))
         else:
             return NotImplemented
 
@@ -349,31 +591,42 @@ class Interval:
         return self + other
 
     def __sub__(self, other) -> Interval:
+        context = FuzzyMathPrecision.get_decimal_context()
+
         if isinstance(other, (float, int, Decimal)):
-            return Interval(self.min - Decimal(other), self.max - Decimal(other))
+            value = Decimal(other)
+            return Interval._from_ordered(context.subtract(self._min, value), context.subtract(self._max, value))
         elif isinstance(other, Interval):
-            return Interval(self.min - other.max, self.max - other.min)
+            return Interval._from_ordered(
+                context.subtract(self._min, other._max), context.subtract(self._max, other._min)
+            )
         else:
             return NotImplemented
 
     def __rsub__(self, other) -> Interval:
+        context = FuzzyMathPrecision.get_decimal_context()
+
         if isinstance(other, (float, int, Decimal)):
-            return Interval(Decimal(other) - self.min, Decimal(other) - self.max)
+            value = Decimal(other)
+            return Interval._from_ordered(context.subtract(value, self._max), context.subtract(value, self._min))
         else:
             return NotImplemented
 
     def __mul__(self, other) -> Interval:
+        context = FuzzyMathPrecision.get_decimal_context()
+
         if isinstance(other, (float, int, Decimal)):
+            value = Decimal(other)
+            values = [context.multiply(self._min, value), context.multiply(self._max, value)]
+            return Interval._from_ordered(min(values), max(values))
+        elif isinstance(other, Interval):
             values = [
-                self.min * Decimal(other),
-                self.min * Decimal(other),
-                self.max * Decimal(other),
-                self.max * Decimal(other),
+                context.multiply(self._min, other._min),
+                context.multiply(self._min, other._max),
+                context.multiply(self._max, other._min),
+                context.multiply(self._max, other._max),
             ]
-            return Interval(min(values), max(values))
-        elif isinstance(other, Interval):
-            values = [self.min * other.min, self.min * other.max, self.max * other.min, self.max * other.max]
-            return Interval(min(values), max(values))
+            return Interval._from_ordered(min(values), max(values))
         else:
             return NotImplemented
 
@@ -381,48 +634,51 @@ class Interval:
         return self * other
 
     def __truediv__(self, other) -> Interval:
+        context = FuzzyMathPrecision.get_decimal_context()
+
         if isinstance(other, (float, int, Decimal)):
             if other == 0:
                 raise ArithmeticError("Cannot divide by 0.")
 
-            values = [
-                self.min / Decimal(other),
-                self.min / Decimal(other),
-                self.max / Decimal(other),
-                self.max / Decimal(other),
-            ]
+            value = Decimal(other)
+            values = [context.divide(self._min, value), context.divide(self._max, value)]
 
-            return Interval(min(values), max(values))
+            return Interval._from_ordered(min(values), max(values))
 
         elif isinstance(other, Interval):
             if 0 in other:
                 raise ArithmeticError(f"Cannot divide by interval that contains `0`. The interval is `{other}`.")
 
-            values = [self.min / other.min, self.min / other.max, self.max / other.min, self.max / other.max]
+            values = [
+                context.divide(self._min, other._min),
+                context.divide(self._min, other._max),
+                context.divide(self._max, other._min),
+                context.divide(self._max, other._max),
+            ]
 
-            return Interval(min(values), max(values))
+            return Interval._from_ordered(min(values), max(values))
 
         else:
             return NotImplemented
 
     def __rtruediv__(self, other) -> Interval:
+        context = FuzzyMathPrecision.get_decimal_context()
+
         if isinstance(other, (float, int, Decimal)):
-            values = [
-                Decimal(other) / self.min,
-                Decimal(other) / self.min,
-                Decimal(other) / self.max,
-                Decimal(other) / self.max,
-            ]
+            value = Decimal(other)
+            values = [context.divide(value, self._min), context.divide(value, self._max)]
 
-            return Interval(min(values), max(values))
+            return Interval._from_ordered(min(values), max(values))
 
         else:
             return NotImplemented
 
     def __pow__(self, power) -> Interval:
         if isinstance(power, int):
-            min_power = self.min ** Decimal(power)
-            max_power = self.max ** Decimal(power)
+            context = FuzzyMathPrecision.get_decimal_context()
+
+            min_power = context.power(self.min, Decimal(power))
+            max_power = context.power(self.max, Decimal(power))
 
             if (power % 2) == 0:
                 if self.min <= 0 <= self.max:
@@ -437,7 +693,7 @@ class Interval:
                 min_res = min(min_power, max_power)
                 max_res = max(min_power, max_power)
 
-            return Interval(min_res, max_res)
+            return Interval._from_ordered(min_res, max_res)
 
         else:
             return NotImplemented
@@ -447,7 +703,7 @@ class Interval:
     #                                math.fabs(self.max), precision=self.precision)
 
     def __neg__(self) -> Interval:
-        return Interval(self.min * (-1), self.max * (-1))
+        return Interval._from_ordered(-self._max, -self._min)
 
     def __eq__(self, other) -> bool:
         if isinstance(other, Interval):
@@ -0,0 +1,612 @@
+"""Class IntervalArray"""
+from __future__ import annotations
+
+import math
+from decimal import ROUND_CEILING, ROUND_FLOOR, Decimal, localcontext
+from typing import Iterable, List, Tuple, Union
+
+import numpy as np
+
+from .class_interval import Interval
+from .class_precision import FuzzyMathPrecision
+
+
+class IntervalArray:
+    """
+    Array of intervals stored as two float64 NumPy arrays of the same shape. Implements the same semantics as `Interval`
+    element-wise, predicates return boolean masks instead of single `bool`.
+
+    With outward rounding (set for the object or enabled by `FuzzyMathPrecision.set_outward_rounding()`) the minimums of
+    results are rounded down and the maximums up to the neighbouring float, so the result always contains the exact
+    result of the operation. Conversions from and to `Decimal` are rounded outwards as well.
+    ...
+    Attributes
+    ----------
+    _mins: np.ndarray
+        Minimal values of intervals.
+
+    _maxs: np.ndarray
+        Maximal values of intervals.
+
+    _outward_rounding: bool
+        Are results of operations with this object rounded outwards? Propagates to the results.
+    """
+
+    __slots__ = ("_mins", "_maxs", "_outward_rounding")
+
+    # make NumPy defer binary operators with arrays of scalars to this class
+    __array_ufunc__ = None
+
+    def __init__(
+        self,
+        a: Union[np.ndarray, Iterable, float, int],
+        b: Union[np.ndarray, Iterable, float, int],
+        outward_rounding: bool = False,
+    ):
+        """
+        Default constructor. As for `Interval` the values `a` and `b` are ordered element-wise into minimum and maximum
+        and if any of them is NaN the respective interval is empty.
+
+        Parameters
+        ----------
+        a: Union[np.ndarray, Iterable, float, int]
+        b: Union[np.ndarray, Iterable, float, int]
+
+        outward_rounding: bool
+            Round results of operations outwards. Default `False`.
+        """
+        a_array = np.array(a, dtype=np.float64)
+        b_array = np.array(b, dtype=np.float64)
+
+        if a_array.shape != b_array.shape:
+            raise ValueError(
+                f"Values `a` and `b` must be of same shape. Currently the shapes are {a_array.shape} and {b_array.shape}."
+            )
+
+        empty = np.isnan(a_array) | np.isnan(b_array)
+
+        self._mins = np.where(empty, np.nan, np.minimum(a_array, b_array))
+        self._maxs = np.where(empty, np.nan, np.maximum(a_array, b_array))
+        self._outward_rounding = outward_rounding
+
+    @classmethod
+    def _from_arrays(cls, mins: np.ndarray, maxs: np.ndarray, outward_rounding: bool = False) -> IntervalArray:
+        """
+        Creates the object from arrays that are known to be ordered (results of internal operations) without any
+        validation or copying.
+
+        Parameters
+        ----------
+        mins: np.ndarray
+        maxs: np.ndarray
+        outward_rounding: bool
+
+        Returns
+        -------
+        IntervalArray
+        """
+        intervals = cls.__new__(cls)
+        intervals._mins = mins  # pylint: disable=W0212
+        intervals._maxs = maxs  # pylint: disable=W0212
+        intervals._outward_rounding = outward_rounding  # pylint: disable=W0212
+        return intervals
+
+    @classmethod
+    def from_intervals(cls, intervals: Iterable[Interval], outward_rounding: bool = False) -> IntervalArray:
+        """
+        Creates `IntervalArray` from `Interval`s.
+
+        Parameters
+        ----------
+        intervals: Iterable[Interval]
+
+        outward_rounding: bool
+            Round results of operations outwards. With outward rounding (or if enabled in `FuzzyMathPrecision`) the
+            values that cannot be represented as float are rounded outwards as well. Default `False`.
+
+        Returns
+        -------
+        IntervalArray
+        """
+        if outward_rounding or FuzzyMathPrecision.current().outward_rounding:
+            values = [cls._enclosing_floats(interval.min, interval.max) for interval in intervals]
+        else:
+            values = [(float(interval.min), float(interval.max)) for interval in intervals]
+
+        array = np.array(values, dtype=np.float64).reshape(-1, 2)
+        return cls._from_arrays(array[:, 0].copy(), array[:, 1].copy(), outward_rounding)
+
+    def to_intervals(self) -> List[Interval]:
+        """
+        Converts the array into list of `Interval`s (flattened). The bounds are converted using the shortest
+        representation of the floats. With outward rounding the bounds are converted exactly and rounded outwards, if
+        they do not fit into the `Decimal` precision.
+
+        Returns
+        -------
+        List[Interval]
+        """
+        mins = self._mins.ravel().tolist()
+        maxs = self._maxs.ravel().tolist()
+
+        if self._rounds():
+            return [self._enclosing_interval(a, b) for a, b in zip(mins, maxs)]
+
+        return [Interval(repr(a), repr(b)) for a, b in zip(mins, maxs)]
+
+    @staticmethod
+    def _enclosing_floats(
+        minimum: Union[Decimal, int, float], maximum: Union[Decimal, int, float]
+    ) -> Tuple[float, float]:
+        """
+        Converts bounds into floats, rounding them outwards if they are not representable as float.
+        """
+        low = float(minimum)
+        high = float(maximum)
+
+        if not math.isnan(low) and Decimal(low) > minimum:
+            low = float(np.nextafter(low, -np.inf))
+
+        if not math.isnan(high) and Decimal(high) < maximum:
+            high = float(np.nextafter(high, np.inf))
+
+        return low, high
+
+    @staticmethod
+    def _enclosing_interval(minimum: float, maximum: float) -> Interval:
+        """
+        Converts float bounds into `Interval`, any rounding to `Decimal` precision (or numeric precision of
+        `FuzzyMathPrecision`) is done outwards.
+        """
+        if math.isnan(minimum) or math.isnan(maximum):
+            return Interval(minimum, maximum)
+
+        numeric_precision = FuzzyMathPrecision.current().numeric_precision
+
+        with localcontext() as context:
+            context.rounding = ROUND_FLOOR
+            low = Decimal(minimum).normalize()
+            if numeric_precision is not None:
+                low = low.quantize(numeric_precision)
+
+            context.rounding = ROUND_CEILING
+            high = Decimal(maximum).normalize()
+            if numeric_precision is not None:
+                high = high.quantize(numeric_precision)
+
+        return Interval._from_ordered(low, high)  # pylint: disable=W0212
+
+    @staticmethod
+    def _enclosing_interpolation(
+        values: np.ndarray, lower: np.ndarray, upper: np.ndarray, downwards: bool
+    ) -> np.ndarray:
+        """
+        Rounds values linearly interpolated in float64 between `lower` and `upper` outwards, down for minimums and up
+        for maximums. Interpolation rounds several times, its absolute error is below `8 * eps * (|lower| + |upper|)`,
+        so the values are widened by this bound. The exact value lies between `lower` and `upper`, so the widened
+        values are limited by them, which also keeps values exact on the original alpha levels.
+        """
+        error = 8 * np.finfo(np.float64).eps * (np.abs(lower) + np.abs(upper))
+
+        if downwards:
+            return np.maximum(np.nextafter(values - error, -np.inf), np.minimum(lower, upper))
+
+        return np.minimum(np.nextafter(values + error, np.inf), np.maximum(lower, upper))
+
+    def __repr__(self) -> str:
+        return f"IntervalArray(mins={self._mins!r}, maxs={self._maxs!r})"
+
+    @property
+    def outward_rounding(self) -> bool:
+        """
+        Are results of operations with this object rounded outwards?
+
+        Returns
+        -------
+        bool
+        """
+        return self._outward_rounding
+
+    def _rounds(self, other=None) -> bool:
+        """
+        Checks if operation with `other` should be rounded outwards, either because of this object, `other` or
+        `FuzzyMathPrecision` settings.
+        """
+        return (
+            self._outward_rounding
+            or (isinstance(other, IntervalArray) and other._outward_rounding)
+            or FuzzyMathPrecision.current().outward_rounding
+        )
+
+    def _result(self, mins: np.ndarray, maxs: np.ndarray, other=None) -> IntervalArray:
+        """
+        Creates result of operation with `other`, rounded outwards if needed.
+        """
+        outward_rounding = self._outward_rounding or (isinstance(other, IntervalArray) and other._outward_rounding)
+
+        if outward_rounding or FuzzyMathPrecision.current().outward_rounding:
+            mins = np.nextafter(mins, -np.inf)
+            maxs = np.nextafter(maxs, np.inf)
+
+        return IntervalArray._from_arrays(mins, maxs, outward_rounding)
+
+    @property
+    def mins(self) -> np.ndarray:
+        """
+        Minimal values of intervals.
+
+        Returns
+        -------
+        np.ndarray
+        """
+        return self._mins
+
+    @property
+    def maxs(self) -> np.ndarray:
+        """
+        Maximal values of intervals.
+
+        Returns
+        -------
+        np.ndarray
+        """
+        return self._maxs
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """
+        Shape of the array.
+
+        Returns
+        -------
+        Tuple[int, ...]
+        """
+        return self._mins.shape
+
+    def __len__(self) -> int:
+        return len(self._mins)
+
+    def __getitem__(self, index) -> Union[Interval, IntervalArray]:
+        mins = self._mins[index]
+        maxs = self._maxs[index]
+
+        if np.ndim(mins) == 0:
+            if self._rounds():
+                return self._enclosing_interval(float(mins), float(maxs))
+            return Interval(float(mins), float(maxs))
+
+        return IntervalArray._from_arrays(mins, maxs, self._outward_rounding)
+
+    @property
+    def degenerate(self) -> np.ndarray:
+        """
+        Mask of degenerate intervals (minimum == maximum).
+
+        Returns
+        -------
+        np.ndarray
+        """
+        return self._mins == self._maxs
+
+    @property
+    def width(self) -> np.ndarray:
+        """
+        Widths of intervals.
+
+        Returns
+        -------
+        np.ndarray
+        """
+        return self._maxs - self._mins
+
+    @property
+    def mid_point(self) -> np.ndarray:
+        """
+        Middle points of intervals.
+
+        Returns
+        -------
+        np.ndarray
+        """
+        return (self._mins + self._maxs) / 2
+
+    @property
+    def is_empty(self) -> np.ndarray:
+        """
+        Mask of empty intervals.
+
+        Returns
+        -------
+        np.ndarray
+        """
+        return np.isnan(self._mins) & np.isnan(self._maxs)
+
+    @staticmethod
+    def _bounds(
+        other, outward_rounding: bool = False
+    ) -> Tuple[Union[np.ndarray, np.float64], Union[np.ndarray, np.float64]]:
+        """
+        Extracts minimal and maximal values of `other` operand, scalars are treated as degenerate intervals. With
+        `outward_rounding` the values that are not representable as float are rounded outwards.
+        """
+        if isinstance(other, IntervalArray):
+            return other._mins, other._maxs
+        elif outward_rounding and isinstance(other, (Interval, Decimal, int)):
+            if isinstance(other, Interval):
+                low, high = IntervalArray._enclosing_floats(other.min, other.max)
+            else:
+                low, high = IntervalArray._enclosing_floats(other, other)
+            return np.float64(low), np.float64(high)
+        elif isinstance(other, Interval):
+            return np.float64(other.min), np.float64(other.max)
+        elif isinstance(other, np.ndarray):
+            values = other.astype(np.float64)
+            return values, values
+        else:
+            value = np.float64(other)
+            return value, value
+
+    @staticmethod
+    def _is_operand(other) -> bool:
+        return isinstance(other, (int, float, Decimal, np.ndarray, Interval, IntervalArray))
+
+    def contains(self, item) -> np.ndarray:
+        """
+        Element-wise test if `item` is contained in intervals.
+
+        Parameters
+        ----------
+        item: Union[int, float, Decimal, np.ndarray, Interval, IntervalArray]
+
+        Returns
+        -------
+        np.ndarray
+        """
+        if not self._is_operand(item):
+            raise TypeError(
+                f"Cannot test if object of type `{type(item).__name__}` is in IntervalArray. "
+                "Only implemented for `float`, `int`, `Decimal`, `np.ndarray`, `Interval` and `IntervalArray`."
+            )
+
+        item_min, item_max = self._bounds(item)
+
+        return (self._mins <= item_min) & (item_max <= self._maxs)
+
+    def __contains__(self, item) -> bool:
+        return bool(np.all(self.contains(item)))
+
+    def contains_zero(self) -> np.ndarray:
+        """
+        Mask of intervals that contain `0`, i.e. intervals that are not valid divisors.
+
+        Returns
+        -------
+        np.ndarray
+        """
+        return (self._mins <= 0) & (0 <= self._maxs)
+
+    def intersects(self, other: Union[Interval, IntervalArray]) -> np.ndarray:
+        """
+        Mask of intervals that intersect with `other`.
+
+        Parameters
+        ----------
+        other: Union[Interval, IntervalArray]
+
+        Returns
+        -------
+        np.ndarray
+        """
+        other_min, other_max = self._bounds(other)
+
+        return ~((other_max < self._mins) | (self._maxs < other_min))
+
+    def intersection(self, other: Union[Interval, IntervalArray]) -> IntervalArray:
+        """
+        Returns element-wise intersection of intervals.
+
+        Parameters
+        ----------
+        other: Union[Interval, IntervalArray]
+
+        Returns
+        -------
+        IntervalArray
+
+        Raises
+        -------
+        ArithmeticError
+            If any of the pairs of intervals do not intersect.
+        """
+        if not np.all(self.intersects(other)):
+            raise ArithmeticError("Some of the intervals do not intersect, cannot construct intersection.")
+
+        other_min, other_max = self._bounds(other)
+
+        return IntervalArray._from_arrays(
+            np.maximum(self._mins, other_min), np.minimum(self._maxs, other_max), self._outward_rounding
+        )
+
+    def union_hull(self, other: Union[Interval, IntervalArray]) -> IntervalArray:
+        """
+        Returns element-wise union hull of intervals. Union hull is the widest interval covering both intervals.
+
+        Parameters
+        ----------
+        other: Union[Interval, IntervalArray]
+
+        Returns
+        -------
+        IntervalArray
+        """
+        other_min, other_max = self._bounds(other)
+
+        return IntervalArray._from_arrays(
+            np.minimum(self._mins, other_min), np.maximum(self._maxs, other_max), self._outward_rounding
+        )
+
+    def is_negative(self) -> np.ndarray:
+        """
+        Mask of strictly negative intervals. Maximum < 0.
+
+        Returns
+        -------
+        np.ndarray
+        """
+        return self._maxs < 0
+
+    def is_not_positive(self) -> np.ndarray:
+        """
+        Mask of not positive intervals. Maximum <= 0.
+
+        Returns
+        -------
+        np.ndarray
+        """
+        return self._maxs <= 0
+
+    def is_positive(self) -> np.ndarray:
+        """
+        Mask of strictly positive intervals. Minimum > 0.
+
+        Returns
+        -------
+        np.ndarray
+        """
+        return 0 < self._mins
+
+    def is_not_negative(self) -> np.ndarray:
+        """
+        Mask of not negative intervals. Minimum >= 0.
+
+        Returns
+        -------
+        np.ndarray
+        """
+        return 0 <= self._mins
+
+    def is_more_positive(self) -> np.ndarray:
+        """
+        Mask of intervals with positive midpoint.
+
+        Returns
+        -------
+        np.ndarray
+        """
+        return 0 <= self.mid_point
+
+    def __add__(self, other) -> IntervalArray:
+        if not self._is_operand(other):
+            return NotImplemented
+
+        other_min, other_max = self._bounds(other, self._rounds(other))
+
+        return self._result(self._mins + other_min, self._maxs + other_max, other)
+
+    def __radd__(self, other) -> IntervalArray:
+        if not self._is_operand(other):
+            return NotImplemented
+        return self + other
+
+    def __sub__(self, other) -> IntervalArray:
+        if not self._is_operand(other):
+            return NotImplemented
+
+        other_min, other_max = self._bounds(other, self._rounds(other))
+
+        return self._result(self._mins - other_max, self._maxs - other_min, other)
+
+    def __rsub__(self, other) -> IntervalArray:
+        if not self._is_operand(other):
+            return NotImplemented
+
+        other_min, other_max = self._bounds(other, self._rounds(other))
+
+        return self._result(other_min - self._maxs, other_max - self._mins, other)
+
+    def _hull(self, values: Tuple[np.ndarray, ...], other=None) -> IntervalArray:
+        return self._result(np.minimum.reduce(values), np.maximum.reduce(values), other)
+
+    def __mul__(self, other) -> IntervalArray:
+        if not self._is_operand(other):
+            return NotImplemented
+
+        other_min, other_max = self._bounds(other, self._rounds(other))
+
+        return self._hull(
+            (self._mins * other_min, self._mins * other_max, self._maxs * other_min, self._maxs * other_max), other
+        )
+
+    def __rmul__(self, other) -> IntervalArray:
+        if not self._is_operand(other):
+            return NotImplemented
+        return self * other
+
+    def __truediv__(self, other) -> IntervalArray:
+        if not self._is_operand(other):
+            return NotImplemented
+
+        if isinstance(other, (int, float, Decimal)):
+            if other == 0:
+                raise ArithmeticError("Cannot divide by 0.")
+        elif isinstance(other, Interval):
+            if 0 in other:
+                raise ArithmeticError(f"Cannot divide by interval that contains `0`. The interval is `{other}`.")
+        else:
+            divisor = other if isinstance(other, IntervalArray) else IntervalArray._from_arrays(other, other)
+            zero_mask = divisor.contains_zero()
+            if np.any(zero_mask):
+                raise ArithmeticError(
+                    f"Cannot divide by interval that contains `0`. This holds for {int(np.count_nonzero(zero_mask))} "
+                    "intervals."
+                )
+
+        other_min, other_max = self._bounds(other, self._rounds(other))
+
+        return self._hull(
+            (self._mins / other_min, self._mins / other_max, self._maxs / other_min, self._maxs / other_max), other
+        )
+
+    def __rtruediv__(self, other) -> IntervalArray:
+        if not self._is_operand(other):
+            return NotImplemented
+
+        zero_mask = self.contains_zero()
+        if np.any(zero_mask):
+            raise ArithmeticError(
+                f"Cannot divide by interval that contains `0`. This holds for {int(np.count_nonzero(zero_mask))} "
+                "intervals."
+            )
+
+        other_min, other_max = self._bounds(other, self._rounds(other))
+
+        return self._hull(
+            (other_min / self._mins, other_min / self._maxs, other_max / self._mins, other_max / self._maxs), other
+        )
+
+    def __pow__(self, power) -> IntervalArray:
+        if not isinstance(power, int):
+            return NotImplemented
+
+        min_power = self._mins**power
+        max_power = self._maxs**power
+
+        result = self._result(np.minimum(min_power, max_power), np.maximum(min_power, max_power))
+
+        if (power % 2) == 0:
+            result._mins = np.where(self.contains_zero(), 0.0, result._mins)
+
+        return result
+
+    def __neg__(self) -> IntervalArray:
+        return IntervalArray._from_arrays(-self._maxs, -self._mins, self._outward_rounding)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, IntervalArray):
+            return np.array_equal(self._mins, other._mins, equal_nan=True) and np.array_equal(
+                self._maxs, other._maxs, equal_nan=True
+            )
+        else:
+            return NotImplemented
+
+    __hash__ = None  # type: ignore [assignment]
@@ -0,0 +1,271 @@
+"""Class LazyFuzzyNumber"""
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from .class_alpha_grid import AlphaGrid
+from .class_fuzzy_number import FuzzyNumber
+from .class_interval import Interval
+
+
+def _divide(x: Interval, y: Union[Interval, int, float, Decimal]) -> Interval:
+    if isinstance(y, Interval) and 0 in y:
+        raise ArithmeticError("Cannot divide by FuzzyNumber that contains 0.")
+    return x / y
+
+
+def _rdivide(x: Interval, value: Union[int, float, Decimal]) -> Interval:
+    if 0 in x:
+        raise ArithmeticError("Cannot divide by FuzzyNumber that contains 0.")
+    return value / x
+
+
+class LazyFuzzyNumber:
+    """
+    Deferred fuzzy arithmetic. Arithmetic operators on `LazyFuzzyNumber` do not calculate anything, they only build
+    expression graph. The graph is evaluated by `evaluate()` in single pass per alpha level, so only intervals of the
+    individual alpha levels are calculated and only the final `FuzzyNumber` is created.
+
+    All `FuzzyNumber`s in the expression are aligned to one alpha grid (union of their alpha levels) before the
+    evaluation. For addition, subtraction and operations with scalars the result is the same as with eager
+    `FuzzyNumber` arithmetic, for other operations it can be slightly more precise, because intermediate results are not
+    interpolated.
+
+    ...
+
+    Attributes
+    ----------
+    _operation: Optional[Callable]
+        Interval operation of this node, `None` for leaf nodes.
+
+    _operands: Tuple
+        `FuzzyNumber` for leaf nodes, otherwise operands of the operation (`LazyFuzzyNumber`s or scalars).
+
+    _value: Optional[FuzzyNumber]
+        Evaluated value of the node.
+    """
+
+    __slots__ = ("_operation", "_operands", "_value")
+
+    __array_ufunc__ = None
+
+    def __init__(self, fuzzy_number: FuzzyNumber):
+        """
+        Creates lazy fuzzy number from `FuzzyNumber`, which serves as leaf of expression graph.
+
+        Parameters
+        ----------
+        fuzzy_number: FuzzyNumber
+        """
+        if not isinstance(fuzzy_number, FuzzyNumber):
+            raise TypeError(f"`fuzzy_number` must be `FuzzyNumber`. It is `{type(fuzzy_number).__name__}`.")
+
+        self._operation: Optional[Callable] = None
+        self._operands: Tuple = (fuzzy_number,)
+        self._value: Optional[FuzzyNumber] = fuzzy_number
+
+    @classmethod
+    def _node(cls, operation: Callable, *operands) -> LazyFuzzyNumber:
+        """
+        Creates inner node of expression graph.
+
+        Parameters
+        ----------
+        operation: Callable
+            Interval operation, called with intervals in place of `LazyFuzzyNumber` operands.
+
+        operands
+            `LazyFuzzyNumber`s or scalars.
+
+        Returns
+        -------
+        LazyFuzzyNumber
+        """
+        node = cls.__new__(cls)
+        node._operation = operation  # pylint: disable=W0212
+        node._operands = operands  # pylint: disable=W0212
+        node._value = None  # pylint: disable=W0212
+        return node
+
+    def __repr__(self) -> str:
+        if self._operation is None:
+            return f"LazyFuzzyNumber({self._operands[0]})"
+
+        return f"LazyFuzzyNumber(<{self._operation.__name__.strip('_')} of {len(self._operands)} operands>)"
+
+    @staticmethod
+    def _as_operand(other) -> Union[LazyFuzzyNumber, int, float, Decimal, None]:
+        if isinstance(other, LazyFuzzyNumber):
+            return other
+        if isinstance(other, FuzzyNumber):
+            return LazyFuzzyNumber(other)
+        if isinstance(other, (int, float, Decimal)):
+            return other
+        return None
+
+    def __add__(self, other) -> LazyFuzzyNumber:
+        other = self._as_operand(other)
+        if other is None:
+            return NotImplemented
+        return self._node(Interval.__add__, self, other)
+
+    def __radd__(self, other) -> LazyFuzzyNumber:
+        return self + other
+
+    def __sub__(self, other) -> LazyFuzzyNumber:
+        other = self._as_operand(other)
+        if other is None:
+            return NotImplemented
+        return self._node(Interval.__sub__, self, other)
+
+    def __rsub__(self, other) -> LazyFuzzyNumber:
+        other = self._as_operand(other)
+        if other is None:
+            return NotImplemented
+        if isinstance(other, LazyFuzzyNumber):
+            return other - self
+        return self._node(Interval.__rsub__, self, other)
+
+    def __mul__(self, other) -> LazyFuzzyNumber:
+        other = self._as_operand(other)
+        if other is None:
+            return NotImplemented
+        return self._node(Interval.__mul__, self, other)
+
+    def __rmul__(self, other) -> LazyFuzzyNumber:
+        return self * other
+
+    def __truediv__(self, other) -> LazyFuzzyNumber:
+        other = self._as_operand(other)
+        if other is None:
+            return NotImplemented
+        if not isinstance(other, LazyFuzzyNumber) and other == 0:
+            raise ArithmeticError("Cannot divide by 0.")
+        return self._node(_divide, self, other)
+
+    def __rtruediv__(self, other) -> LazyFuzzyNumber:
+        other = self._as_operand(other)
+        if other is None:
+            return NotImplemented
+        if isinstance(other, LazyFuzzyNumber):
+            return other / self
+        return self._node(_rdivide, self, other)
+
+    def __pow__(self, power) -> LazyFuzzyNumber:
+        if not isinstance(power, int):
+            return NotImplemented
+        return self._node(Interval.__pow__, self, power)
+
+    def __neg__(self) -> LazyFuzzyNumber:
+        return self._node(Interval.__neg__, self)
+
+    def _compile(
+        self,
+    ) -> Tuple[List[FuzzyNumber], List[Tuple[Callable, Tuple[Tuple[bool, object], ...]]]]:
+        """
+        Flattens the expression graph into list of leaves and list of instructions in evaluation order. Every
+        instruction stores its result into the next register after the registers of leaves. Shared subexpressions are
+        compiled only once.
+
+        Returns
+        -------
+        Tuple[List[FuzzyNumber], List[Tuple[Callable, Tuple[Tuple[bool, object], ...]]]]
+            Leaves and instructions. Arguments of instructions are pairs, first value determines if the second value is
+            a register index or a constant.
+        """
+        leaves: List[FuzzyNumber] = []
+        leaf_registers: Dict[int, int] = {}
+        node_registers: Dict[int, int] = {}
+        nodes: List[LazyFuzzyNumber] = []
+
+        stack: List[Tuple[LazyFuzzyNumber, bool]] = [(self, False)]
+
+        while stack:
+            node, expanded = stack.pop()
+
+            if id(node) in node_registers:
+                continue
+
+            if node._value is not None:
+                fuzzy_number = node._value
+                if id(fuzzy_number) not in leaf_registers:
+                    leaf_registers[id(fuzzy_number)] = len(leaves)
+                    leaves.append(fuzzy_number)
+                node_registers[id(node)] = -1 - leaf_registers[id(fuzzy_number)]
+                continue
+
+            if expanded:
+                node_registers[id(node)] = len(nodes)
+                nodes.append(node)
+                continue
+
+            stack.append((node, True))
+            for operand in reversed(node._operands):
+                if isinstance(operand, LazyFuzzyNumber):
+                    stack.append((operand, False))
+
+        number_leaves = len(leaves)
+
+        def register(node: LazyFuzzyNumber) -> int:
+            index = node_registers[id(node)]
+            if index < 0:
+                return -1 - index
+            return number_leaves + index
+
+        instructions = []
+        for node in nodes:
+            arguments = tuple(
+                (True, register(operand)) if isinstance(operand, LazyFuzzyNumber) else (False, operand)
+                for operand in node._operands
+            )
+            instructions.append((node._operation, arguments))
+
+        return leaves, instructions
+
+    def evaluate(self) -> FuzzyNumber:
+        """
+        Evaluates the expression. The result is stored, so repeated calls do not evaluate the expression again.
+
+        Returns
+        -------
+        FuzzyNumber
+
+        Raises
+        -------
+        ArithmeticError
+            If the expression divides by 0 or by fuzzy number that contains 0.
+        """
+        if self._value is not None:
+            return self._value
+
+        leaves, instructions = self._compile()
+
+        alphas = leaves[0].alpha_levels
+        for leaf in leaves[1:]:
+            alphas = AlphaGrid.merge(alphas, leaf.alpha_levels)
+
+        leaf_cuts = [leaf._alpha_cuts_on_grid(alphas) for leaf in leaves]  # pylint: disable=W0212
+
+        number_leaves = len(leaves)
+        registers: List[object] = [None] * (number_leaves + len(instructions))
+        intervals: List[Interval] = [None] * len(alphas)  # type: ignore [list-item]
+
+        for i in range(len(alphas)):
+            for j in range(number_leaves):
+                registers[j] = leaf_cuts[j][i]
+
+            output = number_leaves
+            for operation, arguments in instructions:
+                registers[output] = operation(
+                    *[registers[value] if is_register else value for is_register, value in arguments]  # type: ignore
+                )
+                output += 1
+
+            intervals[i] = registers[-1]  # type: ignore [assignment]
+
+        self._value = FuzzyNumber._from_trusted(alphas, intervals)  # pylint: disable=W0212
+        self._operation = None
+        self._operands = (self._value,)
+
+        return self._value
@@ -0,0 +1,272 @@
+"""Class PiecewiseLinear"""
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from decimal import Decimal
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .class_alpha_grid import AlphaGrid
+from .class_interval import Interval
+
+
+class PiecewiseLinear:
+    """
+    Compiled piecewise linear form of fuzzy number. Left branch (minimums of alpha cuts) and right branch (maximums of
+    alpha cuts) are stored as breakpoints on alpha levels together with precomputed slopes of the segments between them,
+    so both the values of branches at any alpha and membership of any value are found by binary search in O(log K).
+
+    Created by `FuzzyNumber.piecewise_linear`. Slopes are calculated in decimal context that is active at creation.
+
+    ...
+
+    Attributes
+    ----------
+    _alphas: AlphaGrid
+        Alpha levels of breakpoints.
+
+    _mins: List[Decimal]
+        Left branch, minimums of alpha cuts in order of alpha levels (non-decreasing).
+
+    _maxs: List[Decimal]
+        Right branch, maximums of alpha cuts in order of alpha levels (non-increasing).
+
+    _maxs_from_one: List[Decimal]
+        Right branch in order from alpha 1 to alpha 0 (non-decreasing), for binary search.
+
+    _slopes_min: List[Decimal]
+        Change of minimum per unit of alpha on every segment between neighbouring alpha levels.
+
+    _slopes_max: List[Decimal]
+        Change of maximum per unit of alpha on every segment between neighbouring alpha levels.
+
+    _float_arrays: Optional[Tuple[np.ndarray, ...]]
+        Lazily created float64 copies of breakpoints and slopes, used for arrays of values.
+    """
+
+    __slots__ = ("_alphas", "_mins", "_maxs", "_maxs_from_one", "_slopes_min", "_slopes_max", "_float_arrays")
+
+    def __init__(self, alphas: AlphaGrid, alpha_cuts: Sequence[Interval]):
+        """
+        Compiles alpha cuts into breakpoints and slopes. Has to be called in FuzzyMath decimal context.
+
+        Parameters
+        ----------
+        alphas: AlphaGrid
+
+        alpha_cuts: Sequence[Interval]
+            Nested alpha cuts for all `alphas`.
+        """
+        self._alphas = alphas
+        self._mins = [alpha_cut.min for alpha_cut in alpha_cuts]
+        self._maxs = [alpha_cut.max for alpha_cut in alpha_cuts]
+        self._maxs_from_one = self._maxs[::-1]
+
+        heights = [alpha_high - alpha_low for alpha_low, alpha_high in zip(alphas, alphas[1:])]
+
+        self._slopes_min = [(high - low) / height for low, high, height in zip(self._mins, self._mins[1:], heights)]
+        self._slopes_max = [(high - low) / height for low, high, height in zip(self._maxs, self._maxs[1:], heights)]
+
+        # zero slope after the last breakpoint, so that alpha 1 does not need special case
+        self._slopes_min.append(Decimal(0))
+        self._slopes_max.append(Decimal(0))
+
+        self._float_arrays: Optional[Tuple[np.ndarray, ...]] = None
+
+    @property
+    def alphas(self) -> AlphaGrid:
+        """
+        Alpha levels of breakpoints.
+
+        Returns
+        -------
+        AlphaGrid
+        """
+        return self._alphas
+
+    @property
+    def mins(self) -> List[Decimal]:
+        """
+        Breakpoints of left branch (minimums of alpha cuts), in order of alpha levels.
+
+        Returns
+        -------
+        List[Decimal]
+        """
+        return list(self._mins)
+
+    @property
+    def maxs(self) -> List[Decimal]:
+        """
+        Breakpoints of right branch (maximums of alpha cuts), in order of alpha levels.
+
+        Returns
+        -------
+        List[Decimal]
+        """
+        return list(self._maxs)
+
+    @property
+    def slopes_min(self) -> List[Decimal]:
+        """
+        Slopes of left branch, change of minimum per unit of alpha between neighbouring alpha levels.
+
+        Returns
+        -------
+        List[Decimal]
+        """
+        return self._slopes_min[:-1]
+
+    @property
+    def slopes_max(self) -> List[Decimal]:
+        """
+        Slopes of right branch, change of maximum per unit of alpha between neighbouring alpha levels.
+
+        Returns
+        -------
+        List[Decimal]
+        """
+        return self._slopes_max[:-1]
+
+    def _segment(self, alpha: Decimal) -> int:
+        return bisect_right(self._alphas, alpha) - 1
+
+    def minimum(self, alpha: Decimal) -> Decimal:
+        """
+        Value of left branch (minimum of alpha cut) at `alpha`. Breakpoints are returned directly on alpha levels,
+        values between them are linearly interpolated.
+
+        Parameters
+        ----------
+        alpha: Decimal
+            Valid alpha from range [0, 1].
+
+        Returns
+        -------
+        Decimal
+        """
+        i = self._segment(alpha)
+
+        if self._alphas[i] == alpha:
+            return self._mins[i]
+
+        return self._mins[i] + (alpha - self._alphas[i]) * self._slopes_min[i]
+
+    def maximum(self, alpha: Decimal) -> Decimal:
+        """
+        Value of right branch (maximum of alpha cut) at `alpha`. Breakpoints are returned directly on alpha levels,
+        values between them are linearly interpolated.
+
+        Parameters
+        ----------
+        alpha: Decimal
+            Valid alpha from range [0, 1].
+
+        Returns
+        -------
+        Decimal
+        """
+        i = self._segment(alpha)
+
+        if self._alphas[i] == alpha:
+            return self._maxs[i]
+
+        return self._maxs[i] + (alpha - self._alphas[i]) * self._slopes_max[i]
+
+    def bounds(self, alpha: Decimal) -> Tuple[Decimal, Decimal]:
+        """
+        Minimum and maximum of alpha cut at `alpha`, found by single binary search.
+
+        Parameters
+        ----------
+        alpha: Decimal
+            Valid alpha from range [0, 1].
+
+        Returns
+        -------
+        Tuple[Decimal, Decimal]
+        """
+        i = self._segment(alpha)
+        height = alpha - self._alphas[i]
+        return self._mins[i] + height * self._slopes_min[i], self._maxs[i] + height * self._slopes_max[i]
+
+    def membership(self, value: Decimal) -> Decimal:
+        """
+        Membership degree of `value`, the lower of alpha levels at which `value` lies on the left and on the right
+        branch.
+
+        Parameters
+        ----------
+        value: Decimal
+
+        Returns
+        -------
+        Decimal
+        """
+        last = len(self._alphas) - 1
+
+        i = bisect_right(self._mins, value) - 1
+
+        if i < 0:
+            left = Decimal(0)
+        elif i == last:
+            left = Decimal(1)
+        else:
+            left = self._alphas[i] + (value - self._mins[i]) / self._slopes_min[i]
+
+        i = bisect_left(self._maxs_from_one, value)
+
+        if i > last:
+            right = Decimal(0)
+        elif i == 0:
+            right = Decimal(1)
+        else:
+            i = last - i
+            right = self._alphas[i] + (value - self._maxs[i]) / self._slopes_max[i]
+
+        return min(left, right)
+
+    def memberships(self, values: np.ndarray) -> np.ndarray:
+        """
+        Membership degrees of array of values, calculated in float64 by `np.searchsorted` on both branches. Membership
+        of NaN is NaN.
+
+        Parameters
+        ----------
+        values: np.ndarray
+            Array of float64 values.
+
+        Returns
+        -------
+        np.ndarray
+            Array of the same shape as `values`.
+        """
+        if self._float_arrays is None:
+            self._float_arrays = tuple(
+                np.array(breakpoints, dtype=np.float64)
+                for breakpoints in (
+                    self._alphas,
+                    self._mins,
+                    self._maxs,
+                    self._maxs_from_one,
+                    self._slopes_min,
+                    self._slopes_max,
+                )
+            )
+
+        alphas, mins, maxs, maxs_from_one, slopes_min, slopes_max = self._float_arrays
+        last = alphas.size - 1
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            index = np.searchsorted(mins, values, side="right") - 1
+            i = np.clip(index, 0, last - 1)
+            left = alphas[i] + (values - mins[i]) / slopes_min[i]
+            left = np.where(index < 0, 0.0, np.where(index >= last, 1.0, left))
+
+            index = np.searchsorted(maxs_from_one, values, side="left")
+            i = last - np.clip(index, 1, last)
+            right = alphas[i] + (values - maxs[i]) / slopes_max[i]
+            right = np.where(index > last, 0.0, np.where(index == 0, 1.0, right))
+
+        return np.where(np.isnan(values), np.nan, np.minimum(left, right))
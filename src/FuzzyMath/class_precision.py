@@ -1,19 +1,117 @@
 """Classes handling precision"""
+import decimal
 import typing
+from contextvars import ContextVar, Token
 from decimal import Decimal
 
 
-class FuzzyMathPrecision(object):
-    """Object representing precision of FuzzyMath. Used in Interval and FuzzyNumber representation."""
+class PrecisionSettings(typing.NamedTuple):
+    """Immutable snapshot of FuzzyMath precision settings, stored in context variable."""
 
     numeric_precision: typing.Optional[Decimal] = None
     alpha_precision: typing.Optional[Decimal] = None
+    outward_rounding: bool = False
+    decimal_context: typing.Optional[decimal.Context] = None
+
+
+_SETTINGS: ContextVar[PrecisionSettings] = ContextVar("FuzzyMathPrecision", default=PrecisionSettings())
+
+
+def _setting(name: str, doc: str) -> property:
+    """Property that reads and changes one field of the current settings."""
+
+    def getter(_) -> typing.Any:
+        return getattr(_SETTINGS.get(), name)
+
+    def setter(_, value: typing.Any) -> None:
+        _SETTINGS.set(_SETTINGS.get()._replace(**{name: value}))
+
+    return property(getter, setter, doc=doc)
+
+
+class _FuzzyMathPrecisionMeta(type):
+    """Metaclass that keeps settings accessible on the class itself, e.g. `FuzzyMathPrecision.numeric_precision`."""
+
+    numeric_precision = _setting("numeric_precision", "Precision for numeric values, `None` if not set.")
+
+    alpha_precision = _setting("alpha_precision", "Precision for alpha values, `None` if not set.")
+
+    outward_rounding = _setting("outward_rounding", "Is outward rounding of float backends enabled?")
+
+    decimal_context = _setting("decimal_context", "Context for `Decimal` arithmetic, `None` if not set.")
+
+
+class FuzzyMathPrecision(metaclass=_FuzzyMathPrecisionMeta):
+    """Object representing precision of FuzzyMath. Used in Interval and FuzzyNumber representation.
+
+    Besides quantization of results (`numeric_precision` and `alpha_precision`) it holds `decimal_context` in which all
+    `Decimal` arithmetic of FuzzyMath is done. If it is not set, the ambient context of `decimal` module is used.
+
+    The settings are stored in context variable (`contextvars`), so every thread and every asyncio task has its own
+    settings. New threads start with default settings, asyncio tasks inherit the settings of the code that created them.
+
+    The settings can be read and changed both on the class and on the instance, e.g.
+    `FuzzyMathPrecision.numeric_precision` or `FuzzyMathPrecision().numeric_precision`.
+    """
+
+    _ROUNDINGS = (
+        decimal.ROUND_CEILING,
+        decimal.ROUND_DOWN,
+        decimal.ROUND_FLOOR,
+        decimal.ROUND_HALF_DOWN,
+        decimal.ROUND_HALF_EVEN,
+        decimal.ROUND_HALF_UP,
+        decimal.ROUND_UP,
+        decimal.ROUND_05UP,
+    )
 
     def __new__(cls):
         if not hasattr(cls, "instance"):
             cls.instance = super(FuzzyMathPrecision, cls).__new__(cls)
         return cls.instance
 
+    @staticmethod
+    def current() -> PrecisionSettings:
+        """Get current settings. Cheap, intended to be read once per operation.
+
+        Returns:
+            PrecisionSettings
+        """
+        return _SETTINGS.get()
+
+    @staticmethod
+    def _update(**changes) -> Token:
+        return _SETTINGS.set(_SETTINGS.get()._replace(**changes))
+
+    @staticmethod
+    def use(settings: PrecisionSettings) -> Token:
+        """Replace current settings, in the current context only.
+
+        Args:
+            settings (PrecisionSettings): Settings to use, typically obtained by `current()`.
+
+        Returns:
+            Token: Token that can be used to restore previous settings by `restore()`.
+        """
+        return _SETTINGS.set(settings)
+
+    @staticmethod
+    def restore(token: Token) -> None:
+        """Restore settings that were used before `use()` returned `token`.
+
+        Args:
+            token (Token): Token returned by `use()`.
+        """
+        _SETTINGS.reset(token)
+
+    numeric_precision = _setting("numeric_precision", "Precision for numeric values, `None` if not set.")
+
+    alpha_precision = _setting("alpha_precision", "Precision for alpha values, `None` if not set.")
+
+    outward_rounding = _setting("outward_rounding", "Is outward rounding of float backends enabled?")
+
+    decimal_context = _setting("decimal_context", "Context for `Decimal` arithmetic, `None` if not set.")
+
     @staticmethod
     def set_numeric_precision(decimal_places: int) -> None:
         """Set precision for numeric values - typically limits of Interval and thus Alpha cuts as well.
@@ -21,12 +119,12 @@ class FuzzyMathPrecision(object):
         Args:
             decimal_places (int): Number of decimal places to use.
         """
-        FuzzyMathPrecision().numeric_precision = Decimal(10) ** -decimal_places
+        FuzzyMathPrecision._update(numeric_precision=Decimal(10) ** -decimal_places)
 
     @staticmethod
     def unset_numeric_precision() -> None:
         """Unset decimal places precision."""
-        FuzzyMathPrecision().numeric_precision = None
+        FuzzyMathPrecision._update(numeric_precision=None)
 
     @staticmethod
     def set_alpha_precision(decimal_places: int) -> None:
@@ -35,12 +133,76 @@ class FuzzyMathPrecision(object):
         Args:
             decimal_places (int): Number of decimal places to use for alpha cut values.
         """
-        FuzzyMathPrecision().alpha_precision = Decimal(10) ** -decimal_places
+        FuzzyMathPrecision._update(alpha_precision=Decimal(10) ** -decimal_places)
 
     @staticmethod
     def unset_alpha_precision() -> None:
         """Unset decimal places for alpha precision."""
-        FuzzyMathPrecision().alpha_precision = None
+        FuzzyMathPrecision._update(alpha_precision=None)
+
+    @staticmethod
+    def set_outward_rounding(enabled: bool = True) -> None:
+        """Enable outward rounding of float backends (`IntervalArray`, `FuzzyNumberFloat` and `FuzzyNumberArray`). Lower
+        bounds of results are rounded down and upper bounds up, so the results always contain the exact values.
+
+        Args:
+            enabled (bool): Should the results be rounded outwards.
+        """
+        FuzzyMathPrecision._update(outward_rounding=enabled)
+
+    @staticmethod
+    def unset_outward_rounding() -> None:
+        """Disable outward rounding of float backends."""
+        FuzzyMathPrecision._update(outward_rounding=False)
+
+    @staticmethod
+    def _create_decimal_context(significant_digits: int, rounding: str) -> decimal.Context:
+        if not isinstance(significant_digits, int) or significant_digits < 1:
+            raise ValueError(f"`significant_digits` must be positive integer. It is `{significant_digits}`.")
+
+        if rounding not in FuzzyMathPrecision._ROUNDINGS:
+            raise ValueError(
+                f"`rounding` must be one of: {', '.join(FuzzyMathPrecision._ROUNDINGS)}. It is `{rounding}`."
+            )
+
+        return decimal.Context(
+            prec=significant_digits,
+            rounding=rounding,
+            traps=[decimal.InvalidOperation, decimal.DivisionByZero, decimal.Overflow],
+        )
+
+    @staticmethod
+    def set_decimal_context(significant_digits: int, rounding: str = decimal.ROUND_HALF_EVEN) -> None:
+        """Set context for `Decimal` arithmetic of FuzzyMath. Lower number of significant digits speeds up especially
+        multiplication and division.
+
+        Args:
+            significant_digits (int): Number of significant digits of results of arithmetic operations.
+            rounding (str): Rounding mode, one of rounding constants of `decimal` module. Default `ROUND_HALF_EVEN`.
+
+        Raises:
+            ValueError: If `significant_digits` is not positive integer or `rounding` is not valid rounding mode.
+        """
+        FuzzyMathPrecision._update(
+            decimal_context=FuzzyMathPrecision._create_decimal_context(significant_digits, rounding)
+        )
+
+    @staticmethod
+    def unset_decimal_context() -> None:
+        """Unset context for `Decimal` arithmetic, the ambient context of `decimal` module is used."""
+        FuzzyMathPrecision._update(decimal_context=None)
+
+    @staticmethod
+    def get_decimal_context() -> decimal.Context:
+        """Get context for `Decimal` arithmetic of FuzzyMath.
+
+        Returns:
+            decimal.Context: Context set by `set_decimal_context()` or the ambient context of `decimal` module.
+        """
+        context = _SETTINGS.get().decimal_context
+        if context is None:
+            return decimal.getcontext()
+        return context
 
     @staticmethod
     def prepare_number(value: Decimal) -> Decimal:
@@ -52,19 +214,18 @@ class FuzzyMathPrecision(object):
         Returns:
             Decimal
         """
-        fuzzy_precision = FuzzyMathPrecision()
-        if fuzzy_precision.numeric_precision is None:
+        numeric_precision = _SETTINGS.get().numeric_precision
+        if numeric_precision is None:
             return value
         else:
-            return value.quantize(fuzzy_precision.numeric_precision)
+            return value.quantize(numeric_precision)
 
     @staticmethod
     def reset() -> None:
         """
-        Reset values of both numeric and alpha precision.
+        Reset values of both numeric and alpha precision, disable outward rounding and unset decimal context.
         """
-        FuzzyMathPrecision().alpha_precision = None
-        FuzzyMathPrecision().numeric_precision = None
+        _SETTINGS.set(PrecisionSettings())
 
     @staticmethod
     def prepare_alpha(value: Decimal) -> Decimal:
@@ -76,41 +237,52 @@ class FuzzyMathPrecision(object):
         Returns:
             Decimal
         """
-        fuzzy_precision = FuzzyMathPrecision()
-        if fuzzy_precision.alpha_precision is None:
+        alpha_precision = _SETTINGS.get().alpha_precision
+        if alpha_precision is None:
             return value
         else:
-            return value.quantize(fuzzy_precision.alpha_precision)
+            return value.quantize(alpha_precision)
 
 
 class FuzzyMathPrecisionContext:
     """
-    Context for quickly and simply changing precision of FuzzyNumbers and Intervals.
+    Context for quickly and simply changing precision of FuzzyNumbers and Intervals. Only the provided settings are
+    changed, on exit all the settings are restored to the values before entering the context. Changes affect only the
+    current thread or asyncio task.
     """
 
     def __init__(
-        self, numeric_precision: typing.Optional[int] = None, alpha_precision: typing.Optional[int] = None
+        self,
+        numeric_precision: typing.Optional[int] = None,
+        alpha_precision: typing.Optional[int] = None,
+        outward_rounding: typing.Optional[bool] = None,
+        significant_digits: typing.Optional[int] = None,
+        rounding: str = decimal.ROUND_HALF_EVEN,
     ) -> None:
         self.numeric_precision = numeric_precision
         self.alpha_precision = alpha_precision
+        self.outward_rounding = outward_rounding
+        self.significant_digits = significant_digits
+        self.rounding = rounding
 
-        self.previous_numeric_precision = FuzzyMathPrecision.numeric_precision
-        self.previous_alpha_precision = FuzzyMathPrecision.alpha_precision
+        self._tokens: typing.List[Token] = []
 
     def __enter__(self):
-        if self.numeric_precision:
-            FuzzyMathPrecision.set_numeric_precision(self.numeric_precision)
-        if self.alpha_precision:
-            FuzzyMathPrecision.set_alpha_precision(self.alpha_precision)
+        changes: typing.Dict[str, typing.Any] = {}
+
+        if self.numeric_precision is not None:
+            changes["numeric_precision"] = Decimal(10) ** -self.numeric_precision
+        if self.alpha_precision is not None:
+            changes["alpha_precision"] = Decimal(10) ** -self.alpha_precision
+        if self.outward_rounding is not None:
+            changes["outward_rounding"] = self.outward_rounding
+        if self.significant_digits is not None:
+            changes["decimal_context"] = FuzzyMathPrecision._create_decimal_context(  # pylint: disable=W0212
+                self.significant_digits, self.rounding
+            )
+
+        self._tokens.append(FuzzyMathPrecision._update(**changes))  # pylint: disable=W0212
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
-        if self.previous_numeric_precision is None:
-            FuzzyMathPrecision.unset_numeric_precision()
-        else:
-            FuzzyMathPrecision.set_numeric_precision(self.previous_numeric_precision)
-
-        if self.previous_alpha_precision is None:
-            FuzzyMathPrecision.unset_numeric_precision()
-        else:
-            FuzzyMathPrecision.set_alpha_precision(self.previous_alpha_precision)
+        FuzzyMathPrecision.restore(self._tokens.pop())
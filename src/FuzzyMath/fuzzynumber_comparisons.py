@@ -1,169 +1,449 @@
-from decimal import Decimal
-from typing import Sequence, Union
+from bisect import bisect_left, bisect_right
+from decimal import MAX_PREC, Context, Decimal, localcontext
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
 
+import numpy as np
+
+from .class_alpha_grid import AlphaGrid
 from .class_fuzzy_number import FuzzyNumber
 from .class_memberships import PossibilisticMembership
+from .class_piecewise_linear import PiecewiseLinear
+from .class_precision import FuzzyMathPrecision
 
 
-def possibility_exceedance(fn_a: FuzzyNumber, fn_b: FuzzyNumber) -> Decimal:
-    if fn_a.max <= fn_b.min:
-        return Decimal(0)
+class Comparison(NamedTuple):
+    """All four possibilistic comparisons of two fuzzy numbers, as returned by `compare()`."""
 
-    elif fn_a.kernel_min >= fn_b.kernel_min:
-        return Decimal(1)
+    exceedance: PossibilisticMembership
+    strict_exceedance: PossibilisticMembership
+    undervaluation: PossibilisticMembership
+    strict_undervaluation: PossibilisticMembership
 
-    else:
-        alphas = FuzzyNumber._prepare_alphas(fn_a.alpha_levels, fn_b.alpha_levels)  # pylint: disable=W0212
 
-        fn_a_values = fn_a.get_alpha_cuts_maxs(alphas, order_by_alphas_from_one=True)
-        fn_b_values = fn_b.get_alpha_cuts_mins(alphas, order_by_alphas_from_one=True)
+def compare(fn_a: FuzzyNumber, fn_b: FuzzyNumber) -> Comparison:
+    """
+    Calculates `exceedance()`, `strict_exceedance()`, `undervaluation()` and `strict_undervaluation()` of `fn_a` and
+    `fn_b` at once. Alpha levels of both fuzzy numbers are aligned and bounds of alpha cuts are extracted only once for
+    all the comparisons.
 
-        index = 0
-        for i in range(len(alphas)):
-            if fn_a_values[i] >= fn_b_values[i]:
-                break
+    Parameters
+    ----------
+    fn_a: FuzzyNumber
 
-            index += 1
+    fn_b: FuzzyNumber
 
-        alphas.reverse()
+    Returns
+    -------
+    Comparison
+    """
+    pe, ne, pse, nse = _indices(fn_a, fn_b, ("pe", "ne", "pse", "nse"))
 
-        return __value_intersection_y(fn_a_values, fn_b_values, alphas, index=index, index_change=-1)
+    context = FuzzyMathPrecision.get_decimal_context()
+    one = Decimal(1)
+
+    return Comparison(
+        PossibilisticMembership(pe, ne),
+        PossibilisticMembership(pse, nse),
+        PossibilisticMembership(context.subtract(one, nse), context.subtract(one, pse)),
+        PossibilisticMembership(context.subtract(one, ne), context.subtract(one, pe)),
+    )
+
+
+def possibility_exceedance(fn_a: FuzzyNumber, fn_b: FuzzyNumber) -> Decimal:
+    return _indices(fn_a, fn_b, ("pe",))[0]
 
 
 def necessity_exceedance(fn_a: FuzzyNumber, fn_b: FuzzyNumber) -> Decimal:
-    if fn_a.kernel_min <= fn_b.min:
-        return Decimal(0)
+    return _indices(fn_a, fn_b, ("ne",))[0]
 
-    elif fn_a.min >= fn_b.kernel_min:
-        return Decimal(1)
 
-    else:
-        alphas = FuzzyNumber._prepare_alphas(fn_a.alpha_levels, fn_b.alpha_levels)  # pylint: disable=W0212
+def possibility_strict_exceedance(fn_a: FuzzyNumber, fn_b: FuzzyNumber) -> Decimal:
+    return _indices(fn_a, fn_b, ("pse",))[0]
 
-        fn_a_values = fn_a.get_alpha_cuts_mins(alphas, order_by_alphas_from_one=True)
-        fn_b_values = fn_b.get_alpha_cuts_mins(alphas)
 
-        index = 0
-        for i in range(len(alphas)):
-            if fn_a_values[i] >= fn_b_values[i]:
-                break
+def necessity_strict_exceedance(fn_a: FuzzyNumber, fn_b: FuzzyNumber) -> Decimal:
+    return _indices(fn_a, fn_b, ("nse",))[0]
 
-            index += 1
 
-        return __value_intersection_y(fn_a_values, fn_b_values, alphas, index=index, index_change=-1)
+def possibility_undervaluation(fn_a: FuzzyNumber, fn_b: FuzzyNumber) -> Decimal:
+    return FuzzyMathPrecision.get_decimal_context().subtract(Decimal(1), necessity_strict_exceedance(fn_a, fn_b))
 
 
-def possibility_strict_exceedance(fn_a: FuzzyNumber, fn_b: FuzzyNumber) -> Decimal:
-    if fn_a.max < fn_b.max:
-        return Decimal(0)
+def necessity_undervaluation(fn_a: FuzzyNumber, fn_b: FuzzyNumber) -> Decimal:
+    return FuzzyMathPrecision.get_decimal_context().subtract(Decimal(1), possibility_strict_exceedance(fn_a, fn_b))
 
-    elif fn_a.kernel_min > fn_b.max:
-        return Decimal(1)
 
-    else:
-        alphas = FuzzyNumber._prepare_alphas(fn_a.alpha_levels, fn_b.alpha_levels)  # pylint: disable=W0212
+def possibility_strict_undervaluation(fn_a: FuzzyNumber, fn_b: FuzzyNumber) -> Decimal:
+    return FuzzyMathPrecision.get_decimal_context().subtract(Decimal(1), necessity_exceedance(fn_a, fn_b))
 
-        fn_a_values = fn_a.get_alpha_cuts_maxs(alphas)
-        fn_b_values = fn_b.get_alpha_cuts_maxs(alphas, order_by_alphas_from_one=True)
 
-        index = 0
-        for i in range(len(alphas)):
-            if fn_a_values[i] >= fn_b_values[i]:
-                break
+def necessity_strict_undervaluation(fn_a: FuzzyNumber, fn_b: FuzzyNumber) -> Decimal:
+    return FuzzyMathPrecision.get_decimal_context().subtract(Decimal(1), possibility_exceedance(fn_a, fn_b))
 
-            index += 1
 
-        return __value_intersection_y(fn_a_values, fn_b_values, alphas, index=index, index_change=1)
+def exceedance(fn_a: FuzzyNumber, fn_b: FuzzyNumber) -> PossibilisticMembership:
+    return PossibilisticMembership(*_indices(fn_a, fn_b, ("pe", "ne")))
 
 
-def necessity_strict_exceedance(fn_a: FuzzyNumber, fn_b: FuzzyNumber) -> Decimal:
-    if fn_a.kernel_min < fn_b.kernel_max:
-        return Decimal(0)
+def strict_exceedance(fn_a: FuzzyNumber, fn_b: FuzzyNumber) -> PossibilisticMembership:
+    return PossibilisticMembership(*_indices(fn_a, fn_b, ("pse", "nse")))
 
-    elif fn_a.min > fn_b.max:
-        return Decimal(1)
 
-    else:
-        alphas = FuzzyNumber._prepare_alphas(fn_a.alpha_levels, fn_b.alpha_levels)  # pylint: disable=W0212
+def undervaluation(fn_a: FuzzyNumber, fn_b: FuzzyNumber) -> PossibilisticMembership:
+    nse, pse = _indices(fn_a, fn_b, ("nse", "pse"))
+    context = FuzzyMathPrecision.get_decimal_context()
+    return PossibilisticMembership(context.subtract(Decimal(1), nse), context.subtract(Decimal(1), pse))
 
-        fn_a_values = fn_a.get_alpha_cuts_mins(alphas, order_by_alphas_from_one=True)
-        fn_b_values = fn_b.get_alpha_cuts_maxs(alphas, order_by_alphas_from_one=True)
 
-        index = 0
-        for i in range(len(alphas)):
-            if fn_a_values[i] >= fn_b_values[i]:
-                break
+def strict_undervaluation(fn_a: FuzzyNumber, fn_b: FuzzyNumber) -> PossibilisticMembership:
+    ne, pe = _indices(fn_a, fn_b, ("ne", "pe"))
+    context = FuzzyMathPrecision.get_decimal_context()
+    return PossibilisticMembership(context.subtract(Decimal(1), ne), context.subtract(Decimal(1), pe))
 
-            index += 1
 
-        return __value_intersection_y(fn_a_values, fn_b_values, alphas, index=index, index_change=1)
+def _indices(fn_a: FuzzyNumber, fn_b: FuzzyNumber, indices: Tuple[str, ...]) -> List[Decimal]:
+    """
+    Calculates the requested indices (keys of `_INDICES`) of pair of fuzzy numbers. Indices decided by the values at
+    alpha 0 and 1 are returned without touching the alpha cuts, the others are found by bisection on the compiled
+    piecewise linear forms of the fuzzy numbers, which evaluates the bound functions only O(log K) times.
+    """
+    if not isinstance(fn_a, FuzzyNumber) or not isinstance(fn_b, FuzzyNumber):
+        raise TypeError(
+            f"Only `FuzzyNumber`s can be compared. Found `{type(fn_a).__name__}` and `{type(fn_b).__name__}`."
+        )
 
+    results: List[Optional[Decimal]] = [None] * len(indices)
 
-def possibility_undervaluation(fn_a: FuzzyNumber, fn_b: FuzzyNumber) -> Decimal:
-    return Decimal(1) - necessity_strict_exceedance(fn_a, fn_b)
+    with localcontext(FuzzyMathPrecision.get_decimal_context()):
+        for i, index in enumerate(indices):
+            (side_a, reflected_a), (side_b, reflected_b), strict = _INDICES[index]
 
+            if not _holds(
+                _endpoint(fn_a, side_a, reflected_a, False) - _endpoint(fn_b, side_b, reflected_b, False), strict
+            ):
+                results[i] = Decimal(0)
+            elif _holds(
+                _endpoint(fn_a, side_a, reflected_a, True) - _endpoint(fn_b, side_b, reflected_b, True), strict
+            ):
+                results[i] = Decimal(1)
 
-def necessity_undervaluation(fn_a: FuzzyNumber, fn_b: FuzzyNumber) -> Decimal:
-    return Decimal(1) - possibility_strict_exceedance(fn_a, fn_b)
+        if None not in results:
+            return results
 
+        alphas = AlphaGrid.merge(fn_a.alpha_levels, fn_b.alpha_levels)
 
-def possibility_strict_undervaluation(fn_a: FuzzyNumber, fn_b: FuzzyNumber) -> Decimal:
-    return Decimal(1) - necessity_exceedance(fn_a, fn_b)
+        piecewise_linear_a = fn_a.piecewise_linear
+        piecewise_linear_b = fn_b.piecewise_linear
 
+        for i, index in enumerate(indices):
+            if results[i] is None:
+                bound_a, bound_b, strict = _INDICES[index]
+                results[i] = _crossing(piecewise_linear_a, bound_a, piecewise_linear_b, bound_b, alphas, strict)
 
-def necessity_strict_undervaluation(fn_a: FuzzyNumber, fn_b: FuzzyNumber) -> Decimal:
-    return Decimal(1) - possibility_exceedance(fn_a, fn_b)
-
-
-def __value_intersection_y(
-    fn_a_values: Sequence[Union[float, Decimal]],
-    fn_b_values: Sequence[Union[float, Decimal]],
-    alphas: Sequence[Union[float, Decimal]],
-    index: int,
-    index_change: int,
-):
-    return __intersection_y(
-        fn_a_values[index],
-        alphas[index],
-        fn_a_values[index + index_change],
-        alphas[index + index_change],
-        fn_b_values[index],
-        alphas[index],
-        fn_b_values[index + index_change],
-        alphas[index + index_change],
-    )
+    return results
 
 
-def __intersection_y(x1, y1, x2, y2, x3, y3, x4, y4):
-    x12 = x1 - x2
-    x34 = x3 - x4
-    y12 = y1 - y2
-    y34 = y3 - y4
+def _holds(difference: Decimal, strict: bool) -> bool:
+    """
+    Is the condition of index satisfied for difference of bound functions? Strict indices require positive difference.
+    """
+    return difference > 0 if strict else difference >= 0
 
-    c = x12 * y34 - y12 * x34
 
-    a = x1 * y2 - y1 * x2
-    b = x3 * y4 - y3 * x4
+def _endpoint(fuzzy_number: FuzzyNumber, side: str, reflected: bool, at_one: bool) -> Decimal:
+    """
+    Value of bound function at alpha 1 (`at_one`) or alpha 0, without extracting alpha cuts.
+    """
+    if at_one != reflected:
+        return fuzzy_number.kernel_min if side == "min" else fuzzy_number.kernel_max
 
-    # x = (a * x34 - b * x12) / c
-    y = (a * y34 - b * y12) / c
+    return fuzzy_number.min if side == "min" else fuzzy_number.max
 
-    return y
 
+def _bound(piecewise_linear: PiecewiseLinear, side: str, reflected: bool, alpha: Decimal) -> Decimal:
+    """
+    Value of bound function at `alpha`, that is minimum or maximum of alpha cut at `alpha` or at 1 - `alpha`.
+    """
+    if reflected:
+        alpha = _reflect(alpha)
 
-def exceedance(fn_a: FuzzyNumber, fn_b: FuzzyNumber) -> PossibilisticMembership:
-    return PossibilisticMembership(possibility_exceedance(fn_a, fn_b), necessity_exceedance(fn_a, fn_b))
+    return piecewise_linear.minimum(alpha) if side == "min" else piecewise_linear.maximum(alpha)
 
 
-def strict_exceedance(fn_a: FuzzyNumber, fn_b: FuzzyNumber) -> PossibilisticMembership:
-    return PossibilisticMembership(possibility_strict_exceedance(fn_a, fn_b), necessity_strict_exceedance(fn_a, fn_b))
+def _crossing(
+    piecewise_linear_a: PiecewiseLinear,
+    bound_a: Tuple[str, bool],
+    piecewise_linear_b: PiecewiseLinear,
+    bound_b: Tuple[str, bool],
+    alphas: AlphaGrid,
+    strict: bool,
+) -> Decimal:
+    """
+    Highest alpha at which non-increasing piecewise linear function `bound_a - bound_b` is not negative (positive if
+    `strict`), the condition has to hold at alpha 0 and not at alpha 1. Scalar counterpart of `_last_crossing()`.
 
+    Breakpoints of the function are `alphas` (merged grid of both fuzzy numbers) and reflected values `1 - alphas`. The
+    bracket containing the crossing is first found by bisection over `alphas` and then narrowed by bisection over the
+    reflected values inside it, so the function is linear in the final bracket.
+    """
 
-def undervaluation(fn_a: FuzzyNumber, fn_b: FuzzyNumber) -> PossibilisticMembership:
-    return PossibilisticMembership(possibility_undervaluation(fn_a, fn_b), necessity_undervaluation(fn_a, fn_b))
+    def difference(alpha: Decimal) -> Decimal:
+        return _bound(piecewise_linear_a, *bound_a, alpha) - _bound(piecewise_linear_b, *bound_b, alpha)
 
+    last = len(alphas) - 1
 
-def strict_undervaluation(fn_a: FuzzyNumber, fn_b: FuzzyNumber) -> PossibilisticMembership:
-    return PossibilisticMembership(
-        possibility_strict_undervaluation(fn_a, fn_b), necessity_strict_undervaluation(fn_a, fn_b)
+    alpha_low, difference_low, alpha_high, difference_high = _bisect(
+        alphas.__getitem__, difference, last, difference(alphas[0]), difference(alphas[last]), strict
     )
+
+    # reflected values strictly between `alpha_low` and `alpha_high`, in ascending order
+    first = len(alphas) - bisect_left(alphas, _reflect(alpha_low))
+    stop = len(alphas) - bisect_right(alphas, _reflect(alpha_high))
+
+    def point(i: int) -> Decimal:
+        if i == 0:
+            return alpha_low
+        if i == stop - first + 1:
+            return alpha_high
+        return _reflect(alphas[last - first - i + 1])
+
+    if first < stop:
+        alpha_low, difference_low, alpha_high, difference_high = _bisect(
+            point, difference, stop - first + 1, difference_low, difference_high, strict
+        )
+
+    return alpha_low + (alpha_high - alpha_low) * (difference_low / (difference_low - difference_high))
+
+
+def _reflect(alpha: Decimal) -> Decimal:
+    """
+    Exact value of 1 - `alpha`, so that reflecting twice returns the original alpha.
+    """
+    return _EXACT_CONTEXT.subtract(Decimal(1), alpha)
+
+
+def _bisect(
+    point: Callable[[int], Decimal],
+    difference: Callable[[Decimal], Decimal],
+    high: int,
+    difference_low: Decimal,
+    difference_high: Decimal,
+    strict: bool,
+) -> Tuple[Decimal, Decimal, Decimal, Decimal]:
+    """
+    Bisection over ascending points `point(0)` to `point(high)`, with condition of index (see `_holds()`) satisfied
+    at the first one and not at the last one. Returns neighbouring points enclosing the crossing and values of
+    `difference` at them.
+    """
+    low = 0
+    alpha_low = point(low)
+    alpha_high = point(high)
+
+    while high - low > 1:
+        middle = (low + high) // 2
+        alpha = point(middle)
+        value = difference(alpha)
+
+        if _holds(value, strict):
+            low, alpha_low, difference_low = middle, alpha, value
+        else:
+            high, alpha_high, difference_high = middle, alpha, value
+
+    return alpha_low, difference_low, alpha_high, difference_high
+
+
+def exceedance_matrix(
+    fuzzy_numbers_a: Sequence[FuzzyNumber],
+    fuzzy_numbers_b: Optional[Sequence[FuzzyNumber]] = None,
+    chunk_size: int = 256,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pairwise `exceedance()` of all fuzzy numbers from `fuzzy_numbers_a` against all fuzzy numbers from
+    `fuzzy_numbers_b`, calculated by vectorized kernel in float64.
+
+    Parameters
+    ----------
+    fuzzy_numbers_a: Sequence[FuzzyNumber]
+
+    fuzzy_numbers_b: Optional[Sequence[FuzzyNumber]]
+        If `None` (default), `fuzzy_numbers_a` are compared with themselves.
+
+    chunk_size: int
+        Number of rows calculated at once. Default `256`. All fuzzy numbers are aligned on one grid of K alpha levels
+        (union of alpha levels of all inputs, together with 1 - alpha), bounds of all `fuzzy_numbers_b` are held as
+        float64 block of shape (M, K) and bounds of `fuzzy_numbers_a` are extracted per chunk. Besides the results, the
+        memory use is therefore proportional to `(chunk_size + M) * K` for the bounds plus `chunk_size * M * K` for
+        pairwise differences. Only the number of rows N is bounded by chunking, K and M are not.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Possibility and necessity matrices, element `[i, j]` compares `fuzzy_numbers_a[i]` with `fuzzy_numbers_b[j]`.
+    """
+    return _comparison_matrices(fuzzy_numbers_a, fuzzy_numbers_b, chunk_size, ("pe", "ne"))
+
+
+def strict_exceedance_matrix(
+    fuzzy_numbers_a: Sequence[FuzzyNumber],
+    fuzzy_numbers_b: Optional[Sequence[FuzzyNumber]] = None,
+    chunk_size: int = 256,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pairwise `strict_exceedance()`, see `exceedance_matrix()` for description of parameters.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Possibility and necessity matrices.
+    """
+    return _comparison_matrices(fuzzy_numbers_a, fuzzy_numbers_b, chunk_size, ("pse", "nse"))
+
+
+def undervaluation_matrix(
+    fuzzy_numbers_a: Sequence[FuzzyNumber],
+    fuzzy_numbers_b: Optional[Sequence[FuzzyNumber]] = None,
+    chunk_size: int = 256,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pairwise `undervaluation()`, see `exceedance_matrix()` for description of parameters.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Possibility and necessity matrices.
+    """
+    possibility, necessity = _comparison_matrices(fuzzy_numbers_a, fuzzy_numbers_b, chunk_size, ("nse", "pse"))
+    return 1 - possibility, 1 - necessity
+
+
+def strict_undervaluation_matrix(
+    fuzzy_numbers_a: Sequence[FuzzyNumber],
+    fuzzy_numbers_b: Optional[Sequence[FuzzyNumber]] = None,
+    chunk_size: int = 256,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pairwise `strict_undervaluation()`, see `exceedance_matrix()` for description of parameters.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Possibility and necessity matrices.
+    """
+    possibility, necessity = _comparison_matrices(fuzzy_numbers_a, fuzzy_numbers_b, chunk_size, ("ne", "pe"))
+    return 1 - possibility, 1 - necessity
+
+
+_EXACT_CONTEXT = Context(prec=MAX_PREC)
+
+# every index is the highest alpha at which the (non-increasing) difference of two bound functions is not negative,
+# or positive for strict indices, so that equal values (e.g. crisp numbers or vertical edges) do not strictly exceed
+# each other; bound functions are minimums or maximums of alpha cuts either at alpha or at 1 - alpha (reflected)
+_INDICES = {
+    "pe": (("max", False), ("min", False), False),
+    "ne": (("min", True), ("min", False), False),
+    "pse": (("max", False), ("max", True), True),
+    "nse": (("min", True), ("max", True), True),
+}
+
+
+def _comparison_matrices(
+    fuzzy_numbers_a: Sequence[FuzzyNumber],
+    fuzzy_numbers_b: Optional[Sequence[FuzzyNumber]],
+    chunk_size: int,
+    indices: Tuple[str, ...],
+) -> Tuple[np.ndarray, ...]:
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise ValueError(f"`chunk_size` must be positive integer. It is `{chunk_size}`.")
+
+    fuzzy_numbers_a = list(fuzzy_numbers_a)
+    fuzzy_numbers_b = fuzzy_numbers_a if fuzzy_numbers_b is None else list(fuzzy_numbers_b)
+
+    for fuzzy_number in fuzzy_numbers_a + fuzzy_numbers_b:
+        if not isinstance(fuzzy_number, FuzzyNumber):
+            raise TypeError(f"Only `FuzzyNumber`s can be compared. Found `{type(fuzzy_number).__name__}`.")
+
+    alphas = _symmetric_grid(fuzzy_numbers_a + fuzzy_numbers_b)
+
+    values_b = _bounds(fuzzy_numbers_b, alphas)
+
+    float_alphas = np.array(alphas, dtype=np.float64)
+
+    results = tuple(np.empty((len(fuzzy_numbers_a), len(fuzzy_numbers_b)), dtype=np.float64) for _ in indices)
+
+    for start in range(0, len(fuzzy_numbers_a), chunk_size):
+        stop = start + chunk_size
+
+        # bounds of rows are extracted per chunk, unless they are already available as bounds of the columns
+        if fuzzy_numbers_b is fuzzy_numbers_a:
+            values_a = {key: values[start:stop] for key, values in values_b.items()}
+        else:
+            values_a = _bounds(fuzzy_numbers_a[start:stop], alphas)
+
+        for result, index in zip(results, indices):
+            (side_a, reflected_a), (side_b, reflected_b), strict = _INDICES[index]
+
+            differences = (
+                values_a[side_a, reflected_a][:, np.newaxis, :] - values_b[side_b, reflected_b][np.newaxis, :, :]
+            )
+
+            result[start:stop] = _last_crossing(differences, float_alphas, strict)
+
+    return results
+
+
+def _symmetric_grid(fuzzy_numbers: List[FuzzyNumber]) -> AlphaGrid:
+    """
+    Union of alpha levels of all fuzzy numbers, together with reflected values (1 - alpha), so that the alpha cuts at
+    1 - alpha are on the grid as well.
+    """
+    grids = {id(fuzzy_number.alpha_levels): fuzzy_number.alpha_levels for fuzzy_number in fuzzy_numbers}
+
+    alphas = set()
+    for grid in grids.values():
+        alphas.update(grid)
+
+    alphas.update([_reflect(alpha) for alpha in alphas])
+
+    return AlphaGrid.intern(sorted(alphas))
+
+
+def _bounds(fuzzy_numbers: List[FuzzyNumber], alphas: AlphaGrid) -> Dict[Tuple[str, bool], np.ndarray]:
+    """
+    Minimums and maximums of alpha cuts on `alphas` as float arrays of shape (N, K), both in order of `alphas` and
+    reflected (values at 1 - alpha).
+    """
+    values = np.empty((len(fuzzy_numbers), len(alphas), 2), dtype=np.float64)
+
+    for i, fuzzy_number in enumerate(fuzzy_numbers):
+        alpha_cuts = fuzzy_number._alpha_cuts_on_grid(alphas)  # pylint: disable=W0212
+        values[i, :, 0] = [float(alpha_cut.min) for alpha_cut in alpha_cuts]
+        values[i, :, 1] = [float(alpha_cut.max) for alpha_cut in alpha_cuts]
+
+    return {
+        ("min", False): values[..., 0],
+        ("max", False): values[..., 1],
+        ("min", True): values[:, ::-1, 0],
+        ("max", True): values[:, ::-1, 1],
+    }
+
+
+def _last_crossing(differences: np.ndarray, alphas: np.ndarray, strict: bool) -> np.ndarray:
+    """
+    Highest alpha at which non-increasing piecewise linear function (sampled at `alphas` along the last axis) is not
+    negative (positive if `strict`). `0` if the condition does not hold anywhere, `1` if it holds everywhere.
+    """
+    count = np.count_nonzero(differences > 0 if strict else differences >= 0, axis=-1)
+
+    lower = np.clip(count - 1, 0, alphas.size - 2)[..., np.newaxis]
+
+    difference_low = np.take_along_axis(differences, lower, axis=-1)[..., 0]
+    difference_high = np.take_along_axis(differences, lower + 1, axis=-1)[..., 0]
+
+    lower = lower[..., 0]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        crossing = alphas[lower] + (alphas[lower + 1] - alphas[lower]) * (
+            difference_low / (difference_low - difference_high)
+        )
+
+    return np.where(count == 0, 0.0, np.where(count == alphas.size, 1.0, crossing))
@@ -0,0 +1,157 @@
+import itertools
+from decimal import Decimal
+from inspect import BoundArguments, signature
+from types import BuiltinFunctionType, FunctionType
+from typing import Callable, List, Sequence
+
+import numpy as np
+
+from .class_alpha_grid import AlphaGrid
+from .class_fuzzy_number import FuzzyNumber
+from .class_interval import Interval
+
+
+def apply_function_multivariate(
+    function: Callable,
+    fuzzy_numbers: Sequence[FuzzyNumber],
+    *args,
+    monotone: bool = False,
+    number_elements: int = 10,
+    vectorized: bool = False,
+    **kwargs,
+) -> FuzzyNumber:
+    """
+    Apply mathematical function of several variables to fuzzy numbers (extension principle). For every alpha level the
+    function is evaluated over the box given by alpha cuts of all the fuzzy numbers, so every fuzzy number is used only
+    once, unlike expression built from arithmetic operators, which overestimates terms that depend on the same fuzzy
+    number.
+
+    Parameters
+    ----------
+    function: (FunctionType, BuiltinFunctionType, np.ufunc)
+        Function to apply, fuzzy numbers are passed as its first positional arguments.
+
+    fuzzy_numbers: Sequence[FuzzyNumber]
+        Fuzzy numbers to use as arguments of the `function`.
+
+    args
+        Additional positional arguments for the `function`.
+
+    monotone: bool
+        Is the function monotone in each of the arguments? If `True` only vertices of the boxes are evaluated (vertex
+        method). Default `False`.
+
+    number_elements: int
+        Number of elements to divide every alpha cut into, if the function is not monotone. The function is evaluated
+        `(number_elements + 1) ** len(fuzzy_numbers)` times per alpha level. Default is `10`.
+
+    vectorized: bool
+        Does the `function` accept NumPy arrays of floats and return array of results? If `True` the function is called
+        only once, with all the points of all the boxes. NumPy ufuncs are always treated as vectorized. Default `False`.
+
+    kwargs
+        Named arguments to pass into `function`.
+
+    Returns
+    -------
+    FuzzyNumber
+    """
+    if not isinstance(function, (FunctionType, BuiltinFunctionType, np.ufunc)):
+        raise TypeError(f"`function` needs to be a function. It is `{type(function).__name__}`.")
+
+    fuzzy_numbers = list(fuzzy_numbers)
+
+    if not fuzzy_numbers:
+        raise ValueError("At least one `FuzzyNumber` is needed.")
+
+    for fuzzy_number in fuzzy_numbers:
+        if not isinstance(fuzzy_number, FuzzyNumber):
+            raise TypeError(f"All `fuzzy_numbers` must be `FuzzyNumber`. Found `{type(fuzzy_number).__name__}`.")
+
+    if not isinstance(number_elements, int) or number_elements < 1:
+        raise ValueError(f"`number_elements` must be positive integer. It is `{number_elements}`.")
+
+    alphas = fuzzy_numbers[0].alpha_levels
+    for fuzzy_number in fuzzy_numbers[1:]:
+        alphas = AlphaGrid.merge(alphas, fuzzy_number.alpha_levels)
+
+    alpha_cuts = [fuzzy_number._alpha_cuts_on_grid(alphas) for fuzzy_number in fuzzy_numbers]  # pylint: disable=W0212
+
+    number_points = 2 if monotone else number_elements + 1
+
+    if vectorized or isinstance(function, np.ufunc):
+        minimums, maximums = _evaluate_boxes_vectorized(function, alpha_cuts, number_points, args, kwargs)
+    else:
+        minimums, maximums = _evaluate_boxes(function, alpha_cuts, number_points, args, kwargs)
+
+    # alpha cuts of result have to be nested, process from kernel outwards
+    for i in range(len(alphas) - 2, -1, -1):
+        minimums[i] = min(minimums[i], minimums[i + 1])
+        maximums[i] = max(maximums[i], maximums[i + 1])
+
+    intervals = [Interval(minimum, maximum) for minimum, maximum in zip(minimums, maximums)]
+
+    return FuzzyNumber._from_trusted(alphas, intervals)  # pylint: disable=W0212
+
+
+def _evaluate_boxes_vectorized(
+    function: Callable, alpha_cuts: List[List[Interval]], number_points: int, args: tuple, kwargs: dict
+) -> tuple:
+    """
+    Evaluates the function in all the boxes at once. Points of every argument are arranged along its own axis, so the
+    arrays broadcast into shape (K, P, P, ...).
+    """
+    number_arguments = len(alpha_cuts)
+    steps = np.linspace(0, 1, number_points)
+
+    arguments = []
+
+    for i, cuts in enumerate(alpha_cuts):
+        lows = np.array([float(cut.min) for cut in cuts], dtype=np.float64)
+        highs = np.array([float(cut.max) for cut in cuts], dtype=np.float64)
+
+        points = lows[:, np.newaxis] + (highs - lows)[:, np.newaxis] * steps[np.newaxis, :]
+
+        shape = [len(cuts)] + [1] * number_arguments
+        shape[i + 1] = number_points
+
+        arguments.append(points.reshape(shape))
+
+    arguments = np.broadcast_arrays(*arguments)
+
+    results = np.asarray(function(*arguments, *args, **kwargs), dtype=np.float64)
+    results = results.reshape(results.shape[0], -1)
+
+    return results.min(axis=1).tolist(), results.max(axis=1).tolist()
+
+
+def _evaluate_boxes(
+    function: Callable, alpha_cuts: List[List[Interval]], number_points: int, args: tuple, kwargs: dict
+) -> tuple:
+    """
+    Evaluates the function in all the boxes point by point with `Decimal` arguments. Arguments are bound only once.
+    """
+    number_arguments = len(alpha_cuts)
+
+    bound_params: BoundArguments = signature(function).bind(*([Decimal(0)] * number_arguments), *args, **kwargs)
+    bound_params.apply_defaults()
+
+    other_args = bound_params.args[number_arguments:]
+    other_kwargs = bound_params.kwargs
+
+    minimums = []
+    maximums = []
+
+    for box in zip(*alpha_cuts):
+        elements = []
+
+        for cut in box:
+            step = (cut.max - cut.min) / (number_points - 1)
+            elements.append([cut.min + step * i for i in range(number_points - 1)] + [cut.max])
+
+        results = [function(*point, *other_args, **other_kwargs) for point in itertools.product(*elements)]
+
+        minimums.append(min(results))
+        maximums.append(max(results))
+
+    return minimums, maximums
@@ -0,0 +1,344 @@
+import operator
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from .class_alpha_grid import AlphaGrid
+from .class_fuzzy_number import FuzzyNumber
+from .class_interval import Interval
+from .class_precision import FuzzyMathPrecision, PrecisionSettings
+from .fuzzynumber_reductions import fprod, fsum
+
+EncodedChunk = Tuple[Tuple[Tuple[str, ...], ...], Tuple[Tuple[int, Tuple[str, ...]], ...]]
+
+OPERATIONS: Dict[str, Callable] = {
+    "add": operator.add,
+    "sub": operator.sub,
+    "mul": operator.mul,
+    "truediv": operator.truediv,
+    "pow": operator.pow,
+}
+
+REDUCTIONS: Dict[str, Callable] = {
+    "sum": fsum,
+    "prod": fprod,
+}
+
+
+def parallel_map(
+    operation: str,
+    x: Sequence[FuzzyNumber],
+    y: Union[Sequence[FuzzyNumber], FuzzyNumber, int, float],
+    workers: Optional[int] = None,
+    chunk_size: int = 1000,
+) -> List[FuzzyNumber]:
+    """
+    Element-wise arithmetic operation on fuzzy numbers calculated in process pool.
+
+    Parameters
+    ----------
+    operation: str
+        One of `add`, `sub`, `mul`, `truediv` and `pow`.
+
+    x: Sequence[FuzzyNumber]
+        Left operands.
+
+    y: Union[Sequence[FuzzyNumber], FuzzyNumber, int, float]
+        Right operands. Either sequence of same length as `x`, or single value used for all elements of `x`.
+
+    workers: Optional[int]
+        Number of worker processes. `None` means number of processors, `1` calculates in current process.
+
+    chunk_size: int
+        Number of fuzzy numbers sent to worker at once.
+
+    Returns
+    -------
+    List[FuzzyNumber]
+    """
+    if operation not in OPERATIONS:
+        raise ValueError(f"Unknown `operation` `{operation}`. Must be one of: {', '.join(OPERATIONS)}.")
+
+    x = list(x)
+
+    if isinstance(y, (int, float)):
+        payloads = [(operation, _encode_chunk(chunk), y) for chunk in _chunks(x, chunk_size)]
+    elif isinstance(y, FuzzyNumber):
+        encoded_y = _encode_chunk([y])
+        payloads = [(operation, _encode_chunk(chunk), encoded_y) for chunk in _chunks(x, chunk_size)]
+    else:
+        y = list(y)
+
+        if len(x) != len(y):
+            raise ValueError(f"`x` and `y` must be of same length. Currently the lengths are {len(x)} and {len(y)}.")
+
+        payloads = [
+            (operation, _encode_chunk(chunk_x), _encode_chunk(chunk_y))
+            for chunk_x, chunk_y in zip(_chunks(x, chunk_size), _chunks(y, chunk_size))
+        ]
+
+    with _Executor(workers) as executor:
+        return _decode_chunks(executor.map(_map_chunk, payloads))
+
+
+def parallel_apply_function(
+    fuzzy_numbers: Sequence[FuzzyNumber],
+    function: Callable,
+    *args,
+    monotone: bool = False,
+    number_elements: int = 1000,
+    vectorized: bool = False,
+    tolerance: Optional[Union[float, Decimal]] = None,
+    workers: Optional[int] = None,
+    chunk_size: int = 100,
+    **kwargs,
+) -> List[FuzzyNumber]:
+    """
+    Applies `FuzzyNumber.apply_function()` to every fuzzy number, calculated in process pool. The `function`, `args` and
+    `kwargs` have to be picklable, so `function` has to be defined on module level.
+
+    Parameters
+    ----------
+    fuzzy_numbers: Sequence[FuzzyNumber]
+
+    function: Callable
+        Function to apply.
+
+    args
+        Positional arguments for the `function`.
+
+    monotone: bool
+        Is the function monotone? Default `False`.
+
+    number_elements: int
+        Number of elements to divide fuzzy numbers into, if the function is not monotone. Default is `1000`.
+
+    vectorized: bool
+        Does the `function` accept NumPy array of floats and return array of results? Default `False`.
+
+    tolerance: Optional[Union[float, Decimal]]
+        If provided (and the function is not monotone), the support is sampled adaptively instead of by
+        `number_elements` elements. Default `None`.
+
+    workers: Optional[int]
+        Number of worker processes. `None` means number of processors, `1` calculates in current process.
+
+    chunk_size: int
+        Number of fuzzy numbers sent to worker at once.
+
+    kwargs
+        Named arguments to pass into `function`.
+
+    Returns
+    -------
+    List[FuzzyNumber]
+    """
+    payloads = [
+        (_encode_chunk(chunk), function, args, monotone, number_elements, vectorized, tolerance, kwargs)
+        for chunk in _chunks(list(fuzzy_numbers), chunk_size)
+    ]
+
+    with _Executor(workers) as executor:
+        return _decode_chunks(executor.map(_apply_function_chunk, payloads))
+
+
+def parallel_reduce(
+    reduction: str,
+    fuzzy_numbers: Sequence[FuzzyNumber],
+    workers: Optional[int] = None,
+    chunk_size: int = 1000,
+) -> FuzzyNumber:
+    """
+    Reduces fuzzy numbers in process pool. Chunks of fuzzy numbers are reduced by workers and the partial results are
+    then combined pairwise, level by level. The shape of the reduction tree depends only on the number of fuzzy numbers
+    and `chunk_size`, so the result is the same for any number of workers.
+
+    Parameters
+    ----------
+    reduction: str
+        Either `sum` or `prod`.
+
+    fuzzy_numbers: Sequence[FuzzyNumber]
+
+    workers: Optional[int]
+        Number of worker processes. `None` means number of processors, `1` calculates in current process.
+
+    chunk_size: int
+        Number of fuzzy numbers sent to worker at once.
+
+    Returns
+    -------
+    FuzzyNumber
+    """
+    if reduction not in REDUCTIONS:
+        raise ValueError(f"Unknown `reduction` `{reduction}`. Must be one of: {', '.join(REDUCTIONS)}.")
+
+    fuzzy_numbers = list(fuzzy_numbers)
+
+    if not fuzzy_numbers:
+        raise ValueError("Cannot reduce empty `fuzzy_numbers`, at least one `FuzzyNumber` is needed.")
+
+    payloads = [(reduction, _encode_chunk(chunk)) for chunk in _chunks(fuzzy_numbers, chunk_size)]
+
+    with _Executor(workers) as executor:
+        partials = list(executor.map(_reduce_chunk, payloads))
+
+        while len(partials) > 1:
+            payloads = [(reduction, _join_chunks(partials[i], partials[i + 1])) for i in range(0, len(partials) - 1, 2)]
+
+            carried = [partials[-1]] if len(partials) % 2 else []
+
+            partials = list(executor.map(_reduce_chunk, payloads)) + carried
+
+    return _decode_chunk(partials[0])[0]
+
+
+class _Executor:
+    """
+    Process pool that passes current `FuzzyMathPrecision` settings to workers. With single worker, everything is
+    calculated in current process.
+    """
+
+    def __init__(self, workers: Optional[int]):
+        if workers is not None and (not isinstance(workers, int) or workers < 1):
+            raise ValueError(f"`workers` must be positive integer or `None`. It is `{workers}`.")
+
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+        if workers != 1:
+            self._pool = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_initialize_worker,
+                initargs=(FuzzyMathPrecision.current(),),
+            )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._pool is not None:
+            self._pool.shutdown()
+
+    def map(self, function: Callable, payloads: list) -> list:
+        if self._pool is None:
+            return list(map(function, payloads))
+
+        return list(self._pool.map(function, payloads))
+
+
+def _initialize_worker(settings: PrecisionSettings) -> None:
+    FuzzyMathPrecision.use(settings)
+
+
+def _chunks(values: list, chunk_size: int) -> List[list]:
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise ValueError(f"`chunk_size` must be positive integer. It is `{chunk_size}`.")
+
+    return [values[i : i + chunk_size] for i in range(0, len(values), chunk_size)]
+
+
+def _encode_chunk(fuzzy_numbers: Sequence[FuzzyNumber]) -> EncodedChunk:
+    """
+    Encodes fuzzy numbers into tuples of strings. Every alpha grid is stored only once per chunk.
+    """
+    grids: Dict[AlphaGrid, int] = {}
+    items = []
+
+    for fuzzy_number in fuzzy_numbers:
+        if not isinstance(fuzzy_number, FuzzyNumber):
+            raise TypeError(
+                "Only `FuzzyNumber` can be processed in parallel. "
+                f"Found element of type `{type(fuzzy_number).__name__}`."
+            )
+
+        grid_index = grids.setdefault(fuzzy_number.alpha_levels, len(grids))
+
+        values = []
+        for alpha_cut in fuzzy_number._alpha_cuts.values():  # pylint: disable=W0212
+            values.append(str(alpha_cut.min))
+            values.append(str(alpha_cut.max))
+
+        items.append((grid_index, tuple(values)))
+
+    encoded_grids = tuple(tuple(str(alpha) for alpha in grid) for grid in grids)
+
+    return encoded_grids, tuple(items)
+
+
+def _decode_chunk(chunk: EncodedChunk) -> List[FuzzyNumber]:
+    encoded_grids, items = chunk
+
+    grids = [AlphaGrid.intern([Decimal(alpha) for alpha in grid]) for grid in encoded_grids]
+
+    fuzzy_numbers = []
+
+    for grid_index, values in items:
+        decimals = [Decimal(value) for value in values]
+        intervals = [Interval._from_ordered(decimals[i], decimals[i + 1]) for i in range(0, len(decimals), 2)]
+        fuzzy_numbers.append(FuzzyNumber._from_trusted(grids[grid_index], intervals))  # pylint: disable=W0212
+
+    return fuzzy_numbers
+
+
+def _decode_chunks(chunks: Sequence[EncodedChunk]) -> List[FuzzyNumber]:
+    fuzzy_numbers = []
+
+    for chunk in chunks:
+        fuzzy_numbers.extend(_decode_chunk(chunk))
+
+    return fuzzy_numbers
+
+
+def _join_chunks(chunk1: EncodedChunk, chunk2: EncodedChunk) -> EncodedChunk:
+    grids1, items1 = chunk1
+    grids2, items2 = chunk2
+
+    offset = len(grids1)
+
+    return grids1 + grids2, items1 + tuple((grid_index + offset, values) for grid_index, values in items2)
+
+
+def _map_chunk(payload) -> EncodedChunk:
+    operation, chunk_x, y = payload
+
+    function = OPERATIONS[operation]
+
+    x = _decode_chunk(chunk_x)
+
+    if not isinstance(y, (int, float)):
+        y = _decode_chunk(y)
+
+        if len(y) == 1:
+            y = y[0]
+
+    if isinstance(y, list):
+        results = [function(fuzzy_number_x, fuzzy_number_y) for fuzzy_number_x, fuzzy_number_y in zip(x, y)]
+    else:
+        results = [function(fuzzy_number, y) for fuzzy_number in x]
+
+    return _encode_chunk(results)
+
+
+def _apply_function_chunk(payload) -> EncodedChunk:
+    chunk, function, args, monotone, number_elements, vectorized, tolerance, kwargs = payload
+
+    results = [
+        fuzzy_number.apply_function(
+            function,
+            *args,
+            monotone=monotone,
+            number_elements=number_elements,
+            vectorized=vectorized,
+            tolerance=tolerance,
+            **kwargs,
+        )
+        for fuzzy_number in _decode_chunk(chunk)
+    ]
+
+    return _encode_chunk(results)
+
+
+def _reduce_chunk(payload) -> EncodedChunk:
+    reduction, chunk = payload
+
+    return _encode_chunk([REDUCTIONS[reduction](_decode_chunk(chunk))])
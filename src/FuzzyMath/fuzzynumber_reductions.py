@@ -0,0 +1,177 @@
+from decimal import Decimal, localcontext
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+
+from .class_alpha_grid import AlphaGrid
+from .class_fuzzy_number import FuzzyNumber
+from .class_interval import Interval
+from .class_precision import FuzzyMathPrecision
+
+
+def fsum(
+    iterable: Iterable[FuzzyNumber], alphas: Optional[Sequence[Union[str, int, float, Decimal]]] = None
+) -> FuzzyNumber:
+    """
+    Sum of fuzzy numbers. The fuzzy numbers are consumed one by one and the bounds of alpha cuts are accumulated in
+    place, so memory use does not depend on the number of fuzzy numbers and `iterable` can be a generator.
+
+    Parameters
+    ----------
+    iterable: Iterable[FuzzyNumber]
+        Fuzzy numbers to sum.
+
+    alphas: Optional[Sequence[Union[str, int, float, Decimal]]]
+        Alpha levels of the result. If not provided, the alpha levels of the result are union of alpha levels of all
+        fuzzy numbers, same as with repeated `+`.
+
+    Returns
+    -------
+    FuzzyNumber
+
+    Raises
+    -------
+    ValueError
+        If `iterable` is empty.
+    TypeError
+        If `iterable` contains something else then `FuzzyNumber`.
+    """
+    return _reduce(iterable, alphas, _add)
+
+
+def fprod(
+    iterable: Iterable[FuzzyNumber], alphas: Optional[Sequence[Union[str, int, float, Decimal]]] = None
+) -> FuzzyNumber:
+    """
+    Product of fuzzy numbers. The fuzzy numbers are consumed one by one and the bounds of alpha cuts are accumulated in
+    place, so memory use does not depend on the number of fuzzy numbers and `iterable` can be a generator.
+
+    Parameters
+    ----------
+    iterable: Iterable[FuzzyNumber]
+        Fuzzy numbers to multiply.
+
+    alphas: Optional[Sequence[Union[str, int, float, Decimal]]]
+        Alpha levels of the result. If not provided, the alpha levels of the result are union of alpha levels of all
+        fuzzy numbers, same as with repeated `*`.
+
+    Returns
+    -------
+    FuzzyNumber
+
+    Raises
+    -------
+    ValueError
+        If `iterable` is empty.
+    TypeError
+        If `iterable` contains something else then `FuzzyNumber`.
+    """
+    return _reduce(iterable, alphas, _multiply)
+
+
+def _add(mins: List[Decimal], maxs: List[Decimal], alpha_cuts: List[Interval]) -> None:
+    for i, alpha_cut in enumerate(alpha_cuts):
+        mins[i] += alpha_cut.min
+        maxs[i] += alpha_cut.max
+
+
+def _multiply(mins: List[Decimal], maxs: List[Decimal], alpha_cuts: List[Interval]) -> None:
+    for i, alpha_cut in enumerate(alpha_cuts):
+        values = (
+            mins[i] * alpha_cut.min,
+            mins[i] * alpha_cut.max,
+            maxs[i] * alpha_cut.min,
+            maxs[i] * alpha_cut.max,
+        )
+        mins[i] = min(values)
+        maxs[i] = max(values)
+
+
+def _reduce(iterable, alphas, accumulate) -> FuzzyNumber:
+    with localcontext(FuzzyMathPrecision.get_decimal_context()):
+        return _reduce_in_context(iterable, alphas, accumulate)
+
+
+def _reduce_in_context(iterable, alphas, accumulate) -> FuzzyNumber:
+    grid: Optional[AlphaGrid] = None
+    fixed_grid = alphas is not None
+    numeric_precision = FuzzyMathPrecision.current().numeric_precision
+
+    if fixed_grid:
+        grid = _prepare_grid(alphas)
+
+    mins: List[Decimal] = []
+    maxs: List[Decimal] = []
+    first = True
+
+    for fuzzy_number in iterable:
+        if not isinstance(fuzzy_number, FuzzyNumber):
+            raise TypeError(
+                "All elements of `iterable` must be `FuzzyNumber`. "
+                f"Found element of type `{type(fuzzy_number).__name__}`."
+            )
+
+        if grid is None:
+            grid = fuzzy_number.alpha_levels
+
+        elif not fixed_grid and fuzzy_number.alpha_levels is not grid:
+            merged_grid = AlphaGrid.merge(grid, fuzzy_number.alpha_levels)
+
+            if merged_grid is not grid:
+                if not first:
+                    mins, maxs = _align(grid, mins, maxs, merged_grid)
+                grid = merged_grid
+
+        alpha_cuts = fuzzy_number._alpha_cuts_on_grid(grid)  # pylint: disable=W0212
+
+        if first:
+            mins = [alpha_cut.min for alpha_cut in alpha_cuts]
+            maxs = [alpha_cut.max for alpha_cut in alpha_cuts]
+            first = False
+        else:
+            accumulate(mins, maxs, alpha_cuts)
+
+            # quantize after every step, as repeated `+` or `*` does, so that the results are the same
+            if numeric_precision is not None:
+                mins = [minimum.quantize(numeric_precision) for minimum in mins]
+                maxs = [maximum.quantize(numeric_precision) for maximum in maxs]
+
+    if first:
+        raise ValueError("Cannot reduce empty `iterable`, at least one `FuzzyNumber` is needed.")
+
+    intervals = [Interval._from_ordered(minimum, maximum) for minimum, maximum in zip(mins, maxs)]
+
+    return FuzzyNumber._from_trusted(grid, intervals)  # pylint: disable=W0212
+
+
+def _prepare_grid(alphas: Sequence[Union[str, int, float, Decimal]]) -> AlphaGrid:
+    values = sorted({FuzzyNumber._validate_alpha(alpha) for alpha in alphas})  # pylint: disable=W0212
+
+    if not values or values[0] != 0 or values[-1] != 1:
+        raise ValueError("`alphas` must contain both 0 and 1 alpha value.")
+
+    return AlphaGrid.intern(values)
+
+
+def _align(
+    grid_from: AlphaGrid, mins: List[Decimal], maxs: List[Decimal], grid_to: AlphaGrid
+) -> Tuple[List[Decimal], List[Decimal]]:
+    """
+    Linearly interpolates accumulated bounds from `grid_from` to `grid_to`, which has to contain all values of
+    `grid_from`.
+    """
+    new_mins = [Decimal(0)] * len(grid_to)
+    new_maxs = [Decimal(0)] * len(grid_to)
+
+    j = 0
+    for i, alpha in enumerate(grid_to):
+        if grid_from[j] == alpha:
+            new_mins[i] = mins[j]
+            new_maxs[i] = maxs[j]
+            if j < len(grid_from) - 1:
+                j += 1
+        else:
+            alpha_low = grid_from[j - 1]
+            height = grid_from[j] - alpha_low
+            new_mins[i] = mins[j - 1] + (alpha - alpha_low) * ((mins[j] - mins[j - 1]) / height)
+            new_maxs[i] = maxs[j - 1] + (alpha - alpha_low) * ((maxs[j] - maxs[j - 1]) / height)
+
+    return new_mins, new_maxs
@@ -0,0 +1,93 @@
+import threading
+from collections import OrderedDict
+from decimal import Decimal
+
+import pytest
+
+from FuzzyMath.class_alpha_grid import AlphaGrid
+from FuzzyMath.class_factories import FuzzyNumberFactory, IntervalFactory
+from FuzzyMath.class_fuzzy_number import FuzzyNumber
+
+
+def test_uniform():
+    grid = AlphaGrid.uniform(3)
+
+    assert isinstance(grid, AlphaGrid)
+    assert grid == [Decimal(0), Decimal("0.5"), Decimal(1)]
+    assert grid == (Decimal(0), Decimal("0.5"), Decimal(1))
+    assert grid != [Decimal(0), Decimal(1)]
+    assert AlphaGrid.uniform(3) is grid
+
+    with pytest.raises(ValueError, match="has to be integer and higher than 1"):
+        AlphaGrid.uniform(1)
+
+
+def test_intern():
+    grid = AlphaGrid.intern([Decimal(0), Decimal("0.25"), Decimal(1)])
+
+    assert AlphaGrid.intern([Decimal(0), Decimal("0.25"), Decimal(1)]) is grid
+    assert AlphaGrid.intern(grid) is grid
+    assert hash(grid) == hash((Decimal(0), Decimal("0.25"), Decimal(1)))
+
+
+def test_intern_normalizes():
+    grid = AlphaGrid.intern([Decimal("0.0"), Decimal("0.370"), Decimal("1.00")])
+
+    assert [str(alpha) for alpha in grid] == ["0", "0.37", "1"]
+    assert AlphaGrid.intern([Decimal(0), Decimal("0.37"), Decimal(1)]) is grid
+
+
+def test_intern_threads(monkeypatch):
+    monkeypatch.setattr(AlphaGrid, "_interned", OrderedDict())
+    monkeypatch.setattr(AlphaGrid, "_interned_size", 4)
+
+    grids = [[Decimal(0), Decimal(i) / 1000, Decimal(1)] for i in range(1, 200)]
+    errors = []
+
+    def work(offset: int):
+        try:
+            for i in range(2000):
+                values = grids[(i * 7 + offset) % len(grids)]
+                assert AlphaGrid.intern(values) == values
+        except Exception as error:  # pylint: disable=W0703
+            errors.append(error)
+
+    threads = [threading.Thread(target=work, args=(offset,)) for offset in range(8)]
+
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert len(AlphaGrid._interned) <= 4  # pylint: disable=W0212
+
+
+def test_merge():
+    grid_a = AlphaGrid.uniform(3)
+    grid_b = AlphaGrid.uniform(5)
+
+    assert AlphaGrid.merge(grid_a, grid_a) is grid_a
+    assert AlphaGrid.merge(grid_a, grid_b) is grid_b
+    assert AlphaGrid.merge(grid_b, grid_a) is grid_b
+
+    merged = AlphaGrid.merge(AlphaGrid.uniform(3), AlphaGrid.uniform(4))
+
+    assert len(merged) == 5
+    assert list(merged) == sorted(merged)
+    assert AlphaGrid.merge(AlphaGrid.uniform(4), AlphaGrid.uniform(3)) is merged
+
+
+def test_fuzzy_numbers_share_grid():
+    fn_a = FuzzyNumberFactory.triangular(1, 2, 3, number_of_cuts=11)
+    fn_b = FuzzyNumberFactory.trapezoidal(1, 2, 3, 4, number_of_cuts=11)
+    fn_c = FuzzyNumber([Decimal(1), Decimal(0)], [IntervalFactory.two_values(2, 2), IntervalFactory.two_values(1, 3)])
+
+    assert fn_a.alpha_levels is fn_b.alpha_levels
+    assert (fn_a + fn_b).alpha_levels is fn_a.alpha_levels
+    assert (fn_a * 2).alpha_levels is fn_a.alpha_levels
+    assert fn_c.alpha_levels is FuzzyNumberFactory.triangular(1, 2, 3).alpha_levels
+    assert fn_c.alpha_cuts == [IntervalFactory.two_values(1, 3), IntervalFactory.two_values(2, 2)]
+
+    assert (fn_a + fn_c).alpha_levels is fn_a.alpha_levels
+    assert fn_a + fn_c == FuzzyNumberFactory.triangular(2, 4, 6, number_of_cuts=11)
@@ -0,0 +1,188 @@
+import io
+import struct
+from decimal import Decimal
+
+import pytest
+
+from FuzzyMath import FuzzyNumber
+from FuzzyMath.class_binary_codec import (
+    BinaryRecordReader,
+    BinaryRecordWriter,
+    PayloadType,
+    RecordType,
+    _encode_decimals,
+)
+from FuzzyMath.class_factories import FuzzyNumberFactory, IntervalFactory
+
+
+def test_fuzzy_numbers_decimal():
+    fns = [FuzzyNumberFactory.triangular(i / 3, i, i + 1.1, number_of_cuts=5) for i in range(50)]
+
+    stream = io.BytesIO()
+
+    with BinaryRecordWriter(stream) as writer:
+        writer.write_many(fns)
+
+    stream.seek(0)
+
+    reader = BinaryRecordReader(stream)
+
+    assert reader.record_type == RecordType.FUZZY_NUMBER
+    assert reader.payload_type == PayloadType.DECIMAL
+    assert reader.alpha_levels is fns[0].alpha_levels
+
+    assert list(reader) == fns
+
+
+def test_fuzzy_numbers_float():
+    fns = [
+        FuzzyNumberFactory.triangular(1, 2, 3, number_of_cuts=3),
+        FuzzyNumberFactory.trapezoidal(0.5, 1, 1.5, 4),
+    ]
+
+    stream = io.BytesIO()
+
+    with BinaryRecordWriter(stream, payload_type=PayloadType.FLOAT64, alphas=[0, "0.5", 1]) as writer:
+        writer.write_many(fns)
+
+    stream.seek(0)
+
+    results = list(BinaryRecordReader(stream))
+
+    assert results[0] == fns[0]
+    assert results[1] == FuzzyNumberFactory.trapezoidal(0.5, 1, 1.5, 4, number_of_cuts=3)
+    assert results[1].alpha_levels == [Decimal(0), Decimal("0.5"), Decimal(1)]
+
+
+def test_intervals():
+    intervals = [IntervalFactory.infimum_supremum(i, i + 0.25) for i in range(10)] + [IntervalFactory.empty()]
+
+    for payload_type in PayloadType:
+        stream = io.BytesIO()
+
+        with BinaryRecordWriter(stream, record_type=RecordType.INTERVAL, payload_type=payload_type) as writer:
+            writer.write_many(intervals)
+
+        stream.seek(0)
+
+        results = list(BinaryRecordReader(stream))
+
+        assert results[:-1] == intervals[:-1]
+        assert results[-1].is_empty
+
+
+def test_errors():
+    stream = io.BytesIO()
+
+    with BinaryRecordWriter(stream) as writer:
+        with pytest.raises(TypeError, match="Only `FuzzyNumber` can be written"):
+            writer.write(IntervalFactory.infimum_supremum(1, 2))
+
+    stream.seek(0)
+    assert list(BinaryRecordReader(stream)) == []
+
+    with pytest.raises(ValueError, match="can only be specified for records"):
+        BinaryRecordWriter(io.BytesIO(), record_type=RecordType.INTERVAL, alphas=[0, 1])
+
+    with pytest.raises(ValueError, match="does not contain FuzzyMath binary records"):
+        BinaryRecordReader(io.BytesIO(b"ABCD" + bytes(8)))
+
+    stream = io.BytesIO()
+
+    with BinaryRecordWriter(stream) as writer:
+        writer.write(FuzzyNumberFactory.triangular(1, 2, 3))
+
+    with pytest.raises(ValueError, match="Unexpected end of stream"):
+        list(BinaryRecordReader(io.BytesIO(stream.getvalue()[:-3])))
+
+
+def test_grid_mismatch():
+    stream = io.BytesIO()
+
+    with BinaryRecordWriter(stream) as writer:
+        writer.write(FuzzyNumberFactory.triangular(1, 2, 3, number_of_cuts=3))
+
+        with pytest.raises(ValueError, match="same alpha levels"):
+            writer.write(
+                FuzzyNumber(
+                    [0, "0.3", 1],
+                    [
+                        IntervalFactory.infimum_supremum(1, 3),
+                        IntervalFactory.infimum_supremum("1.3", "2.7"),
+                        IntervalFactory.infimum_supremum(2, 2),
+                    ],
+                )
+            )
+
+
+def _tampered(record_type: RecordType, payload_type: PayloadType, values: list, alphas=None) -> io.BytesIO:
+    stream = io.BytesIO()
+
+    BinaryRecordWriter(stream, record_type=record_type, payload_type=payload_type, alphas=alphas).close()
+
+    if payload_type == PayloadType.DECIMAL:
+        body = _encode_decimals(Decimal(value) for value in values)
+    else:
+        body = struct.pack(f"<{len(values)}d", *values)
+
+    stream.write(struct.pack("<I", len(body)) + body)
+    stream.seek(0)
+
+    return stream
+
+
+@pytest.mark.parametrize("payload_type", list(PayloadType))
+def test_tampered_records(payload_type: PayloadType):
+    with pytest.raises(ValueError, match="invalid interval"):
+        BinaryRecordReader(_tampered(RecordType.INTERVAL, payload_type, [9, 3])).read()
+
+    with pytest.raises(ValueError, match="0 values, but 2 values are expected"):
+        BinaryRecordReader(_tampered(RecordType.INTERVAL, payload_type, [])).read()
+
+    with pytest.raises(ValueError, match="not nested"):
+        BinaryRecordReader(_tampered(RecordType.FUZZY_NUMBER, payload_type, [1, 3, 0, 2], alphas=[0, 1])).read()
+
+    with pytest.raises(ValueError, match="2 values, but 4 values are expected"):
+        BinaryRecordReader(_tampered(RecordType.FUZZY_NUMBER, payload_type, [1, 3], alphas=[0, 1])).read()
+
+
+def test_truncated_payload():
+    stream = io.BytesIO()
+
+    with BinaryRecordWriter(stream, record_type=RecordType.INTERVAL) as writer:
+        writer._write_header()  # pylint: disable=W0212
+
+    header = stream.getvalue()
+    body = _encode_decimals([Decimal("1.5"), Decimal("2.5")])
+
+    for truncated, message in [(body[:-2], "exceeds the record"), (body[:6], "ends inside length")]:
+        data = header + struct.pack("<I", len(truncated)) + truncated
+
+        with pytest.raises(ValueError, match=f"Record is truncated, .*{message}"):
+            BinaryRecordReader(io.BytesIO(data)).read()
+
+    corrupt = body.replace(b"1.5", b"1x5")
+
+    with pytest.raises(ValueError, match="Cannot decode value"):
+        BinaryRecordReader(io.BytesIO(header + struct.pack("<I", len(corrupt)) + corrupt)).read()
+
+
+def test_invalid_header_alphas():
+    for alphas, message in [
+        (["0", "0.5", "0.25", "1"], "unique and sorted"),
+        (["0", "0.5", "0.5", "1"], "unique and sorted"),
+        (["0", "0.5", "2"], "end with 1"),
+        (["-1", "0.5", "1"], "start with 0"),
+        (["0", "NaN", "1"], "start with 0"),
+        (["0", "x", "1"], "Cannot decode value"),
+    ]:
+        header = struct.pack("<4sBBBxI", b"FZMB", 1, RecordType.FUZZY_NUMBER, PayloadType.DECIMAL, len(alphas))
+        body = b"".join(struct.pack("<H", len(alpha)) + alpha.encode("ascii") for alpha in alphas)
+
+        with pytest.raises(ValueError, match=message):
+            BinaryRecordReader(io.BytesIO(header + body))
+
+    header = struct.pack("<4sBBBxI", b"FZMB", 1, RecordType.INTERVAL, PayloadType.DECIMAL, 2)
+
+    with pytest.raises(ValueError, match="must not contain alpha levels"):
+        BinaryRecordReader(io.BytesIO(header + _encode_decimals([Decimal(0), Decimal(1)])))
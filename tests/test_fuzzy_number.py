@@ -1,6 +1,7 @@
 import math
 from decimal import Decimal, InvalidOperation
 
+import numpy as np
 import pytest
 from conftest import assert_equal_decimals
 
@@ -172,6 +173,53 @@ def test_function():
     assert fn_sin.max == pytest.approx(1, diff)
     assert fn_sin.kernel_min == pytest.approx(0, diff)
 
+    fn_sin_vectorized = fn.apply_function(np.sin)
+
+    for alpha in fn.alpha_levels:
+        cut = fn_sin.get_alpha_cut(alpha)
+        cut_vectorized = fn_sin_vectorized.get_alpha_cut(alpha)
+
+        assert float(cut_vectorized.min) == pytest.approx(float(cut.min), diff)
+        assert float(cut_vectorized.max) == pytest.approx(float(cut.max), diff)
+
+
+def test_function_single_sampling():
+    fn = FuzzyNumberFactory.triangular(-2, 0, 2, 21)
+
+    calls = []
+
+    def square(x):
+        calls.append(x)
+        return x**2
+
+    result = fn.apply_function(square, number_elements=100)
+
+    assert len(calls) == len(set(calls)) <= 101 + 2 * 21
+    for alpha in fn.alpha_levels:
+        assert result.get_alpha_cut(alpha) == IntervalFactory.two_values(0, (2 - 2 * alpha) ** 2)
+
+    calls.clear()
+    fn.apply_function(square, monotone=True)
+
+    assert len(calls) == 41
+
+
+def test_function_adaptive():
+    fn = FuzzyNumberFactory.triangular(0, 1, 6, 11)
+
+    result = fn.apply_function(math.sin, tolerance=1e-10)
+
+    assert float(result.max) == pytest.approx(1, abs=1e-9)
+    assert float(result.min) == pytest.approx(-1, abs=1e-9)
+    assert float(result.kernel_min) == pytest.approx(math.sin(1))
+
+    for alpha in fn.alpha_levels:
+        cut = fn.get_alpha_cut(alpha)
+        expected = cut.apply_function(math.sin, number_elements=10000)
+
+        assert float(result.get_alpha_cut(alpha).min) == pytest.approx(float(expected.min), abs=1e-6)
+        assert float(result.get_alpha_cut(alpha).max) == pytest.approx(float(expected.max), abs=1e-6)
+
 
 def test_comparisons(fn_a: FuzzyNumber, fn_b: FuzzyNumber, fn_c: FuzzyNumber):
     assert (fn_a == fn_b) is False
@@ -327,6 +375,43 @@ def test_membership(fn_a: FuzzyNumber, fn_d: FuzzyNumber, fn_e: FuzzyNumber, qua
     assert_equal_decimals(fn_e.membership(2.5).membership, "0.5", quantize_precision)
 
 
+def test_membership_array(fn_a: FuzzyNumber, fn_d: FuzzyNumber):
+    values = np.array([[0, 1, 1.25, 1.5], [2, 2.75, 3, 99]])
+
+    memberships = fn_a.membership(values)
+
+    assert memberships.shape == (2, 4)
+    assert np.allclose(memberships, [[0, 0, 0.25, 0.5], [1, 0.25, 0, 0]])
+
+    assert np.allclose(fn_d.membership([1, 1.5, 2, 3, "3.5", 4]), [0, 0.5, 1, 1, 0.5, 0])
+
+    fuzzy_number = FuzzyNumber(
+        [0, "0.3", "0.6", 1],
+        [
+            IntervalFactory.infimum_supremum(0, 10),
+            IntervalFactory.infimum_supremum(2, 8),
+            IntervalFactory.infimum_supremum(2, 5),
+            IntervalFactory.infimum_supremum(4, 5),
+        ],
+    )
+
+    values = np.linspace(-1, 11, 97)
+
+    for value, membership in zip(values, fuzzy_number.membership(values)):
+        assert membership == pytest.approx(float(fuzzy_number.membership(float(value)).membership))
+
+    assert fuzzy_number.membership(2) == Decimal("0.6")
+    assert fuzzy_number.membership(5) == Decimal(1)
+
+    assert np.isnan(fn_a.membership([np.nan])[0])
+
+    with pytest.raises(TypeError, match="only arrays of numbers"):
+        fn_a.membership(["a"])
+
+    with pytest.raises(TypeError, match="Cannot get membership of `str`"):
+        fn_a.membership("a")
+
+
 def test_wrong_operations(fn_a: FuzzyNumber):
     with pytest.raises(TypeError):
         fn_a + "a"
@@ -339,3 +424,46 @@ def test_wrong_operations(fn_a: FuzzyNumber):
 
     with pytest.raises(TypeError):
         fn_a * "a"
+
+
+def test_trusted_creation(fn_a: FuzzyNumber, fn_b: FuzzyNumber):
+    alphas = [Decimal(0), Decimal(1)]
+    intervals = [IntervalFactory.two_values(0, 1), IntervalFactory.two_values(2, 2)]
+
+    fn = FuzzyNumber._from_trusted(alphas, intervals)
+
+    assert fn.alpha_levels == alphas
+    assert fn.alpha_cuts == intervals
+
+    assert fn_a + fn_b == FuzzyNumber(
+        fn_b.alpha_levels, [IntervalFactory.two_values(3, 7), IntervalFactory.two_values(5, 5)]
+    )
+
+    FuzzyNumber.set_debug_validation()
+
+    try:
+        with pytest.raises(
+            ValueError, match="Interval on lower alpha level has to contain the higher level alpha cuts"
+        ):
+            FuzzyNumber._from_trusted(alphas, intervals)
+
+        assert fn_a + fn_b == FuzzyNumberFactory.triangular(3, 5, 7)
+    finally:
+        FuzzyNumber.unset_debug_validation()
+
+
+def test_alpha_cut_cache(fn_e: FuzzyNumber, monkeypatch):
+    alpha_cut = fn_e.get_alpha_cut(0.5)
+
+    assert alpha_cut == IntervalFactory.two_values(1.5, 2.5)
+    assert fn_e.get_alpha_cut(0.5) is alpha_cut
+    assert fn_e.get_alpha_cut("0.2") is fn_e.alpha_cuts[1]
+
+    monkeypatch.setattr(FuzzyNumber, "_alpha_cut_cache_size", 3)
+
+    for alpha in ["0.1", "0.3", "0.7", "0.9"]:
+        fn_e.get_alpha_cut(alpha)
+
+    assert len(fn_e._alpha_cut_cache) == 3
+    assert fn_e.get_alpha_cut(0.5) is not alpha_cut
+    assert fn_e.get_alpha_cut(0.5) == alpha_cut
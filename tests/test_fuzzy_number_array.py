@@ -0,0 +1,218 @@
+import struct
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+from FuzzyMath import (
+    FuzzyMathPrecisionContext,
+    FuzzyNumber,
+    FuzzyNumberArray,
+    FuzzyNumberFactory,
+    FuzzyNumberFloatFactory,
+)
+
+
+@pytest.fixture
+def fna() -> FuzzyNumberArray:
+    return FuzzyNumberArray.from_fuzzy_numbers([FuzzyNumberFactory.triangular(i - 1, i, i + 1, 5) for i in range(5)])
+
+
+def assert_equal_fuzzy_numbers(a: FuzzyNumber, b: FuzzyNumber) -> None:
+    assert [float(x) for x in a.alpha_levels] == pytest.approx([float(x) for x in b.alpha_levels])
+    assert [float(x) for x in a.get_alpha_cuts_mins()] == pytest.approx([float(x) for x in b.get_alpha_cuts_mins()])
+    assert [float(x) for x in a.get_alpha_cuts_maxs()] == pytest.approx([float(x) for x in b.get_alpha_cuts_maxs()])
+
+
+def test_creation_errors():
+    with pytest.raises(ValueError, match="must be of shape"):
+        FuzzyNumberArray([0, 1], np.zeros((3, 3, 2)))
+
+    with pytest.raises(ValueError, match="must start with 0"):
+        FuzzyNumberArray([0, 0.5], np.zeros((3, 2, 2)))
+
+    with pytest.raises(ValueError, match="has to contain the higher level"):
+        FuzzyNumberArray([0, 1], [[[0, 1], [2, 2]]])
+
+    with pytest.raises(ValueError, match="empty"):
+        FuzzyNumberArray.from_fuzzy_numbers([])
+
+    with pytest.raises(TypeError, match="Only `FuzzyNumber` and `FuzzyNumberFloat`"):
+        FuzzyNumberArray.from_fuzzy_numbers([1])
+
+
+def test_creation(fna: FuzzyNumberArray):
+    assert len(fna) == 5
+    assert fna.shape == (5, 5, 2)
+    assert fna.mins[:, 0].tolist() == [-1, 0, 1, 2, 3]
+
+    mixed = FuzzyNumberArray.from_fuzzy_numbers(
+        [FuzzyNumberFactory.triangular(0, 1, 2), FuzzyNumberFloatFactory.triangular(0, 1, 2, 3)]
+    )
+
+    assert mixed.alpha_levels.tolist() == [0, 0.5, 1]
+    assert mixed.mins.tolist() == [[0, 0.5, 1], [0, 0.5, 1]]
+
+
+def test_indexing(fna: FuzzyNumberArray):
+    assert isinstance(fna[2], FuzzyNumber)
+    assert_equal_fuzzy_numbers(fna[2], FuzzyNumberFactory.triangular(1, 2, 3, 5))
+    assert_equal_fuzzy_numbers(fna[-1], FuzzyNumberFactory.triangular(3, 4, 5, 5))
+
+    assert isinstance(fna[1:3], FuzzyNumberArray)
+    assert len(fna[1:3]) == 2
+    assert len(fna[fna.mins[:, 0] > 0]) == 3
+    assert len(list(fna)) == 5
+
+
+def test_decimal_round_trip():
+    fns = [FuzzyNumberFactory.trapezoidal(f"{i}.1", i + 1, f"{i + 1}.7", f"{i + 2}.3", 11) for i in range(5)]
+
+    fna = FuzzyNumberArray.from_fuzzy_numbers(fns)
+
+    for i, fn in enumerate(fns):
+        assert fna[i] == fn
+        assert fna[i].alpha_levels is fn.alpha_levels
+
+    assert fna.to_fuzzy_numbers() == fns
+
+
+def test_arithmetic(fna: FuzzyNumberArray):
+    fn = FuzzyNumberFactory.triangular(1, 2, 4, 3)
+    fn_list = fna.to_fuzzy_numbers()
+
+    for result, expected in [
+        (fna + fna, [x + x for x in fn_list]),
+        (fna - 1, [x - 1 for x in fn_list]),
+        (2 - fna, [2 - x for x in fn_list]),
+        (fna * fn, [x * fn for x in fn_list]),
+        (fn * fna, [fn * x for x in fn_list]),
+        (fna / fn, [x / fn for x in fn_list]),
+        (fn / (fna + 10), [fn / (x + 10) for x in fn_list]),
+        (fna**2, [x**2 for x in fn_list]),
+        (-fna, [0 - x for x in fn_list]),
+    ]:
+        assert isinstance(result, FuzzyNumberArray)
+        for a, b in zip(result, expected):
+            assert_equal_fuzzy_numbers(a, b)
+
+
+def test_broadcasting(fna: FuzzyNumberArray):
+    scalars = np.arange(5, dtype=np.float64)
+
+    result = fna + scalars
+
+    assert result.mins[:, 0].tolist() == [-1, 1, 3, 5, 7]
+    assert (scalars + fna) == result
+
+    single = fna[0:1]
+
+    assert len(single + fna) == 5
+
+    with pytest.raises(ValueError):
+        fna + np.arange(3)
+
+
+def test_division_by_zero(fna: FuzzyNumberArray):
+    with pytest.raises(ArithmeticError, match="contains 0"):
+        1 / fna
+
+    with pytest.raises(ArithmeticError, match="contains 0"):
+        fna / fna
+
+
+def test_memmap(fna: FuzzyNumberArray, tmp_path):
+    path = tmp_path / "fuzzy_numbers.fzma"
+
+    fna.save(path)
+
+    mapped = FuzzyNumberArray.open_memmap(path)
+
+    assert isinstance(mapped.values, np.memmap)
+    assert mapped == fna
+    assert_equal_fuzzy_numbers(mapped[3], fna[3])
+
+    part = mapped[1:3]
+    assert np.shares_memory(part.values, mapped.values)
+    assert np.shares_memory(mapped.get_float(2).mins, mapped.values)
+    assert part == fna[1:3]
+
+    with pytest.raises(ValueError):
+        mapped.values[0, 0, 0] = 1
+
+    created = FuzzyNumberArray.create_memmap(tmp_path / "created.fzma", fna.alpha_levels, 5)
+    created.values[:] = fna.values
+    del created
+
+    assert FuzzyNumberArray.open_memmap(tmp_path / "created.fzma") == fna
+
+    with pytest.raises(ValueError, match="does not contain FuzzyMath fuzzy number array"):
+        (tmp_path / "other.bin").write_bytes(bytes(64))
+        FuzzyNumberArray.open_memmap(tmp_path / "other.bin")
+
+
+def test_memmap_decimal_round_trip(tmp_path):
+    fns = [FuzzyNumberFactory.triangular(f"{i}.1", f"{i + 1}.3", f"{i + 2}.7", 11) for i in range(5)]
+
+    path = tmp_path / "fuzzy_numbers.fzma"
+    FuzzyNumberArray.from_fuzzy_numbers(fns).save(path)
+
+    mapped = FuzzyNumberArray.open_memmap(path)
+
+    assert mapped[2] == fns[2]
+    assert list(mapped) == fns
+
+
+def test_memmap_invalid_alphas(fna: FuzzyNumberArray, tmp_path):
+    path = tmp_path / "fuzzy_numbers.fzma"
+    fna.save(path)
+
+    data = bytearray(path.read_bytes())
+    offset = struct.calcsize("<4sBxxxQQ")
+
+    for alphas, message in [
+        ([0, 0.5, 0.25, 0.75, 1], "unique and sorted"),
+        ([0, 0.25, 0.25, 0.75, 1], "unique and sorted"),
+        ([0, 0.25, 0.5, 0.75, 2], "end with 1"),
+        ([-1, 0.25, 0.5, 0.75, 1], "start with 0"),
+    ]:
+        data[offset : offset + 40] = struct.pack("<5d", *alphas)
+        path.write_bytes(bytes(data))
+
+        with pytest.raises(ValueError, match=message):
+            FuzzyNumberArray.open_memmap(path)
+
+    path.write_bytes(bytes(data[: offset + 16]))
+
+    with pytest.raises(ValueError, match="too short to contain alpha levels"):
+        FuzzyNumberArray.open_memmap(path)
+
+
+def test_outward_rounding_enclosure():
+    generator = np.random.default_rng(11)
+
+    alphas_from = np.concatenate(([0.0], np.sort(generator.uniform(0, 1, 5)), [1.0]))
+    alphas_to = np.concatenate(([0.0], np.sort(generator.uniform(0, 1, 50)), [1.0]))
+
+    values = np.sort(generator.uniform(-10, 10, (100, 14)), axis=1)
+    values = np.stack((values[:, :7], values[:, :6:-1]), axis=-1)
+
+    with FuzzyMathPrecisionContext(outward_rounding=True):
+        result = FuzzyNumberArray._interpolate(alphas_from, values, alphas_to)
+
+    for k, alpha in enumerate(alphas_to):
+        j = min(np.searchsorted(alphas_from, alpha, side="right"), alphas_from.size - 1) - 1
+        weight = (Fraction(alpha) - Fraction(alphas_from[j])) / (
+            Fraction(alphas_from[j + 1]) - Fraction(alphas_from[j])
+        )
+
+        for n in range(values.shape[0]):
+            for side in range(2):
+                exact = Fraction(values[n, j, side]) + weight * (
+                    Fraction(values[n, j + 1, side]) - Fraction(values[n, j, side])
+                )
+
+                if side == 0:
+                    assert Fraction(result[n, k, 0]) <= exact
+                else:
+                    assert exact <= Fraction(result[n, k, 1])
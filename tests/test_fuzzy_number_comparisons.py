@@ -1,12 +1,21 @@
+import numpy as np
+import pytest
 from conftest import assert_equal_decimals
 
 from FuzzyMath import (
+    Comparison,
+    FuzzyNumber,
     FuzzyNumberFactory,
     PossibilisticMembership,
+    compare,
     exceedance,
+    exceedance_matrix,
     strict_exceedance,
+    strict_exceedance_matrix,
     strict_undervaluation,
+    strict_undervaluation_matrix,
     undervaluation,
+    undervaluation_matrix,
 )
 
 
@@ -43,3 +52,145 @@ def test_problematic_comparison():
     assert isinstance(strict_exceedance(fn_a, fn_b), PossibilisticMembership)
     assert isinstance(undervaluation(fn_a, fn_b), PossibilisticMembership)
     assert isinstance(strict_undervaluation(fn_a, fn_b), PossibilisticMembership)
+
+
+def test_comparison_matrices():
+    fn_a = FuzzyNumberFactory.triangular("0.2", "1.0", "2.8")
+    fn_b = FuzzyNumberFactory.triangular("0.0", "1.8", "2.2")
+
+    expected = {
+        exceedance_matrix: ("0.777777777777778", "0.384615384615385"),
+        strict_exceedance_matrix: ("0.454545454545455", "0.0"),
+        undervaluation_matrix: ("1.0", "0.545454545454545"),
+        strict_undervaluation_matrix: ("0.615384615384615", "0.222222222222222"),
+    }
+
+    for function, (possibility, necessity) in expected.items():
+        possibilities, necessities = function([fn_a], [fn_b])
+
+        assert possibilities.shape == (1, 1)
+        assert possibilities[0, 0] == pytest.approx(float(possibility))
+        assert necessities[0, 0] == pytest.approx(float(necessity))
+
+    fuzzy_numbers = [
+        FuzzyNumberFactory.triangular(1, 2, 3),
+        FuzzyNumberFactory.triangular(0, 3, 4, number_of_cuts=5),
+        FuzzyNumberFactory.trapezoidal("0.5", 1, "1.5", 5),
+        FuzzyNumberFactory.triangular(3, 4, 6),
+        FuzzyNumberFactory.triangular(-1, 1, "2.5", number_of_cuts=3),
+    ]
+
+    possibilities, necessities = exceedance_matrix(fuzzy_numbers, chunk_size=2)
+
+    assert possibilities.shape == (5, 5)
+    assert np.all(necessities <= possibilities)
+
+    for i, fn_x in enumerate(fuzzy_numbers):
+        for j, fn_y in enumerate(fuzzy_numbers):
+            result = exceedance(fn_x, fn_y)
+            assert possibilities[i, j] == pytest.approx(float(result.possibility))
+            assert necessities[i, j] == pytest.approx(float(result.necessity))
+
+    chunked = strict_undervaluation_matrix(fuzzy_numbers, fuzzy_numbers[:2], chunk_size=1)
+    whole = strict_undervaluation_matrix(fuzzy_numbers, fuzzy_numbers[:2])
+
+    assert chunked[0].shape == (5, 2)
+    assert np.array_equal(chunked[0], whole[0])
+    assert np.array_equal(chunked[1], whole[1])
+
+    with pytest.raises(ValueError, match="`chunk_size` must be positive integer"):
+        exceedance_matrix(fuzzy_numbers, chunk_size=0)
+
+    with pytest.raises(TypeError, match="Only `FuzzyNumber`s can be compared"):
+        exceedance_matrix(fuzzy_numbers + [1])
+
+
+def test_compare(quantize_precision):
+    fuzzy_numbers = [
+        FuzzyNumberFactory.triangular("0.2", "1.0", "2.8"),
+        FuzzyNumberFactory.triangular("0.0", "1.8", "2.2"),
+        FuzzyNumberFactory.triangular(1, 2, 3),
+        FuzzyNumberFactory.trapezoidal("0.5", 1, "2.5", 5),
+        FuzzyNumberFactory.triangular(-1, 1, "2.5", number_of_cuts=3),
+    ]
+
+    functions = (exceedance, strict_exceedance, undervaluation, strict_undervaluation)
+    matrices = (exceedance_matrix, strict_exceedance_matrix, undervaluation_matrix, strict_undervaluation_matrix)
+
+    for i, fn_x in enumerate(fuzzy_numbers):
+        for j, fn_y in enumerate(fuzzy_numbers):
+            result = compare(fn_x, fn_y)
+
+            assert isinstance(result, Comparison)
+
+            for membership, function, matrix in zip(result, functions, matrices):
+                assert membership == function(fn_x, fn_y)
+                assert 0 <= membership.necessity <= membership.possibility <= 1
+
+                possibilities, necessities = matrix([fn_x], [fn_y])
+                assert possibilities[0, 0] == pytest.approx(float(membership.possibility))
+                assert necessities[0, 0] == pytest.approx(float(membership.necessity))
+
+    result = compare(fuzzy_numbers[0], fuzzy_numbers[1])
+
+    assert_equal_decimals(result.exceedance.possibility, "0.777777777777778", quantize_precision)
+    assert_equal_decimals(result.strict_undervaluation.necessity, "0.222222222222222", quantize_precision)
+
+    with pytest.raises(TypeError, match="Only `FuzzyNumber`s can be compared"):
+        compare(fuzzy_numbers[0], 1)
+
+
+def test_compare_many_alpha_cuts(monkeypatch):
+    fuzzy_numbers = [
+        FuzzyNumberFactory.triangular(1, 2, 3, number_of_cuts=501) ** 2,
+        FuzzyNumberFactory.triangular(2, "3.5", 6, number_of_cuts=700).apply_function(lambda x: x.sqrt() * 3),
+        FuzzyNumberFactory.trapezoidal(0, 5, 6, 9, number_of_cuts=3),
+        FuzzyNumberFactory.triangular("4.5", 6, 7, number_of_cuts=1000),
+    ]
+
+    matrices = [
+        function(fuzzy_numbers)
+        for function in (
+            exceedance_matrix,
+            strict_exceedance_matrix,
+            undervaluation_matrix,
+            strict_undervaluation_matrix,
+        )
+    ]
+
+    def extraction(*args, **kwargs):
+        raise AssertionError("Comparison must not extract all alpha cuts.")
+
+    monkeypatch.setattr(FuzzyNumber, "_alpha_cuts_on_grid", extraction)
+
+    for i, fn_x in enumerate(fuzzy_numbers):
+        for j, fn_y in enumerate(fuzzy_numbers):
+            for membership, (possibilities, necessities) in zip(compare(fn_x, fn_y), matrices):
+                assert float(membership.possibility) == pytest.approx(possibilities[i, j])
+                assert float(membership.necessity) == pytest.approx(necessities[i, j])
+
+
+def test_strict_comparison_of_equal_values():
+    crisp = FuzzyNumberFactory.crisp_number(3)
+    left = FuzzyNumberFactory.trapezoidal(2, 3, 3, 3)
+    right = FuzzyNumberFactory.trapezoidal(3, 3, 4, 5)
+
+    expected = [
+        (crisp, crisp, ((1, 1), (0, 0), (1, 1), (0, 0))),
+        (right, left, ((1, 1), (1, 0), (1, 0), (0, 0))),
+        (left, right, ((1, 0), (0, 0), (1, 1), (1, 0))),
+    ]
+
+    functions = (exceedance, strict_exceedance, undervaluation, strict_undervaluation)
+    matrices = (exceedance_matrix, strict_exceedance_matrix, undervaluation_matrix, strict_undervaluation_matrix)
+
+    for fn_x, fn_y, values in expected:
+        result = compare(fn_x, fn_y)
+
+        for membership, function, matrix, (possibility, necessity) in zip(result, functions, matrices, values):
+            assert membership == PossibilisticMembership(possibility, necessity)
+            assert function(fn_x, fn_y) == PossibilisticMembership(possibility, necessity)
+
+            possibilities, necessities = matrix([fn_x], [fn_y])
+            assert possibilities[0, 0] == possibility
+            assert necessities[0, 0] == necessity
@@ -70,3 +70,30 @@ def test_fuzzynumber_creation_string_errors():
     with pytest.raises(ValueError, match="Interval on lower alpha level has to contain the higher"):
         string_fn = "(0.0;1.0,3.0)(0.5;2.5,2.75)(1.0;2.0,2.0)"
         FuzzyNumberFactory.parse_string(string_fn)
+
+
+def test_fuzzynumber_parse_signs_and_exponents():
+    fn = FuzzyNumberFactory.triangular(-3, -1.5, 2e3, number_of_cuts=4)
+
+    assert FuzzyNumberFactory.parse_string(repr(fn)) == fn
+    assert FuzzyNumberFactory.parse_string("(0;-1E+1,+2.5e1)(1.0;-.5,-.5)") == FuzzyNumberFactory.triangular(
+        -10, -0.5, 25
+    )
+
+
+def test_fuzzynumber_parse_many():
+    fns = [FuzzyNumberFactory.triangular(i - 2, i, i + 0.5, number_of_cuts=3) for i in range(-5, 5)]
+
+    lines = [repr(fn) + "\n" for fn in fns]
+    lines.insert(3, "\n")
+    lines.insert(5, "(0.0;1.0,3.0)(0.5;1.9999)(1.0;2.0,2.0)\n")
+
+    errors: list = []
+
+    assert list(FuzzyNumberFactory.parse_many(lines, errors=errors)) == fns
+    assert len(errors) == 1
+    assert errors[0][0] == 6
+    assert isinstance(errors[0][2], ValueError)
+
+    with pytest.raises(ValueError, match="Cannot parse line 6"):
+        list(FuzzyNumberFactory.parse_many(lines))
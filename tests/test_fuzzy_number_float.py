@@ -0,0 +1,187 @@
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+from FuzzyMath import FuzzyNumberFactory, FuzzyNumberFloat, FuzzyNumberFloatFactory
+
+
+@pytest.fixture
+def fnf_a() -> FuzzyNumberFloat:
+    return FuzzyNumberFloatFactory.triangular(1, 2, 3)
+
+
+@pytest.fixture
+def fnf_b() -> FuzzyNumberFloat:
+    return FuzzyNumberFloatFactory.triangular(2, 3, 4)
+
+
+def assert_same_as_decimal(fnf: FuzzyNumberFloat, fn) -> None:
+    assert fnf.alpha_levels.tolist() == pytest.approx([float(x) for x in fn.alpha_levels])
+    assert fnf.mins.tolist() == pytest.approx([float(x) for x in fn.get_alpha_cuts_mins()])
+    assert fnf.maxs.tolist() == pytest.approx([float(x) for x in fn.get_alpha_cuts_maxs()])
+
+
+def test_creation_errors():
+    with pytest.raises(ValueError, match="must be one dimensional and of same length"):
+        FuzzyNumberFloat([0, 1], [1, 2, 3], [3, 2])
+
+    with pytest.raises(ValueError, match="must start with 0 alpha value and end with 1"):
+        FuzzyNumberFloat([0, 0.5], [1, 2], [3, 2])
+
+    with pytest.raises(ValueError, match="must be unique and sorted"):
+        FuzzyNumberFloat([0, 0.7, 0.5, 1], [1, 1, 1, 1], [2, 2, 2, 2])
+
+    with pytest.raises(ValueError, match="lower or equal"):
+        FuzzyNumberFloat([0, 1], [1, 3], [3, 2])
+
+    with pytest.raises(ValueError, match="has to contain the higher level alpha cuts"):
+        FuzzyNumberFloat([0, 1], [1, 4], [3, 5])
+
+    with pytest.raises(ValueError, match="The fuzzy number is invalid"):
+        FuzzyNumberFloatFactory.triangular(3, 2, 1)
+
+
+def test_creation(fnf_a: FuzzyNumberFloat):
+    assert fnf_a.min == 1
+    assert fnf_a.max == 3
+    assert fnf_a.kernel_min == 2
+    assert fnf_a.kernel_max == 2
+    assert len(FuzzyNumberFloatFactory.triangular(1, 2, 3, 11)) == 11
+    assert fnf_a.get_alpha_cut(0.5) == (1.5, 2.5)
+
+    with pytest.raises(ValueError):
+        fnf_a.mins[0] = 5
+
+
+def test_conversion():
+    fn = FuzzyNumberFactory.triangular(1, 2, 3, 11)
+
+    fnf = FuzzyNumberFloat.from_fuzzy_number(fn)
+
+    assert_same_as_decimal(fnf, fn)
+    assert_same_as_decimal(FuzzyNumberFloatFactory.triangular(1, 2, 3, 11), fn)
+    assert FuzzyNumberFloat.from_fuzzy_number(fnf.to_fuzzy_number()) == fnf
+
+
+def test_decimal_round_trip():
+    fn = FuzzyNumberFactory.trapezoidal("0.1", "1.1", "2.3", "3.7", 11)
+
+    back = FuzzyNumberFloat.from_fuzzy_number(fn).to_fuzzy_number()
+
+    assert back == fn
+    assert back.alpha_levels is fn.alpha_levels
+    assert (back + fn).alpha_levels is fn.alpha_levels
+
+
+def test_arithmetic_matches_decimal():
+    fn_a = FuzzyNumberFactory.triangular(1, 2, 3, 5)
+    fn_b = FuzzyNumberFactory.trapezoidal(-2, -1, 1, 4, 3)
+    fn_c = FuzzyNumberFactory.triangular(2, 3, 5, 4)
+
+    fnf_a = FuzzyNumberFloat.from_fuzzy_number(fn_a)
+    fnf_b = FuzzyNumberFloat.from_fuzzy_number(fn_b)
+    fnf_c = FuzzyNumberFloat.from_fuzzy_number(fn_c)
+
+    assert_same_as_decimal(fnf_a + fnf_b, fn_a + fn_b)
+    assert_same_as_decimal(fnf_a - fnf_b, fn_a - fn_b)
+    assert_same_as_decimal(fnf_a * fnf_b, fn_a * fn_b)
+    assert_same_as_decimal(fnf_b / fnf_c, fn_b / fn_c)
+    assert_same_as_decimal(fnf_a + 2, fn_a + 2)
+    assert_same_as_decimal(2 - fnf_a, 2 - fn_a)
+    assert_same_as_decimal(2.5 * fnf_b, 2.5 * fn_b)
+    assert_same_as_decimal(5 / fnf_a, 5 / fn_a)
+    assert_same_as_decimal(fnf_b**2, fn_b**2)
+    assert_same_as_decimal(fnf_b**3, fn_b**3)
+    assert_same_as_decimal(-fnf_b, 0 - fn_b)
+
+
+def test_division_by_zero(fnf_a: FuzzyNumberFloat):
+    with pytest.raises(ArithmeticError, match="Cannot divide by 0"):
+        fnf_a / 0
+
+    with pytest.raises(ArithmeticError, match="contains 0"):
+        fnf_a / FuzzyNumberFloatFactory.triangular(-1, 0, 1)
+
+    with pytest.raises(ArithmeticError, match="contains 0"):
+        1 / FuzzyNumberFloatFactory.triangular(-1, 0, 1)
+
+
+def test_sum_many(fnf_a: FuzzyNumberFloat, fnf_b: FuzzyNumberFloat):
+    result = FuzzyNumberFloatFactory.crisp_number(0)
+
+    for _ in range(10):
+        result = result + fnf_a
+
+    assert result.min == pytest.approx(10)
+    assert result.kernel_min == pytest.approx(20)
+    assert result.max == pytest.approx(30)
+
+    assert np.array_equal((fnf_a + fnf_b).alpha_levels, np.array([0.0, 1.0]))
+
+
+def test_wrong_operations(fnf_a: FuzzyNumberFloat):
+    with pytest.raises(TypeError):
+        fnf_a + "a"
+
+    with pytest.raises(TypeError):
+        fnf_a * FuzzyNumberFactory.triangular(1, 2, 3)
+
+    with pytest.raises(TypeError, match="Cannot test if object of type"):
+        "a" in fnf_a
+
+
+def test_outward_rounding():
+    fn = FuzzyNumberFactory.triangular("0.1", "0.2", "0.3")
+
+    fnf = FuzzyNumberFloat.from_fuzzy_number(fn, outward_rounding=True)
+
+    assert fnf.outward_rounding
+    assert fnf.min <= fn.min
+    assert fn.max <= fnf.max
+
+    exact = fn + fn * fn
+    result = (fnf + fnf * fnf).to_fuzzy_number()
+
+    for alpha in exact.alpha_levels:
+        assert exact.get_alpha_cut(alpha) in result.get_alpha_cut(alpha)
+
+    other = FuzzyNumberFloatFactory.triangular(1, 2, 3, number_of_cuts=3)
+    result = fnf + other
+
+    assert result.outward_rounding
+    assert np.all(np.diff(result.mins) >= 0)
+    assert np.all(np.diff(result.maxs) <= 0)
+
+    assert not (other + other).outward_rounding
+
+
+def test_outward_rounding_enclosure():
+    generator = np.random.default_rng(7)
+
+    for _ in range(200):
+        alphas = np.concatenate(([0.0], np.sort(generator.uniform(0, 1, 3)), [1.0]))
+        values = np.sort(generator.uniform(-10, 10, 10))
+        mins = values[:5]
+        maxs = values[:4:-1]
+
+        fnf = FuzzyNumberFloat(alphas, mins, maxs, outward_rounding=True)
+
+        queries = generator.uniform(0, 1, 100)
+        alpha_cuts = fnf._interpolate(queries, True)
+
+        for i, alpha in enumerate(queries):
+            j = np.searchsorted(alphas, alpha, side="right") - 1
+            weight = (Fraction(alpha) - Fraction(alphas[j])) / (Fraction(alphas[j + 1]) - Fraction(alphas[j]))
+            exact_min = Fraction(mins[j]) + weight * (Fraction(mins[j + 1]) - Fraction(mins[j]))
+            exact_max = Fraction(maxs[j]) + weight * (Fraction(maxs[j + 1]) - Fraction(maxs[j]))
+
+            assert Fraction(alpha_cuts.mins[i]) <= exact_min
+            assert exact_max <= Fraction(alpha_cuts.maxs[i])
+
+            minimum, maximum = fnf.get_alpha_cut(float(alpha))
+            assert Fraction(minimum) <= exact_min
+            assert exact_max <= Fraction(maximum)
+
+        for alpha, minimum, maximum in zip(alphas, mins, maxs):
+            assert fnf.get_alpha_cut(float(alpha)) == (minimum, maximum)
@@ -0,0 +1,62 @@
+import math
+
+import numpy as np
+import pytest
+
+from FuzzyMath.class_factories import FuzzyNumberFactory, IntervalFactory
+from FuzzyMath.fuzzynumber_functions import apply_function_multivariate
+
+
+def test_vertex_method():
+    x = FuzzyNumberFactory.triangular(1, 2, 3, number_of_cuts=5)
+    y = FuzzyNumberFactory.triangular(2, 3, 5, number_of_cuts=3)
+
+    result = apply_function_multivariate(lambda a, b: a * b - a, [x, y], monotone=True)
+
+    assert result.alpha_levels is x.alpha_levels
+
+    for alpha in result.alpha_levels:
+        cut_x = x.get_alpha_cut(alpha)
+        cut_y = y.get_alpha_cut(alpha)
+
+        expected = IntervalFactory.infimum_supremum(cut_x.min * (cut_y.min - 1), cut_x.max * (cut_y.max - 1))
+
+        assert result.get_alpha_cut(alpha) == expected
+        assert expected.width <= (x * y - x).get_alpha_cut(alpha).width
+
+    vectorized = apply_function_multivariate(lambda a, b: a * b - a, [x, y], monotone=True, vectorized=True)
+
+    for alpha in result.alpha_levels:
+        assert float(vectorized.get_alpha_cut(alpha).min) == pytest.approx(float(result.get_alpha_cut(alpha).min))
+        assert float(vectorized.get_alpha_cut(alpha).max) == pytest.approx(float(result.get_alpha_cut(alpha).max))
+
+
+def test_sampling():
+    x = FuzzyNumberFactory.triangular(-1, 0, 1, number_of_cuts=3)
+
+    result = apply_function_multivariate(lambda a, b: (a - b) ** 2, [x, x], number_elements=4)
+
+    assert result.get_alpha_cut(0) == IntervalFactory.infimum_supremum(0, 4)
+    assert result.get_alpha_cut("0.5") == IntervalFactory.infimum_supremum(0, 1)
+    assert result.get_alpha_cut(1) == IntervalFactory.infimum_supremum(0, 0)
+
+    result = apply_function_multivariate(
+        np.hypot, [x, FuzzyNumberFactory.triangular(0, 1, 2, number_of_cuts=3)], number_elements=4
+    )
+
+    assert float(result.max) == pytest.approx(math.hypot(1, 2))
+    assert float(result.min) == pytest.approx(0)
+    assert float(result.kernel_min) == pytest.approx(1)
+
+
+def test_errors():
+    x = FuzzyNumberFactory.triangular(-1, 0, 1)
+
+    with pytest.raises(TypeError, match="needs to be a function"):
+        apply_function_multivariate(5, [x])
+
+    with pytest.raises(ValueError, match="At least one"):
+        apply_function_multivariate(math.sin, [])
+
+    with pytest.raises(ValueError, match="must be positive integer"):
+        apply_function_multivariate(math.sin, [x], number_elements=0)
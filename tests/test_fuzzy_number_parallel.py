@@ -0,0 +1,80 @@
+import math
+
+import numpy as np
+import pytest
+
+from FuzzyMath.class_factories import FuzzyNumberFactory
+from FuzzyMath.class_precision import FuzzyMathPrecision
+from FuzzyMath.fuzzynumber_parallel import parallel_apply_function, parallel_map, parallel_reduce
+from FuzzyMath.fuzzynumber_reductions import fsum
+
+
+@pytest.fixture
+def fns():
+    return [FuzzyNumberFactory.triangular(i - 1, i, i + 1.5, number_of_cuts=3 + i % 3) for i in range(1, 40)]
+
+
+def test_parallel_map(fns):
+    fn = FuzzyNumberFactory.triangular(1, 2, 3)
+
+    assert parallel_map("add", fns, list(reversed(fns)), workers=1, chunk_size=7) == [
+        a + b for a, b in zip(fns, reversed(fns))
+    ]
+    assert parallel_map("mul", fns, fn, workers=2, chunk_size=7) == [a * fn for a in fns]
+    assert parallel_map("truediv", fns, 3, workers=2, chunk_size=100) == [a / 3 for a in fns]
+
+    with pytest.raises(ValueError, match="Unknown `operation`"):
+        parallel_map("mod", fns, 2)
+
+    with pytest.raises(ValueError, match="must be of same length"):
+        parallel_map("add", fns, fns[1:])
+
+    with pytest.raises(ValueError, match="`workers` must be positive integer"):
+        parallel_map("add", fns, 1, workers=0)
+
+
+def test_parallel_apply_function(fns):
+    results = parallel_apply_function(fns[:5], math.sqrt, monotone=True, workers=2, chunk_size=2)
+
+    assert results == [fn.apply_function(math.sqrt, monotone=True) for fn in fns[:5]]
+
+
+def test_parallel_apply_function_options(fns):
+    results = parallel_apply_function(fns[:5], math.sin, number_elements=10, tolerance=1e-9, workers=2, chunk_size=2)
+
+    expected = [fn.apply_function(math.sin, number_elements=10, tolerance=1e-9) for fn in fns[:5]]
+
+    assert results == expected
+    assert results != [fn.apply_function(math.sin, number_elements=10) for fn in fns[:5]]
+
+    results = parallel_apply_function(fns[:5], np.sin, vectorized=True, tolerance=1e-9, workers=1)
+
+    assert results == [fn.apply_function(np.sin, vectorized=True, tolerance=1e-9) for fn in fns[:5]]
+
+
+def test_parallel_reduce(fns):
+    result = parallel_reduce("sum", fns, workers=1, chunk_size=4)
+
+    assert parallel_reduce("sum", fns, workers=3, chunk_size=4) == result
+    assert parallel_reduce("sum", fns, workers=2, chunk_size=4) == result
+
+    fns_same_alphas = [FuzzyNumberFactory.triangular(i - 1, i, i + 1.5, number_of_cuts=5) for i in range(20)]
+
+    assert parallel_reduce("sum", fns_same_alphas, workers=2, chunk_size=3) == fsum(fns_same_alphas)
+
+    a, b, c, d, e = fns_same_alphas[1:6]
+    assert parallel_reduce("prod", [a, b, c, d, e], workers=2, chunk_size=2) == a * b * c * d * e
+
+    with pytest.raises(ValueError, match="Cannot reduce empty"):
+        parallel_reduce("sum", [])
+
+
+def test_precision_in_workers(fns):
+    FuzzyMathPrecision.set_numeric_precision(2)
+
+    try:
+        results = parallel_map("truediv", fns[:3], 3, workers=2)
+
+        assert results == [fn / 3 for fn in fns[:3]]
+    finally:
+        FuzzyMathPrecision.reset()
@@ -0,0 +1,76 @@
+import operator
+from decimal import Decimal
+from functools import reduce
+
+import pytest
+
+from FuzzyMath.class_factories import FuzzyNumberFactory
+from FuzzyMath.class_fuzzy_number import FuzzyNumber
+from FuzzyMath.class_precision import FuzzyMathPrecisionContext
+from FuzzyMath.fuzzynumber_reductions import fprod, fsum
+
+
+def test_fsum():
+    fns = [FuzzyNumberFactory.triangular(i - 1, i, i + 1, number_of_cuts=11) for i in range(100)]
+
+    expected = fns[0]
+    for fn in fns[1:]:
+        expected = expected + fn
+
+    result = fsum(fn for fn in fns)
+
+    assert isinstance(result, FuzzyNumber)
+    assert result == expected
+    assert result.alpha_levels is fns[0].alpha_levels
+
+    assert fsum([fns[0]]) == fns[0]
+
+
+def test_fprod():
+    fns = [
+        FuzzyNumberFactory.triangular(1, 2, 3, number_of_cuts=5),
+        FuzzyNumberFactory.trapezoidal(-2, -1, 1, 2, number_of_cuts=5),
+        FuzzyNumberFactory.triangular(0.5, 1, 4, number_of_cuts=5),
+    ]
+
+    assert fprod(iter(fns)) == fns[0] * fns[1] * fns[2]
+
+
+def test_mixed_alphas():
+    fns = [
+        FuzzyNumberFactory.triangular(1, 2, 3, number_of_cuts=3),
+        FuzzyNumberFactory.triangular(2, 3, 5),
+        FuzzyNumberFactory.trapezoidal(1, 2, 3, 4, number_of_cuts=5),
+        FuzzyNumberFactory.triangular(1, 2, 3, number_of_cuts=4),
+    ]
+
+    assert fsum(fns) == fns[0] + fns[1] + fns[2] + fns[3]
+    assert fprod(fns) == fns[0] * fns[1] * fns[2] * fns[3]
+
+    result = fsum(fns, alphas=[0, "0.5", 1])
+
+    assert result.alpha_levels == [Decimal(0), Decimal("0.5"), Decimal(1)]
+    assert result == FuzzyNumberFactory.trapezoidal(5, 9, 10, 15, number_of_cuts=3)
+
+
+def test_numeric_precision():
+    with FuzzyMathPrecisionContext(numeric_precision=2):
+        fns = [FuzzyNumberFactory.triangular("0.50", "0.55", "0.60") for _ in range(3)]
+
+        result = fprod(fns)
+
+        assert result == reduce(operator.mul, fns)
+        assert result.kernel.min == Decimal("0.16")
+
+        assert fsum(fns) == reduce(operator.add, fns)
+
+
+def test_errors():
+    with pytest.raises(ValueError, match="Cannot reduce empty `iterable`"):
+        fsum([])
+
+    with pytest.raises(TypeError, match="must be `FuzzyNumber`"):
+        fprod([FuzzyNumberFactory.triangular(1, 2, 3), 1])
+
+    with pytest.raises(ValueError, match="must contain both 0 and 1"):
+        fsum([FuzzyNumberFactory.triangular(1, 2, 3)], alphas=[0, 0.5])
@@ -1,6 +1,17 @@
+import decimal
+import threading
 from decimal import Decimal
 
-from FuzzyMath import FuzzyMathPrecision, FuzzyMathPrecisionContext, FuzzyNumberFactory, IntervalFactory
+import pytest
+
+from FuzzyMath import (
+    FuzzyMathPrecision,
+    FuzzyMathPrecisionContext,
+    FuzzyNumberFactory,
+    FuzzyNumberFloatFactory,
+    IntervalFactory,
+    PrecisionSettings,
+)
 
 
 def to_decimal_precision(decimal_numbers: int) -> Decimal:
@@ -110,3 +121,150 @@ def test_fuzzy_number_precision():
         Decimal("0.83"),
         Decimal("1.00"),
     ]
+
+
+def test_outward_rounding():
+    a = FuzzyNumberFloatFactory.triangular(0.1, 0.2, 0.3)
+
+    with FuzzyMathPrecisionContext(outward_rounding=True):
+        assert FuzzyMathPrecision().outward_rounding
+
+        result = a + a
+
+        assert result.min < 0.1 + 0.1
+        assert not result.outward_rounding
+
+    assert not FuzzyMathPrecision().outward_rounding
+    assert (a + a).min == 0.1 + 0.1
+
+    FuzzyMathPrecision.set_outward_rounding()
+    assert FuzzyMathPrecision().outward_rounding
+
+    FuzzyMathPrecision.reset()
+    assert not FuzzyMathPrecision().outward_rounding
+
+
+def test_decimal_context():
+    interval = IntervalFactory.infimum_supremum(1, 2)
+
+    assert (interval / 3).min == Decimal(1) / Decimal(3)
+
+    with FuzzyMathPrecisionContext(significant_digits=5):
+        assert FuzzyMathPrecision.get_decimal_context().prec == 5
+
+        assert (interval / 3).min == Decimal("0.33333")
+        assert (interval / 3).max == Decimal("0.66667")
+        assert (interval * interval).max == 4
+
+        fn = FuzzyNumberFactory.triangular(1, 2, 3) / 7
+        assert fn.get_alpha_cut(0).min == Decimal("0.14286")
+        assert fn.get_alpha_cut("0.3").min == Decimal("0.18572")
+
+    assert FuzzyMathPrecision().decimal_context is None
+
+    with FuzzyMathPrecisionContext(significant_digits=3, rounding=decimal.ROUND_FLOOR):
+        assert (interval / 3).max == Decimal("0.666")
+
+    FuzzyMathPrecision.set_decimal_context(40)
+    assert len((interval / 3).min.as_tuple().digits) == 40
+    FuzzyMathPrecision.reset()
+
+    with pytest.raises(ValueError, match="`significant_digits` must be positive integer"):
+        FuzzyMathPrecision.set_decimal_context(0)
+
+    with pytest.raises(ValueError, match="`rounding` must be one of"):
+        FuzzyMathPrecision.set_decimal_context(5, "ROUND_SOMEHOW")
+
+
+def test_context_restores_previous_settings():
+    FuzzyMathPrecision.set_numeric_precision(3)
+    FuzzyMathPrecision.set_alpha_precision(2)
+
+    with FuzzyMathPrecisionContext(numeric_precision=5, alpha_precision=4):
+        assert FuzzyMathPrecision().numeric_precision == to_decimal_precision(5)
+        assert FuzzyMathPrecision().alpha_precision == to_decimal_precision(4)
+
+        with FuzzyMathPrecisionContext(alpha_precision=6):
+            assert FuzzyMathPrecision().numeric_precision == to_decimal_precision(5)
+            assert FuzzyMathPrecision().alpha_precision == to_decimal_precision(6)
+
+        assert FuzzyMathPrecision().alpha_precision == to_decimal_precision(4)
+
+    assert FuzzyMathPrecision().numeric_precision == to_decimal_precision(3)
+    assert FuzzyMathPrecision().alpha_precision == to_decimal_precision(2)
+
+    FuzzyMathPrecision.reset()
+
+    with FuzzyMathPrecisionContext(alpha_precision=4):
+        FuzzyMathPrecision.set_numeric_precision(2)
+
+    assert FuzzyMathPrecision().alpha_precision is None
+    assert FuzzyMathPrecision().numeric_precision is None
+
+
+def test_settings_are_context_local():
+    FuzzyMathPrecision.set_numeric_precision(1)
+
+    barrier = threading.Barrier(2)
+    results = {}
+
+    def work(decimal_places: int) -> None:
+        with FuzzyMathPrecisionContext(numeric_precision=decimal_places):
+            barrier.wait()
+            results[decimal_places] = IntervalFactory.infimum_supremum(1, 2) / 3
+            barrier.wait()
+
+    threads = [threading.Thread(target=work, args=(decimal_places,)) for decimal_places in (2, 4)]
+
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert (results[2].min, results[2].max) == (Decimal("0.33"), Decimal("0.67"))
+    assert (results[4].min, results[4].max) == (Decimal("0.3333"), Decimal("0.6667"))
+
+    assert FuzzyMathPrecision().numeric_precision == to_decimal_precision(1)
+
+    settings = FuzzyMathPrecision.current()
+
+    def read_settings() -> None:
+        results["thread"] = FuzzyMathPrecision.current()
+
+    thread = threading.Thread(target=read_settings)
+    thread.start()
+    thread.join()
+
+    assert results["thread"] == PrecisionSettings()
+
+    token = FuzzyMathPrecision.use(PrecisionSettings(alpha_precision=to_decimal_precision(3)))
+    assert FuzzyMathPrecision().numeric_precision is None
+    FuzzyMathPrecision.restore(token)
+
+    assert FuzzyMathPrecision.current() == settings
+
+    FuzzyMathPrecision.reset()
+
+
+def test_class_level_access():
+    assert FuzzyMathPrecision.numeric_precision is None
+    assert FuzzyMathPrecision.alpha_precision is None
+    assert FuzzyMathPrecision.outward_rounding is False
+    assert FuzzyMathPrecision.decimal_context is None
+
+    with FuzzyMathPrecisionContext(2, 3, outward_rounding=True):
+        assert FuzzyMathPrecision.numeric_precision == to_decimal_precision(2)
+        assert FuzzyMathPrecision.alpha_precision == to_decimal_precision(3)
+        assert FuzzyMathPrecision.outward_rounding is True
+        assert FuzzyMathPrecision().numeric_precision == to_decimal_precision(2)
+
+    try:
+        FuzzyMathPrecision.numeric_precision = to_decimal_precision(1)
+
+        assert FuzzyMathPrecision.current().numeric_precision == to_decimal_precision(1)
+        assert FuzzyMathPrecision().numeric_precision == to_decimal_precision(1)
+        assert IntervalFactory.two_values("1.26", "2") == IntervalFactory.two_values("1.3", "2")
+    finally:
+        FuzzyMathPrecision.reset()
+
+    assert FuzzyMathPrecision.numeric_precision is None
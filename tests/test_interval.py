@@ -1,6 +1,7 @@
 import math
 from decimal import Decimal, InvalidOperation
 
+import numpy as np
 import pytest
 
 from FuzzyMath.class_factories import IntervalFactory
@@ -206,3 +207,55 @@ def test_apply_function(i_a: Interval, i_b: Interval):
     assert float(i_b.apply_function(math.cos).max) == pytest.approx(0.28366, 0.00001)
 
     assert i_a.apply_function(math.pow, 2, number_elements=10) == IntervalFactory.two_values(1, 9)
+
+
+def test_from_ordered():
+    interval = Interval._from_ordered(Decimal("1.50"), Decimal("3.0"))
+
+    assert interval == IntervalFactory.two_values(1.5, 3)
+    assert repr(interval) == "[1.5, 3]"
+    assert interval.degenerate is False
+    assert Interval._from_ordered(Decimal(2), Decimal("2.0")).degenerate
+    assert Interval._from_ordered(Decimal("nan"), Decimal("nan")).is_empty
+
+
+def test_apply_function_vectorized(i_a: Interval, i_b: Interval):
+    interval = i_b.apply_function(np.cos)
+
+    assert interval == i_b.apply_function(lambda x: np.cos(x), vectorized=True)
+    assert float(interval.min) == pytest.approx(float(i_b.apply_function(math.cos).min))
+    assert float(interval.max) == pytest.approx(float(i_b.apply_function(math.cos).max))
+
+    assert i_a._sample_floats(False, 1000).tolist() == pytest.approx(
+        [float(x) for x in np.arange(i_a.min, i_a.max + Decimal(0.1) * (i_a.width / 1000), i_a.width / 1000)]
+    )
+    assert i_a.apply_function(np.power, 2, number_elements=10) == IntervalFactory.two_values(1, 9)
+    assert i_a.apply_function(np.exp, monotone=True) == IntervalFactory.two_values(math.exp(i_a.min), math.exp(i_a.max))
+
+
+def test_apply_function_binds_once(i_a: Interval):
+    def function(x, power, shift=0):
+        return x**power + shift
+
+    assert i_a.apply_function(function, 2, shift=1, number_elements=10) == IntervalFactory.two_values(2, 10)
+
+
+def test_apply_function_adaptive():
+    interval = IntervalFactory.infimum_supremum(0, 6)
+
+    calls = []
+
+    def function(x):
+        calls.append(x)
+        return math.sin(x)
+
+    result = interval.apply_function(function, tolerance=1e-10)
+
+    assert float(result.min) == pytest.approx(-1, abs=1e-9)
+    assert float(result.max) == pytest.approx(1, abs=1e-9)
+    assert len(calls) < 200
+
+    assert interval.apply_function(np.sin, tolerance=1e-10) == result
+
+    with pytest.raises(ValueError, match="`tolerance` must be positive number"):
+        interval.apply_function(math.sin, tolerance=0)
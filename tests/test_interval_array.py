@@ -0,0 +1,166 @@
+import numpy as np
+import pytest
+
+from FuzzyMath import Interval, IntervalArray, IntervalFactory
+
+
+@pytest.fixture
+def intervals():
+    return [
+        IntervalFactory.infimum_supremum(1, 3),
+        IntervalFactory.infimum_supremum(2, 5),
+        IntervalFactory.infimum_supremum(-2, 3),
+        IntervalFactory.infimum_supremum(-4, -1),
+    ]
+
+
+@pytest.fixture
+def ia(intervals) -> IntervalArray:
+    return IntervalArray.from_intervals(intervals)
+
+
+def test_creation(ia: IntervalArray, intervals):
+    assert len(ia) == 4
+    assert ia.shape == (4,)
+    assert ia.to_intervals() == intervals
+    assert ia[0] == intervals[0]
+    assert isinstance(ia[1:], IntervalArray)
+
+    swapped = IntervalArray([3, 5], [1, np.nan])
+
+    assert swapped.mins[0] == 1
+    assert swapped.maxs[0] == 3
+    assert swapped.is_empty.tolist() == [False, True]
+
+    with pytest.raises(ValueError, match="must be of same shape"):
+        IntervalArray([1, 2], [3])
+
+
+def test_arithmetic_matches_interval(ia: IntervalArray, intervals):
+    other = IntervalFactory.infimum_supremum(1, 2)
+    others = IntervalArray.from_intervals([other] * len(intervals))
+
+    for result, expected in [
+        (ia + others, [x + other for x in intervals]),
+        (ia - others, [x - other for x in intervals]),
+        (ia * others, [x * other for x in intervals]),
+        (ia / others, [x / other for x in intervals]),
+        (ia * other, [x * other for x in intervals]),
+        (ia + 2, [x + 2 for x in intervals]),
+        (3 - ia, [3 - x for x in intervals]),
+        (-2.5 * ia, [x * -2.5 for x in intervals]),
+        (ia**2, [x**2 for x in intervals]),
+        (ia**3, [x**3 for x in intervals]),
+        (-ia, [-x for x in intervals]),
+    ]:
+        assert result == IntervalArray.from_intervals(expected)
+
+
+def test_truediv(ia: IntervalArray):
+    assert ia.contains_zero().tolist() == [False, False, True, False]
+
+    with pytest.raises(ArithmeticError, match="Cannot divide by 0"):
+        ia / 0
+
+    with pytest.raises(ArithmeticError, match="Cannot divide by interval that contains `0`"):
+        ia / ia
+
+    with pytest.raises(ArithmeticError, match="Cannot divide by interval that contains `0`"):
+        1 / ia
+
+    assert (1 / ia[[0, 1, 3]]) == IntervalArray.from_intervals(
+        [1 / IntervalFactory.infimum_supremum(1, 3), 1 / IntervalFactory.infimum_supremum(2, 5), 1 / Interval(-4, -1)]
+    )
+
+
+def test_predicates(ia: IntervalArray):
+    assert ia.is_negative().tolist() == [False, False, False, True]
+    assert ia.is_not_positive().tolist() == [False, False, False, True]
+    assert ia.is_positive().tolist() == [True, True, False, False]
+    assert ia.is_not_negative().tolist() == [True, True, False, False]
+    assert ia.is_more_positive().tolist() == [True, True, True, False]
+    assert ia.degenerate.tolist() == [False, False, False, False]
+    assert ia.width.tolist() == [2, 3, 5, 3]
+
+    assert ia.contains(2.5).tolist() == [True, True, True, False]
+    assert 2.5 not in ia
+    assert -1 in ia[2:]
+    assert IntervalFactory.infimum_supremum(2, 3) in ia[:3]
+
+    with pytest.raises(TypeError, match="Cannot test if object of type"):
+        "a" in ia
+
+
+def test_intersection(ia: IntervalArray):
+    other = IntervalFactory.infimum_supremum(0, 2)
+
+    assert ia.intersects(other).tolist() == [True, True, True, False]
+    assert ia[:3].intersection(other) == IntervalArray([1, 2, 0], [2, 2, 2])
+    assert ia.union_hull(other) == IntervalArray([0, 0, -2, -4], [3, 5, 3, 2])
+
+    with pytest.raises(ArithmeticError, match="do not intersect"):
+        ia.intersection(other)
+
+
+def test_broadcasting():
+    block = IntervalArray(np.zeros((3, 4)), np.ones((3, 4)))
+
+    result = block + IntervalArray(np.arange(4.0), np.arange(4.0) + 1)
+
+    assert result.shape == (3, 4)
+    assert result.maxs[:, 3].tolist() == [5, 5, 5]
+
+    result = block * np.array([[1.0], [2.0], [-1.0]])
+
+    assert result.mins[:, 0].tolist() == [0, 0, -1]
+
+
+def test_outward_rounding():
+    a = IntervalArray([0.1, 1.0], [0.2, 3.0], outward_rounding=True)
+    b = IntervalArray([0.2, 2.0], [0.3, 4.0])
+
+    for result, plain in (
+        (a + b, IntervalArray(a.mins, a.maxs) + b),
+        (b + a, b + IntervalArray(a.mins, a.maxs)),
+        (a - b, IntervalArray(a.mins, a.maxs) - b),
+        (a * b, IntervalArray(a.mins, a.maxs) * b),
+        (a / b, IntervalArray(a.mins, a.maxs) / b),
+        (1 - a, 1 - IntervalArray(a.mins, a.maxs)),
+    ):
+        assert result.outward_rounding
+        assert np.all(result.mins < plain.mins)
+        assert np.all(plain.maxs < result.maxs)
+
+    result = a + b
+
+    assert result.mins[0] < 0.1 + 0.2
+    assert result.maxs[0] > 0.2 + 0.3
+    assert result.mins[1] == np.nextafter(3.0, -np.inf)
+    assert result.maxs[1] == np.nextafter(7.0, np.inf)
+
+    exact = IntervalFactory.infimum_supremum("0.1", "0.2") + IntervalFactory.infimum_supremum("0.2", "0.3")
+    assert result[0].min <= exact.min
+    assert exact.max <= result[0].max
+
+    assert not (b + b).outward_rounding
+    assert (b + b).mins[0] == 0.2 + 0.2
+
+    assert (-a).outward_rounding
+
+
+def test_outward_rounding_conversion():
+    interval = IntervalFactory.infimum_supremum("0.1", "0.3")
+
+    ia = IntervalArray.from_intervals([interval], outward_rounding=True)
+
+    assert ia.outward_rounding
+    assert ia.mins[0] <= interval.min
+    assert interval.max <= ia.maxs[0]
+
+    converted = ia.to_intervals()[0]
+
+    assert converted.min <= interval.min
+    assert interval.max <= converted.max
+
+    ia = IntervalArray([0.1], [0.1], outward_rounding=True) + 0.0
+    assert ia[0].min < ia[0].max
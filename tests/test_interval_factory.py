@@ -68,3 +68,26 @@ def test_creation():
     assert isinstance(interval, Interval)
     assert interval.min == Decimal("0.1")
     assert interval.max == Decimal("0.3")
+
+
+def test_parse_infinity():
+    for interval in [Interval(float("-inf"), 3), Interval(1, float("inf")), Interval(float("-inf"), float("inf"))]:
+        assert IntervalFactory.parse_string(repr(interval)) == interval
+
+
+def test_parse_many():
+    intervals = [
+        IntervalFactory.infimum_supremum(-1.5, 2),
+        IntervalFactory.infimum_supremum("-1E+3", "2.5e-3"),
+        IntervalFactory.empty(),
+    ]
+
+    errors: list = []
+
+    lines = [repr(interval) for interval in intervals] + ["[1, a]"]
+
+    results = list(IntervalFactory.parse_many(lines, errors=errors))
+
+    assert results[:2] == intervals[:2]
+    assert results[2].is_empty
+    assert [error[0] for error in errors] == [4]
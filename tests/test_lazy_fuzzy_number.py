@@ -0,0 +1,86 @@
+import pytest
+
+from FuzzyMath.class_factories import FuzzyNumberFactory
+from FuzzyMath.class_fuzzy_number import FuzzyNumber
+from FuzzyMath.class_lazy_fuzzy_number import LazyFuzzyNumber
+
+
+@pytest.fixture
+def fns():
+    return (
+        FuzzyNumberFactory.triangular(1, 2, 3, number_of_cuts=11),
+        FuzzyNumberFactory.trapezoidal(2, 3, 4, 5, number_of_cuts=11),
+        FuzzyNumberFactory.triangular(-1, 0, 1, number_of_cuts=11),
+        FuzzyNumberFactory.triangular(4, 5, 7, number_of_cuts=11),
+    )
+
+
+def test_creation():
+    fn = FuzzyNumberFactory.triangular(1, 2, 3)
+
+    lazy = LazyFuzzyNumber(fn)
+
+    assert lazy.evaluate() is fn
+
+    with pytest.raises(TypeError, match="must be `FuzzyNumber`"):
+        LazyFuzzyNumber(1)
+
+
+def test_expression(fns):
+    a, b, c, d = fns
+
+    lazy = (LazyFuzzyNumber(a) * b + c) / d
+
+    assert isinstance(lazy, LazyFuzzyNumber)
+    assert lazy.evaluate() == (a * b + c) / d
+    assert lazy.evaluate() is lazy.evaluate()
+
+    assert (2 - LazyFuzzyNumber(a) * 3).evaluate() == 2 - a * 3
+    assert (1 / LazyFuzzyNumber(d) + c).evaluate() == 1 / d + c
+    assert (b - LazyFuzzyNumber(a)).evaluate() == b - a
+    assert (b / LazyFuzzyNumber(d)).evaluate() == b / d
+    assert (LazyFuzzyNumber(c) ** 2).evaluate() == c**2
+    assert (-LazyFuzzyNumber(a)).evaluate() == a * -1
+
+
+def test_chain_and_shared_nodes(fns):
+    a, b, _, _ = fns
+
+    result = LazyFuzzyNumber(a)
+    expected = a
+
+    for _ in range(2000):
+        result = result + b
+        expected = expected + b
+
+    assert result.evaluate() == expected
+
+    shared = LazyFuzzyNumber(a) + b
+    assert (shared * shared).evaluate() == (a + b) * (a + b)
+
+
+def test_different_alphas():
+    a = FuzzyNumberFactory.triangular(1, 2, 3, number_of_cuts=3)
+    b = FuzzyNumberFactory.triangular(1, 2, 3, number_of_cuts=5)
+
+    result = (LazyFuzzyNumber(a) + b).evaluate()
+
+    assert isinstance(result, FuzzyNumber)
+    assert result.alpha_levels is b.alpha_levels
+    assert result == a + b
+
+
+def test_errors(fns):
+    a, _, c, _ = fns
+
+    with pytest.raises(ArithmeticError, match="Cannot divide by 0"):
+        LazyFuzzyNumber(a) / 0
+
+    with pytest.raises(ArithmeticError, match="Cannot divide by FuzzyNumber that contains 0"):
+        (LazyFuzzyNumber(a) / c).evaluate()
+
+    with pytest.raises(ArithmeticError, match="Cannot divide by FuzzyNumber that contains 0"):
+        (1 / LazyFuzzyNumber(c)).evaluate()
+
+    with pytest.raises(TypeError):
+        LazyFuzzyNumber(a) + "a"
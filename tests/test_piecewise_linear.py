@@ -0,0 +1,101 @@
+import threading
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from FuzzyMath import FuzzyMathPrecisionContext, FuzzyNumber, IntervalFactory, PiecewiseLinear
+
+
+@pytest.fixture
+def fn_nonlinear() -> FuzzyNumber:
+    return FuzzyNumber(
+        [0, "0.3", "0.6", 1],
+        [
+            IntervalFactory.infimum_supremum(0, 10),
+            IntervalFactory.infimum_supremum(2, 8),
+            IntervalFactory.infimum_supremum(2, 5),
+            IntervalFactory.infimum_supremum(4, 5),
+        ],
+    )
+
+
+def test_breakpoints(fn_nonlinear: FuzzyNumber):
+    piecewise_linear = fn_nonlinear.piecewise_linear
+
+    assert isinstance(piecewise_linear, PiecewiseLinear)
+    assert piecewise_linear is fn_nonlinear.piecewise_linear
+
+    assert piecewise_linear.alphas is fn_nonlinear.alpha_levels
+    assert piecewise_linear.mins == [0, 2, 2, 4]
+    assert piecewise_linear.maxs == [10, 8, 5, 5]
+    assert piecewise_linear.slopes_min[0] == Decimal(2) / Decimal("0.3")
+    assert piecewise_linear.slopes_min[1:] == [0, 5]
+    assert piecewise_linear.slopes_max[1:] == [-10, 0]
+
+
+def test_values(fn_nonlinear: FuzzyNumber):
+    piecewise_linear = fn_nonlinear.piecewise_linear
+
+    for alpha, alpha_cut in zip(fn_nonlinear.alpha_levels, fn_nonlinear.alpha_cuts):
+        assert piecewise_linear.minimum(alpha) == alpha_cut.min
+        assert piecewise_linear.maximum(alpha) == alpha_cut.max
+
+    assert piecewise_linear.minimum(Decimal("0.8")) == 3
+    assert piecewise_linear.maximum(Decimal("0.45")) == Decimal("6.5")
+    assert piecewise_linear.bounds(Decimal("0.8")) == (3, 5)
+
+    assert fn_nonlinear.get_alpha_cut("0.8") == IntervalFactory.infimum_supremum(3, 5)
+
+
+def test_membership(fn_nonlinear: FuzzyNumber):
+    piecewise_linear = fn_nonlinear.piecewise_linear
+
+    assert piecewise_linear.membership(Decimal(-1)) == 0
+    assert piecewise_linear.membership(Decimal(2)) == Decimal("0.6")
+    assert piecewise_linear.membership(Decimal(3)) == Decimal("0.8")
+    assert piecewise_linear.membership(Decimal("4.5")) == 1
+    assert piecewise_linear.membership(Decimal("6.5")) == Decimal("0.45")
+    assert piecewise_linear.membership(Decimal(11)) == 0
+
+    values = np.array([-1, 2, 3, 4.5, 6.5, 11])
+
+    assert np.allclose(piecewise_linear.memberships(values), [0, 0.6, 0.8, 1, 0.45, 0])
+
+
+def test_decimal_context(fn_nonlinear: FuzzyNumber):
+    slope = fn_nonlinear.piecewise_linear.slopes_min[0]
+
+    with FuzzyMathPrecisionContext(significant_digits=5):
+        assert fn_nonlinear.piecewise_linear.slopes_min[0] == Decimal("6.6667")
+
+    assert fn_nonlinear.piecewise_linear.slopes_min[0] == slope
+    assert slope == Decimal("6.666666666666666666666666667")
+
+
+def test_threads(fn_nonlinear: FuzzyNumber, monkeypatch):
+    expected = {alpha: fn_nonlinear.get_alpha_cut(Decimal(alpha) / 1000) for alpha in range(1000)}
+
+    monkeypatch.setattr(FuzzyNumber, "_alpha_cut_cache_size", 8)
+
+    fn = FuzzyNumber(fn_nonlinear.alpha_levels, fn_nonlinear.alpha_cuts)
+
+    errors = []
+
+    def work(offset: int):
+        try:
+            for i in range(2000):
+                alpha = (i * 7 + offset) % 1000
+                assert fn.get_alpha_cut(Decimal(alpha) / 1000) == expected[alpha]
+                assert isinstance(fn.piecewise_linear, PiecewiseLinear)
+        except Exception as error:  # pylint: disable=W0703
+            errors.append(error)
+
+    threads = [threading.Thread(target=work, args=(offset,)) for offset in range(8)]
+
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors